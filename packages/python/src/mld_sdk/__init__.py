@@ -2,55 +2,235 @@
 MLD Plugin SDK
 
 SDK for building analysis plugins that integrate with the MLD platform.
+
+Public names are imported lazily on first access, so ``import mld_sdk`` does
+not pull in optional dependencies (SQLModel/SQLAlchemy, NumPy, FastAPI) that a
+plugin may never use. ``from mld_sdk import X`` works exactly as before.
 """
 
-from mld_sdk.plugin import (
-    AnalysisPlugin,
-    HealthStatus,
-    PluginHealth,
-    LifecycleHookResult,
-)
-from mld_sdk.models import PluginMetadata, PluginCapabilities, PluginType
-from mld_sdk.context import PlatformContext
-
-# Exceptions
-from mld_sdk.exceptions import (
-    PluginException,
-    ValidationException,
-    PermissionException,
-    ConfigurationException,
-    RepositoryException,
-    NotFoundException,
-    ConflictException,
-    PluginLifecycleException,
-)
-
-# Local database (optional dependency)
-from mld_sdk.local_database import LocalDatabase, LocalDatabaseConfig
-
-# Repository protocols and data models
-from mld_sdk.repositories import (
-    # Data models
-    Experiment,
-    DesignData,
-    PluginExperimentData,  # backward compatibility alias for DesignData
-    PluginAnalysisResult,
-    User,
-    UserPluginRole,
-    # Repository protocols
-    ExperimentRepository,
-    PluginDataRepository,
-    PluginRoleRepository,
-    UserRepository,
-    PlatformConfig,
-)
+import importlib
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from mld_sdk.plugin import (
+        AnalysisPlugin,
+        HealthStatus,
+        PluginHealth,
+        LifecycleHookResult,
+    )
+    from mld_sdk.models import PluginMetadata, PluginCapabilities, PluginType
+    from mld_sdk.context import PlatformContext
+
+    # Exceptions
+    from mld_sdk.exceptions import (
+        PluginException,
+        ValidationException,
+        PermissionException,
+        ConfigurationException,
+        RepositoryException,
+        NotFoundException,
+        ConflictException,
+        PluginLifecycleException,
+    )
+
+    # Local database (optional dependency)
+    from mld_sdk.local_database import LocalDatabase, LocalDatabaseConfig
+
+    # Repository protocols and data models
+    from mld_sdk.repositories import (
+        # Data models
+        Experiment,
+        DesignData,
+        PluginExperimentData,  # backward compatibility alias for DesignData
+        PluginAnalysisResult,
+        User,
+        UserPluginRole,
+        # Repository protocols
+        ExperimentRepository,
+        PluginDataRepository,
+        PluginRoleRepository,
+        UserRepository,
+        # Optional repository capabilities
+        ExperimentBatchRepository,
+        ExperimentKeysetRepository,
+        AnalysisResultBatchRepository,
+        PluginDataPatchRepository,
+        UserBatchRepository,
+        PlatformConfig,
+    )
+
+    # Repository helpers
+    from mld_sdk.batching import (
+        BatchedExperimentRepository,
+        BatchedUserRepository,
+        BatchLoader,
+        get_many_analysis_results,
+        get_many_experiments,
+        get_many_users,
+    )
+    from mld_sdk.blobs import (
+        BlobOffloadingRepository,
+        BlobRef,
+        BlobStore,
+        LocalBlobStore,
+        offload_blobs,
+        resolve_blobs,
+    )
+    from mld_sdk.caching import (
+        CachedExperimentRepository,
+        CachedPluginRoleRepository,
+        CachedUserRepository,
+        RepositoryCache,
+    )
+    from mld_sdk.codec import CodecRepository, negotiate_codec
+    from mld_sdk.health import HealthAggregator, HealthSample, HealthStats
+    from mld_sdk.hooks import HookDispatcher, HookDispatchResult, HookOutcome
+    from mld_sdk.host import LazyPluginMiddleware, PluginHost, PluginStartup
+    from mld_sdk.manifest import metadata_from_manifest, write_plugin_manifest
+    from mld_sdk.pagination import iter_experiments
+    from mld_sdk.patching import (
+        apply_json_patch,
+        apply_merge_patch,
+        apply_patch,
+        diff_json_patch,
+        diff_merge_patch,
+        patch_analysis_result,
+        patch_experiment_data,
+    )
+    from mld_sdk.projection import (
+        get_analysis_result,
+        get_analysis_results,
+        get_experiment_data,
+        project_fields,
+    )
+    from mld_sdk.singleflight import SingleFlight, single_flight
+
+# Public name -> defining module, resolved by __getattr__ on first access
+_LAZY_IMPORTS: dict[str, str] = {
+    # mld_sdk.plugin
+    "AnalysisPlugin": "mld_sdk.plugin",
+    "HealthStatus": "mld_sdk.plugin",
+    "PluginHealth": "mld_sdk.plugin",
+    "LifecycleHookResult": "mld_sdk.plugin",
+    # mld_sdk.models
+    "PluginMetadata": "mld_sdk.models",
+    "PluginCapabilities": "mld_sdk.models",
+    "PluginType": "mld_sdk.models",
+    # mld_sdk.context
+    "PlatformContext": "mld_sdk.context",
+    # mld_sdk.exceptions
+    "PluginException": "mld_sdk.exceptions",
+    "ValidationException": "mld_sdk.exceptions",
+    "PermissionException": "mld_sdk.exceptions",
+    "ConfigurationException": "mld_sdk.exceptions",
+    "RepositoryException": "mld_sdk.exceptions",
+    "NotFoundException": "mld_sdk.exceptions",
+    "ConflictException": "mld_sdk.exceptions",
+    "PluginLifecycleException": "mld_sdk.exceptions",
+    # mld_sdk.local_database
+    "LocalDatabase": "mld_sdk.local_database",
+    "LocalDatabaseConfig": "mld_sdk.local_database",
+    # mld_sdk.repositories
+    "Experiment": "mld_sdk.repositories",
+    "DesignData": "mld_sdk.repositories",
+    "PluginExperimentData": "mld_sdk.repositories",
+    "PluginAnalysisResult": "mld_sdk.repositories",
+    "User": "mld_sdk.repositories",
+    "UserPluginRole": "mld_sdk.repositories",
+    "ExperimentRepository": "mld_sdk.repositories",
+    "PluginDataRepository": "mld_sdk.repositories",
+    "PluginRoleRepository": "mld_sdk.repositories",
+    "UserRepository": "mld_sdk.repositories",
+    "ExperimentBatchRepository": "mld_sdk.repositories",
+    "ExperimentKeysetRepository": "mld_sdk.repositories",
+    "AnalysisResultBatchRepository": "mld_sdk.repositories",
+    "PluginDataPatchRepository": "mld_sdk.repositories",
+    "UserBatchRepository": "mld_sdk.repositories",
+    "PlatformConfig": "mld_sdk.repositories",
+    # mld_sdk.batching
+    "BatchedExperimentRepository": "mld_sdk.batching",
+    "BatchedUserRepository": "mld_sdk.batching",
+    "BatchLoader": "mld_sdk.batching",
+    "get_many_analysis_results": "mld_sdk.batching",
+    "get_many_experiments": "mld_sdk.batching",
+    "get_many_users": "mld_sdk.batching",
+    # mld_sdk.blobs
+    "BlobOffloadingRepository": "mld_sdk.blobs",
+    "BlobRef": "mld_sdk.blobs",
+    "BlobStore": "mld_sdk.blobs",
+    "LocalBlobStore": "mld_sdk.blobs",
+    "offload_blobs": "mld_sdk.blobs",
+    "resolve_blobs": "mld_sdk.blobs",
+    # mld_sdk.caching
+    "CachedExperimentRepository": "mld_sdk.caching",
+    "CachedPluginRoleRepository": "mld_sdk.caching",
+    "CachedUserRepository": "mld_sdk.caching",
+    "RepositoryCache": "mld_sdk.caching",
+    # mld_sdk.codec
+    "CodecRepository": "mld_sdk.codec",
+    "negotiate_codec": "mld_sdk.codec",
+    # mld_sdk.health
+    "HealthAggregator": "mld_sdk.health",
+    "HealthSample": "mld_sdk.health",
+    "HealthStats": "mld_sdk.health",
+    # mld_sdk.hooks
+    "HookDispatcher": "mld_sdk.hooks",
+    "HookDispatchResult": "mld_sdk.hooks",
+    "HookOutcome": "mld_sdk.hooks",
+    # mld_sdk.host
+    "LazyPluginMiddleware": "mld_sdk.host",
+    "PluginHost": "mld_sdk.host",
+    "PluginStartup": "mld_sdk.host",
+    # mld_sdk.manifest
+    "metadata_from_manifest": "mld_sdk.manifest",
+    "write_plugin_manifest": "mld_sdk.manifest",
+    # mld_sdk.pagination
+    "iter_experiments": "mld_sdk.pagination",
+    # mld_sdk.patching
+    "apply_json_patch": "mld_sdk.patching",
+    "apply_merge_patch": "mld_sdk.patching",
+    "apply_patch": "mld_sdk.patching",
+    "diff_json_patch": "mld_sdk.patching",
+    "diff_merge_patch": "mld_sdk.patching",
+    "patch_analysis_result": "mld_sdk.patching",
+    "patch_experiment_data": "mld_sdk.patching",
+    # mld_sdk.projection
+    "get_analysis_result": "mld_sdk.projection",
+    "get_analysis_results": "mld_sdk.projection",
+    "get_experiment_data": "mld_sdk.projection",
+    "project_fields": "mld_sdk.projection",
+    # mld_sdk.singleflight
+    "SingleFlight": "mld_sdk.singleflight",
+    "single_flight": "mld_sdk.singleflight",
+}
+
+
+def __getattr__(name: str) -> Any:
+    if name == "__version__":
+        try:
+            from importlib.metadata import version as _get_version
+
+            value = _get_version("mld-sdk")
+        except Exception:
+            value = "0.0.0"
+    elif name in _LAZY_IMPORTS:
+        value = getattr(importlib.import_module(_LAZY_IMPORTS[name]), name)
+    else:
+        # Submodules (``mld_sdk.local_database``) used to be loaded eagerly
+        if not name.startswith("__"):
+            try:
+                return importlib.import_module(f"{__name__}.{name}")
+            except ModuleNotFoundError as e:
+                if e.name != f"{__name__}.{name}":
+                    raise
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    globals()[name] = value
+    return value
+
 
-try:
-    from importlib.metadata import version as _get_version
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | set(__all__) | {"__version__"})
 
-    __version__ = _get_version("mld-sdk")
-except Exception:
-    __version__ = "0.0.0"
 
 __all__ = [
     # Core plugin classes
@@ -87,5 +267,55 @@ __all__ = [
     "PluginDataRepository",
     "PluginRoleRepository",
     "UserRepository",
+    "ExperimentBatchRepository",
+    "ExperimentKeysetRepository",
+    "AnalysisResultBatchRepository",
+    "PluginDataPatchRepository",
+    "UserBatchRepository",
     "PlatformConfig",
+    # Repository helpers
+    "iter_experiments",
+    "get_many_experiments",
+    "get_many_users",
+    "get_many_analysis_results",
+    "BatchLoader",
+    "BatchedExperimentRepository",
+    "BatchedUserRepository",
+    "RepositoryCache",
+    "CachedExperimentRepository",
+    "CachedUserRepository",
+    "CachedPluginRoleRepository",
+    "SingleFlight",
+    "single_flight",
+    "diff_merge_patch",
+    "diff_json_patch",
+    "apply_merge_patch",
+    "apply_json_patch",
+    "apply_patch",
+    "patch_analysis_result",
+    "patch_experiment_data",
+    "project_fields",
+    "get_analysis_result",
+    "get_analysis_results",
+    "get_experiment_data",
+    "BlobStore",
+    "LocalBlobStore",
+    "BlobRef",
+    "BlobOffloadingRepository",
+    "offload_blobs",
+    "resolve_blobs",
+    "CodecRepository",
+    "negotiate_codec",
+    # Plugin hosting
+    "PluginHost",
+    "PluginStartup",
+    "LazyPluginMiddleware",
+    "write_plugin_manifest",
+    "metadata_from_manifest",
+    "HookDispatcher",
+    "HookDispatchResult",
+    "HookOutcome",
+    "HealthAggregator",
+    "HealthSample",
+    "HealthStats",
 ]
@@ -0,0 +1,95 @@
+"""
+Bounded in-process cache with LRU eviction and optional per-entry TTL.
+
+Shared by the SDK's caching layers (local key-value store, repository
+caches). Thread-safe, so it can be used from FastAPI's sync threadpool.
+"""
+
+from __future__ import annotations
+
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Generic, Hashable, TypeVar
+
+K = TypeVar("K", bound=Hashable)
+V = TypeVar("V")
+
+_MISSING = object()
+
+
+class TTLCache(Generic[K, V]):
+    """LRU cache holding at most ``maxsize`` entries.
+
+    Entries expire ``ttl`` seconds after being set (None = never). A
+    ``maxsize`` of 0 disables caching entirely.
+    """
+
+    def __init__(
+        self,
+        maxsize: int = 1024,
+        ttl: float | None = None,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._clock = clock
+        self._data: OrderedDict[K, tuple[V, float | None]] = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    def __contains__(self, key: object) -> bool:
+        return self.get(key, _MISSING, count=False) is not _MISSING  # type: ignore[arg-type]
+
+    def get(self, key: K, default: Any = None, count: bool = True) -> V | Any:
+        """Return the cached value for ``key``, or ``default`` if absent/expired."""
+        with self._lock:
+            entry = self._data.get(key, _MISSING)
+            if entry is not _MISSING:
+                value, expires_at = entry  # type: ignore[misc]
+                if expires_at is None or expires_at > self._clock():
+                    self._data.move_to_end(key)
+                    if count:
+                        self.hits += 1
+                    return value
+                del self._data[key]
+            if count:
+                self.misses += 1
+            return default
+
+    def set(self, key: K, value: V, ttl: float | None = _MISSING) -> None:  # type: ignore[assignment]
+        """Cache ``value``; ``ttl`` overrides the cache-wide TTL for this entry."""
+        if self.maxsize <= 0:
+            return
+        ttl = self.ttl if ttl is _MISSING else ttl
+        expires_at = None if ttl is None else self._clock() + ttl
+        with self._lock:
+            self._data[key] = (value, expires_at)
+            self._data.move_to_end(key)
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+
+    def pop(self, key: K) -> None:
+        """Remove ``key`` if present."""
+        with self._lock:
+            self._data.pop(key, None)
+
+    def discard_where(self, predicate: Callable[[K], bool]) -> int:
+        """Remove every entry whose key matches ``predicate``; return the count."""
+        with self._lock:
+            doomed = [key for key in self._data if predicate(key)]
+            for key in doomed:
+                del self._data[key]
+            return len(doomed)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._data.clear()
+
+    def stats(self) -> dict[str, int]:
+        """Hit/miss counters and current size."""
+        return {"hits": self.hits, "misses": self.misses, "size": len(self._data)}
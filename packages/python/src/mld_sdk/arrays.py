@@ -0,0 +1,183 @@
+"""
+Compact binary storage for numeric arrays in plugin tables.
+
+Spectra, chromatograms and plate-reader traces are stored as a small header
+(dtype + shape) followed by the raw array bytes, optionally zlib-compressed.
+Decoding returns a NumPy array when NumPy is installed, otherwise a
+``memoryview``; for uncompressed blobs both are zero-copy views of the
+stored bytes.
+
+Usage with SQLModel::
+
+    from sqlmodel import Column, Field, SQLModel
+    from mld_sdk.arrays import ArrayType
+
+    class Spectrum(SQLModel, table=True):
+        id: int | None = Field(default=None, primary_key=True)
+        intensities: Any = Field(sa_column=Column(ArrayType(compress=True)))
+
+``ArrayType`` requires SQLAlchemy (``pip install mld-sdk[local-db]``);
+``encode_array`` / ``decode_array`` only need the standard library.
+"""
+
+from __future__ import annotations
+
+import array
+import struct
+import sys
+import zlib
+from typing import Any
+
+from mld_sdk.exceptions import ValidationException
+
+_NUMPY_AVAILABLE = False
+try:
+    import numpy as np
+
+    _NUMPY_AVAILABLE = True
+except ImportError:
+    pass
+
+_MAGIC = b"MLDA"
+_VERSION = 1
+_FLAG_ZLIB = 0x01
+_HEADER = struct.Struct("<4sBBBB")  # magic, version, flags, ndim, dtype length
+
+_ENDIAN = "<" if sys.byteorder == "little" else ">"
+# struct format character <-> NumPy dtype string (native byte order)
+_FORMAT_TO_DTYPE: dict[str, str] = {
+    "?": "|b1",
+    "b": "|i1",
+    "B": "|u1",
+    "h": f"{_ENDIAN}i2",
+    "H": f"{_ENDIAN}u2",
+    "i": f"{_ENDIAN}i4",
+    "I": f"{_ENDIAN}u4",
+    "l": f"{_ENDIAN}i{struct.calcsize('l')}",
+    "L": f"{_ENDIAN}u{struct.calcsize('L')}",
+    "q": f"{_ENDIAN}i8",
+    "Q": f"{_ENDIAN}u8",
+    "f": f"{_ENDIAN}f4",
+    "d": f"{_ENDIAN}f8",
+}
+_DTYPE_TO_FORMAT: dict[str, str] = {}
+for _fmt, _dtype in _FORMAT_TO_DTYPE.items():
+    _DTYPE_TO_FORMAT.setdefault(_dtype, _fmt)
+
+
+def _as_buffer(value: Any) -> tuple[memoryview, str, tuple[int, ...]]:
+    """Return (contiguous byte view, dtype string, shape) for ``value``."""
+    if _NUMPY_AVAILABLE and isinstance(value, np.ndarray):
+        value = np.ascontiguousarray(value)
+        return memoryview(value).cast("B"), value.dtype.str, value.shape
+    if isinstance(value, (list, tuple)):
+        value = array.array("d", value)
+    try:
+        view = memoryview(value)
+    except TypeError as e:
+        raise ValidationException(
+            f"Cannot store {type(value).__name__} as an array",
+            field="value",
+        ) from e
+    fmt = view.format.lstrip("@=")
+    if fmt not in _FORMAT_TO_DTYPE:
+        raise ValidationException(
+            f"Unsupported array element format '{view.format}'",
+            field="value",
+        )
+    if not view.c_contiguous:
+        view = memoryview(view.tobytes()).cast(fmt, view.shape)
+    return view.cast("B"), _FORMAT_TO_DTYPE[fmt], view.shape
+
+
+def encode_array(value: Any, compress: bool = False, level: int = 6) -> bytes:
+    """Serialize a NumPy array, ``array.array``, buffer or list of floats.
+
+    Lists and tuples are stored as float64.
+    """
+    data, dtype, shape = _as_buffer(value)
+    dtype_bytes = dtype.encode("ascii")
+    payload: bytes | memoryview = data
+    flags = 0
+    if compress:
+        payload = zlib.compress(data, level)
+        flags |= _FLAG_ZLIB
+    return b"".join(
+        (
+            _HEADER.pack(_MAGIC, _VERSION, flags, len(shape), len(dtype_bytes)),
+            dtype_bytes,
+            struct.pack(f"<{len(shape)}Q", *shape),
+            payload,
+        )
+    )
+
+
+def decode_array(blob: bytes | memoryview) -> Any:
+    """Deserialize a blob produced by ``encode_array``.
+
+    Returns a read-only NumPy array if NumPy is installed, otherwise a
+    ``memoryview`` with the stored format and shape.
+    """
+    blob = memoryview(blob)
+    try:
+        magic, version, flags, ndim, dtype_len = _HEADER.unpack_from(blob)
+    except struct.error as e:
+        raise ValidationException("Array blob is truncated") from e
+    if magic != _MAGIC or version != _VERSION:
+        raise ValidationException("Not an MLD array blob (bad magic or version)")
+
+    offset = _HEADER.size
+    dtype = bytes(blob[offset : offset + dtype_len]).decode("ascii")
+    offset += dtype_len
+    shape = struct.unpack_from(f"<{ndim}Q", blob, offset)
+    offset += 8 * ndim
+    data: bytes | memoryview = blob[offset:]
+    if flags & _FLAG_ZLIB:
+        data = zlib.decompress(data)
+
+    if _NUMPY_AVAILABLE:
+        return np.frombuffer(data, dtype=np.dtype(dtype)).reshape(shape)
+    if dtype not in _DTYPE_TO_FORMAT:
+        raise ValidationException(
+            f"Array dtype '{dtype}' requires NumPy to decode",
+            field="dtype",
+        )
+    return memoryview(data).cast(_DTYPE_TO_FORMAT[dtype], shape)
+
+
+_SQLALCHEMY_AVAILABLE = False
+try:
+    from sqlalchemy.types import LargeBinary, TypeDecorator
+
+    _SQLALCHEMY_AVAILABLE = True
+except ImportError:
+    pass
+
+
+if _SQLALCHEMY_AVAILABLE:
+
+    class ArrayType(TypeDecorator):
+        """SQLAlchemy column type storing arrays via ``encode_array``.
+
+        Args:
+            compress: zlib-compress the array bytes.
+            level: zlib compression level.
+        """
+
+        impl = LargeBinary
+        cache_ok = True
+
+        def __init__(self, compress: bool = False, level: int = 6):
+            super().__init__()
+            self.compress = compress
+            self.level = level
+
+        def process_bind_param(self, value: Any, dialect: Any) -> bytes | None:
+            if value is None:
+                return None
+            return encode_array(value, compress=self.compress, level=self.level)
+
+        def process_result_value(self, value: Any, dialect: Any) -> Any:
+            if value is None:
+                return None
+            return decode_array(value)
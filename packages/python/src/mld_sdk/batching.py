@@ -0,0 +1,266 @@
+"""
+Batched repository access.
+
+The ``get_many_*`` helpers call a repository's native batch method when the
+platform implements it, and otherwise fan out to the single-item method with
+bounded concurrency, so plugin code can always fetch N entities with one
+call.
+
+``BatchLoader`` and the ``Batched*Repository`` wrappers go one step further:
+every ``get_by_id`` issued in the same event-loop tick is coalesced into one
+batched fetch, and results are memoized for the wrapper's lifetime. Create a
+wrapper per request so plugin code can call ``get_by_id`` in loops and
+nested helpers without N+1 queries.
+
+Usage:
+    from mld_sdk.batching import BatchedExperimentRepository, get_many_experiments
+
+    experiments = await get_many_experiments(repo, [1, 2, 3])
+
+    @router.get("/dashboard")
+    async def dashboard():
+        repo = BatchedExperimentRepository(context.get_experiment_repository())
+        parents = await asyncio.gather(*(repo.get_by_id(i) for i in ids))  # 1 query
+"""
+
+import asyncio
+from typing import (
+    Any,
+    Awaitable,
+    Callable,
+    Generic,
+    Hashable,
+    Iterable,
+    Mapping,
+    Optional,
+    TypeVar,
+)
+
+from mld_sdk.repositories import (
+    Experiment,
+    ExperimentRepository,
+    PluginAnalysisResult,
+    PluginDataRepository,
+    User,
+    UserRepository,
+)
+
+K = TypeVar("K", bound=Hashable)
+V = TypeVar("V")
+
+DEFAULT_CONCURRENCY = 10
+
+
+async def fan_out(
+    fetch: Callable[[K], Awaitable[Optional[V]]],
+    keys: Iterable[K],
+    concurrency: int = DEFAULT_CONCURRENCY,
+) -> dict[K, V]:
+    """Call ``fetch(key)`` for each distinct key, at most ``concurrency`` at a time.
+
+    Returns:
+        Mapping of key to result; keys whose result is None are omitted.
+    """
+    unique = list(dict.fromkeys(keys))
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def fetch_one(key: K) -> Optional[V]:
+        async with semaphore:
+            return await fetch(key)
+
+    results = await asyncio.gather(*(fetch_one(key) for key in unique))
+    return {key: value for key, value in zip(unique, results) if value is not None}
+
+
+async def _native_or_fan_out(
+    repo: Any,
+    native: str,
+    native_args: tuple[Any, ...],
+    fetch: Callable[[K], Awaitable[Optional[V]]],
+    keys: list[K],
+    concurrency: int,
+) -> dict[K, V]:
+    if not keys:
+        return {}
+    batch = getattr(repo, native, None)
+    if batch is not None:
+        return await batch(keys, *native_args)
+    return await fan_out(fetch, keys, concurrency)
+
+
+async def get_many_experiments(
+    repo: ExperimentRepository,
+    experiment_ids: Iterable[int],
+    concurrency: int = DEFAULT_CONCURRENCY,
+) -> dict[int, Experiment]:
+    """Fetch several experiments, keyed by ID (missing IDs omitted)."""
+    ids = list(dict.fromkeys(experiment_ids))
+    return await _native_or_fan_out(
+        repo, "get_many", (), repo.get_by_id, ids, concurrency
+    )
+
+
+async def get_many_users(
+    repo: UserRepository,
+    user_ids: Iterable[int],
+    concurrency: int = DEFAULT_CONCURRENCY,
+) -> dict[int, User]:
+    """Fetch several users, keyed by ID (missing IDs omitted)."""
+    ids = list(dict.fromkeys(user_ids))
+    return await _native_or_fan_out(
+        repo, "get_many", (), repo.get_by_id, ids, concurrency
+    )
+
+
+async def get_many_analysis_results(
+    repo: PluginDataRepository,
+    experiment_ids: Iterable[int],
+    plugin_id: str,
+    concurrency: int = DEFAULT_CONCURRENCY,
+) -> dict[int, PluginAnalysisResult]:
+    """Fetch a plugin's analysis results for several experiments, keyed by experiment ID."""
+    ids = list(dict.fromkeys(experiment_ids))
+
+    async def fetch(experiment_id: int) -> Optional[PluginAnalysisResult]:
+        return await repo.get_analysis_result(experiment_id, plugin_id)
+
+    return await _native_or_fan_out(
+        repo, "get_many_analysis_results", (plugin_id,), fetch, ids, concurrency
+    )
+
+
+class BatchLoader(Generic[K, V]):
+    """Coalesce ``load(key)`` calls made in the same event-loop tick into one batch.
+
+    Args:
+        batch_fn: Fetches a list of keys, returning a mapping of key to value;
+            keys missing from the mapping load as None.
+        max_batch_size: Split larger batches into several ``batch_fn`` calls.
+        cache: Memoize results (and in-flight loads) for this loader's lifetime.
+    """
+
+    def __init__(
+        self,
+        batch_fn: Callable[[list[K]], Awaitable[Mapping[K, V]]],
+        max_batch_size: Optional[int] = None,
+        cache: bool = True,
+    ):
+        self._batch_fn = batch_fn
+        self._max_batch_size = max_batch_size
+        self._cache_enabled = cache
+        self._cache: dict[K, asyncio.Future[Optional[V]]] = {}
+        self._queue: list[tuple[K, asyncio.Future[Optional[V]]]] = []
+        self._tasks: set[asyncio.Task[None]] = set()
+
+    async def load(self, key: K) -> Optional[V]:
+        """Load one key, batched with every other key requested this tick."""
+        future = self._cache.get(key)
+        if future is None:
+            loop = asyncio.get_running_loop()
+            future = loop.create_future()
+            if self._cache_enabled:
+                self._cache[key] = future
+            self._queue.append((key, future))
+            if len(self._queue) == 1:
+                loop.call_soon(self._dispatch)
+        # Shield so one cancelled caller does not cancel a load others share.
+        return await asyncio.shield(future)
+
+    async def load_many(self, keys: Iterable[K]) -> dict[K, V]:
+        """Load several keys; keys that load as None are omitted."""
+        unique = list(dict.fromkeys(keys))
+        values = await asyncio.gather(*(self.load(key) for key in unique))
+        return {key: value for key, value in zip(unique, values) if value is not None}
+
+    def prime(self, key: K, value: V) -> None:
+        """Seed the memo with a known value."""
+        if self._cache_enabled and key not in self._cache:
+            future = asyncio.get_running_loop().create_future()
+            future.set_result(value)
+            self._cache[key] = future
+
+    def clear(self, key: K) -> None:
+        """Forget the memoized value for ``key``."""
+        self._cache.pop(key, None)
+
+    def clear_all(self) -> None:
+        self._cache.clear()
+
+    def _dispatch(self) -> None:
+        queue, self._queue = self._queue, []
+        size = self._max_batch_size or len(queue)
+        loop = asyncio.get_running_loop()
+        for start in range(0, len(queue), size):
+            task = loop.create_task(self._run(queue[start : start + size]))
+            self._tasks.add(task)
+            task.add_done_callback(self._tasks.discard)
+
+    async def _run(self, batch: list[tuple[K, asyncio.Future[Optional[V]]]]) -> None:
+        keys = list(dict.fromkeys(key for key, _ in batch))
+        try:
+            values = await self._batch_fn(keys)
+        except Exception as e:
+            for key, future in batch:
+                if self._cache.get(key) is future:
+                    del self._cache[key]  # allow a retry
+                if not future.done():
+                    future.set_exception(e)
+            return
+        for key, future in batch:
+            if not future.done():
+                future.set_result(values.get(key))
+
+
+class _BatchedRepository:
+    """Proxy routing ``get_by_id`` through a ``BatchLoader``; other calls pass through."""
+
+    def __init__(self, repo: Any, loader: BatchLoader[int, Any]):
+        self._repo = repo
+        self.loader = loader
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self._repo, name)
+
+    async def get_by_id(self, entity_id: int) -> Any:
+        return await self.loader.load(entity_id)
+
+    async def get_many(self, entity_ids: Iterable[int]) -> dict[int, Any]:
+        return await self.loader.load_many(entity_ids)
+
+
+class BatchedExperimentRepository(_BatchedRepository):
+    """Request-scoped ``ExperimentRepository`` wrapper with batched, memoized ``get_by_id``."""
+
+    def __init__(
+        self,
+        repo: ExperimentRepository,
+        max_batch_size: Optional[int] = None,
+        concurrency: int = DEFAULT_CONCURRENCY,
+    ):
+        async def batch_fn(ids: list[int]) -> dict[int, Experiment]:
+            return await get_many_experiments(repo, ids, concurrency)
+
+        super().__init__(repo, BatchLoader(batch_fn, max_batch_size=max_batch_size))
+
+    async def update(self, experiment_id: int, **fields: Any) -> Optional[Experiment]:
+        self.loader.clear(experiment_id)
+        return await self._repo.update(experiment_id, **fields)
+
+    async def delete(self, experiment_id: int) -> bool:
+        self.loader.clear(experiment_id)
+        return await self._repo.delete(experiment_id)
+
+
+class BatchedUserRepository(_BatchedRepository):
+    """Request-scoped ``UserRepository`` wrapper with batched, memoized ``get_by_id``."""
+
+    def __init__(
+        self,
+        repo: UserRepository,
+        max_batch_size: Optional[int] = None,
+        concurrency: int = DEFAULT_CONCURRENCY,
+    ):
+        async def batch_fn(ids: list[int]) -> dict[int, User]:
+            return await get_many_users(repo, ids, concurrency)
+
+        super().__init__(repo, BatchLoader(batch_fn, max_batch_size=max_batch_size))
@@ -0,0 +1,360 @@
+"""
+Content-addressed blob offload for large analysis result payloads.
+
+Raw matrices and long traces make ``PluginAnalysisResult.result`` huge, and
+every read of it pays for them. ``offload_blobs`` moves each value whose
+serialized size exceeds a threshold into a ``BlobStore`` and leaves a small
+reference in its place::
+
+    {"matrix": {"$blob": "sha256:9f2c...", "encoding": "array", "size": 8388672}}
+
+Blobs are keyed by the SHA-256 of their content, so identical payloads are
+stored once however many experiments reference them. ``resolve_blobs`` turns
+references back into ``BlobRef`` objects that fetch their content on first
+``await ref.load()``.
+
+Standalone plugins use a ``LocalBlobStore`` under their storage directory;
+integrated platforms can supply their own store via
+``PlatformContext.get_blob_store()``.
+
+Usage::
+
+    from mld_sdk import BlobOffloadingRepository
+
+    repo = BlobOffloadingRepository(
+        context.get_plugin_data_repository(), self.get_blob_store()
+    )
+    await repo.save_analysis_result(experiment_id, "peaks", {"matrix": big_array})
+    result = await repo.get_analysis_result(experiment_id, "peaks")
+    matrix = await result.result["matrix"].load()
+"""
+
+import array
+import asyncio
+import dataclasses
+import hashlib
+import json
+import os
+import tempfile
+from pathlib import Path
+from typing import Any, Optional, Protocol, Sequence, runtime_checkable
+
+from mld_sdk.arrays import decode_array, encode_array
+from mld_sdk.batching import get_many_analysis_results
+from mld_sdk.exceptions import NotFoundException, ValidationException
+from mld_sdk.repositories import PluginAnalysisResult, PluginDataRepository
+
+_NUMPY_AVAILABLE = False
+try:
+    import numpy as np
+
+    _NUMPY_AVAILABLE = True
+except ImportError:
+    pass
+
+DEFAULT_OFFLOAD_THRESHOLD = 64 * 1024
+BLOB_KEY = "$blob"
+_SCALARS = (bool, int, float, type(None))
+
+
+@runtime_checkable
+class BlobStore(Protocol):
+    """Content-addressed blob storage.
+
+    Digests have the form ``"sha256:<hex>"``. Storing content that already
+    exists must be a cheap no-op.
+    """
+
+    async def put(self, data: bytes) -> str:
+        """Store ``data`` and return its digest."""
+        ...
+
+    async def get(self, digest: str) -> bytes:
+        """Return the content for ``digest``; raise ``NotFoundException`` if absent."""
+        ...
+
+    async def exists(self, digest: str) -> bool:
+        """Check whether ``digest`` is stored."""
+        ...
+
+    async def delete(self, digest: str) -> bool:
+        """Delete a blob. Returns False if it did not exist."""
+        ...
+
+
+def content_digest(data: bytes) -> str:
+    """Return the ``"sha256:<hex>"`` digest of ``data``."""
+    return "sha256:" + hashlib.sha256(data).hexdigest()
+
+
+class LocalBlobStore:
+    """``BlobStore`` keeping one file per blob under ``root``.
+
+    Files live at ``root/<first two hex chars>/<hex>``. Writes go through a
+    temporary file and an atomic rename, so concurrent writers of the same
+    content are safe.
+    """
+
+    def __init__(self, root: Path):
+        self.root = Path(root)
+
+    def path_for(self, digest: str) -> Path:
+        algorithm, _, hexdigest = digest.partition(":")
+        if algorithm != "sha256" or len(hexdigest) != 64 or not all(
+            c in "0123456789abcdef" for c in hexdigest
+        ):
+            raise ValidationException(f"Invalid blob digest '{digest}'", field="digest")
+        return self.root / hexdigest[:2] / hexdigest
+
+    def _put(self, data: bytes) -> str:
+        digest = content_digest(data)
+        path = self.path_for(digest)
+        if path.exists():
+            return digest
+        path.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp = tempfile.mkstemp(dir=path.parent, prefix=".tmp-")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                f.write(data)
+            os.replace(tmp, path)
+        except BaseException:
+            Path(tmp).unlink(missing_ok=True)
+            raise
+        return digest
+
+    def _get(self, digest: str) -> bytes:
+        try:
+            return self.path_for(digest).read_bytes()
+        except FileNotFoundError:
+            raise NotFoundException("Blob not found", entity="blob", entity_id=digest) from None
+
+    def _delete(self, digest: str) -> bool:
+        try:
+            self.path_for(digest).unlink()
+        except FileNotFoundError:
+            return False
+        return True
+
+    async def put(self, data: bytes) -> str:
+        return await asyncio.to_thread(self._put, data)
+
+    async def get(self, digest: str) -> bytes:
+        return await asyncio.to_thread(self._get, digest)
+
+    async def exists(self, digest: str) -> bool:
+        return await asyncio.to_thread(self.path_for(digest).exists)
+
+    async def delete(self, digest: str) -> bool:
+        return await asyncio.to_thread(self._delete, digest)
+
+
+# One strict codec everywhere: blobs written in one environment must read back
+# identically in another, and equal values must hash to the same digest.
+def _json_dumps(value: Any) -> bytes:
+    return json.dumps(
+        value, separators=(",", ":"), ensure_ascii=False, allow_nan=False
+    ).encode("utf-8")
+
+
+def _json_loads(data: bytes) -> Any:
+    return json.loads(data)
+
+
+def _encode(value: Any) -> Optional[tuple[bytes, str]]:
+    """Serialize an offload candidate; None if it cannot be stored as a blob."""
+    if isinstance(value, bytes):
+        return value, "bytes"
+    if isinstance(value, (array.array, memoryview)) or (
+        _NUMPY_AVAILABLE and isinstance(value, np.ndarray)
+    ):
+        try:
+            return encode_array(value), "array"
+        except ValidationException:
+            return None
+    try:
+        return _json_dumps(value), "json"
+    except (TypeError, ValueError):
+        return None
+
+
+def _decode(data: bytes, encoding: str) -> Any:
+    if encoding == "json":
+        return _json_loads(data)
+    if encoding == "array":
+        return decode_array(data)
+    if encoding == "bytes":
+        return data
+    raise ValidationException(f"Unknown blob encoding '{encoding}'", field="encoding")
+
+
+def is_blob_reference(value: Any) -> bool:
+    """Whether ``value`` is a blob reference dict left by ``offload_blobs``."""
+    return isinstance(value, dict) and isinstance(value.get(BLOB_KEY), str)
+
+
+class BlobRef:
+    """Lazy handle to an offloaded value; ``await ref.load()`` fetches it once."""
+
+    __slots__ = ("digest", "encoding", "size", "_store", "_value", "_loaded")
+
+    def __init__(self, store: BlobStore, digest: str, encoding: str = "json", size: int = 0):
+        self.digest = digest
+        self.encoding = encoding
+        self.size = size
+        self._store = store
+        self._value: Any = None
+        self._loaded = False
+
+    @classmethod
+    def from_reference(cls, store: BlobStore, reference: dict[str, Any]) -> "BlobRef":
+        return cls(
+            store,
+            reference[BLOB_KEY],
+            reference.get("encoding", "json"),
+            reference.get("size", 0),
+        )
+
+    @property
+    def is_loaded(self) -> bool:
+        return self._loaded
+
+    def to_reference(self) -> dict[str, Any]:
+        return {BLOB_KEY: self.digest, "encoding": self.encoding, "size": self.size}
+
+    async def load(self) -> Any:
+        if not self._loaded:
+            self._value = _decode(await self._store.get(self.digest), self.encoding)
+            self._loaded = True
+        return self._value
+
+    def __repr__(self) -> str:
+        return f"BlobRef({self.digest!r}, encoding={self.encoding!r}, size={self.size})"
+
+
+async def offload_blobs(
+    document: dict[str, Any],
+    store: BlobStore,
+    threshold: int = DEFAULT_OFFLOAD_THRESHOLD,
+) -> dict[str, Any]:
+    """Return a copy of ``document`` with large values moved into ``store``.
+
+    Nested dicts are walked; any other value (list, string, bytes, array)
+    whose serialized size is at least ``threshold`` bytes is replaced by a
+    blob reference. ``BlobRef`` values are written back as references
+    without loading them.
+    """
+    pending: dict[str, bytes] = {}
+
+    def walk(value: Any) -> Any:
+        if isinstance(value, BlobRef):
+            return value.to_reference()
+        if isinstance(value, dict) and not is_blob_reference(value):
+            return {key: walk(child) for key, child in value.items()}
+        if isinstance(value, _SCALARS) or is_blob_reference(value):
+            return value
+        encoded = _encode(value)
+        if encoded is None or len(encoded[0]) < threshold:
+            return value
+        payload, encoding = encoded
+        digest = content_digest(payload)
+        pending[digest] = payload
+        return {BLOB_KEY: digest, "encoding": encoding, "size": len(payload)}
+
+    offloaded = walk(document)
+    stored = await asyncio.gather(*(store.put(payload) for payload in pending.values()))
+    for expected, digest in zip(pending, stored):
+        if digest != expected:
+            raise ValidationException(
+                f"Blob store returned digest '{digest}', expected '{expected}'",
+                field="digest",
+            )
+    return offloaded
+
+
+async def resolve_blobs(
+    document: dict[str, Any], store: BlobStore, lazy: bool = True
+) -> dict[str, Any]:
+    """Replace blob references in ``document`` with ``BlobRef`` handles.
+
+    With ``lazy=False`` every referenced blob is fetched concurrently and the
+    decoded values are substituted instead.
+    """
+    refs: list[BlobRef] = []
+
+    def walk(value: Any) -> Any:
+        if is_blob_reference(value):
+            ref = BlobRef.from_reference(store, value)
+            refs.append(ref)
+            return ref
+        if isinstance(value, dict):
+            return {key: walk(child) for key, child in value.items()}
+        return value
+
+    resolved = walk(document)
+    if lazy or not refs:
+        return resolved
+    await asyncio.gather(*(ref.load() for ref in refs))
+
+    def materialize(value: Any) -> Any:
+        if isinstance(value, BlobRef):
+            return value._value
+        if isinstance(value, dict):
+            return {key: materialize(child) for key, child in value.items()}
+        return value
+
+    return materialize(resolved)
+
+
+class BlobOffloadingRepository:
+    """``PluginDataRepository`` wrapper offloading large result values to a blob store.
+
+    ``save_analysis_result`` stores values above ``threshold`` bytes as blobs;
+    the ``get_analysis_result*`` methods return results whose offloaded values
+    are lazy ``BlobRef`` handles. Other methods pass through.
+
+    Args:
+        repo: Underlying plugin data repository.
+        store: Blob store for offloaded values.
+        threshold: Minimum serialized size in bytes for a value to be offloaded.
+    """
+
+    def __init__(
+        self,
+        repo: PluginDataRepository,
+        store: BlobStore,
+        threshold: int = DEFAULT_OFFLOAD_THRESHOLD,
+    ):
+        self._repo = repo
+        self.store = store
+        self.threshold = threshold
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self._repo, name)
+
+    async def _resolve(self, result: PluginAnalysisResult) -> PluginAnalysisResult:
+        return dataclasses.replace(result, result=await resolve_blobs(result.result, self.store))
+
+    async def save_analysis_result(
+        self, experiment_id: int, plugin_id: str, result: dict[str, Any]
+    ) -> PluginAnalysisResult:
+        offloaded = await offload_blobs(result, self.store, self.threshold)
+        saved = await self._repo.save_analysis_result(experiment_id, plugin_id, offloaded)
+        return await self._resolve(saved)
+
+    async def get_analysis_result(
+        self, experiment_id: int, plugin_id: str, **kwargs: Any
+    ) -> Optional[PluginAnalysisResult]:
+        result = await self._repo.get_analysis_result(experiment_id, plugin_id, **kwargs)
+        return await self._resolve(result) if result is not None else None
+
+    async def get_analysis_results(
+        self, experiment_id: int, **kwargs: Any
+    ) -> list[PluginAnalysisResult]:
+        results = await self._repo.get_analysis_results(experiment_id, **kwargs)
+        return [await self._resolve(r) for r in results]
+
+    async def get_many_analysis_results(
+        self, experiment_ids: Sequence[int], plugin_id: str
+    ) -> dict[int, PluginAnalysisResult]:
+        results = await get_many_analysis_results(self._repo, experiment_ids, plugin_id)
+        return {eid: await self._resolve(r) for eid, r in results.items()}
@@ -0,0 +1,286 @@
+"""
+Read-through caching for platform repositories.
+
+Experiments and users are read far more often than they change. The
+``Cached*Repository`` wrappers keep recently read entities in a bounded
+in-process LRU with a per-entity-type TTL, invalidate entries on writes made
+through the wrapper, and expose hit/miss counters.
+
+Plugins usually enable caching with ``AnalysisPlugin._setup_repository_cache()``,
+which also invalidates cached experiments from the default
+``on_after_experiment_save`` / ``on_experiment_status_change`` hooks.
+Cached entities are shared between callers; treat them as read-only.
+
+``CachedPluginRoleRepository`` caches plugin-role lookups (including "no
+role") per (plugin_id, user_id) with a short TTL, so role checks such as
+``require_plugin_role`` do not hit the database on every request.
+"""
+
+from typing import TYPE_CHECKING, Any, Awaitable, Callable, Iterable, Optional
+
+from mld_sdk._cache import TTLCache
+from mld_sdk.batching import get_many_experiments, get_many_users
+from mld_sdk.repositories import (
+    Experiment,
+    ExperimentRepository,
+    PluginRoleRepository,
+    User,
+    UserPluginRole,
+    UserRepository,
+)
+
+if TYPE_CHECKING:
+    from mld_sdk.context import PlatformContext
+
+_ROLE_MISS = object()
+
+
+class _CachedRepository:
+    """Proxy caching ``get_by_id`` / ``get_many``; other calls pass through."""
+
+    def __init__(
+        self,
+        repo: Any,
+        fetch_many: Callable[[list[int]], Awaitable[dict[int, Any]]],
+        maxsize: int,
+        ttl: Optional[float],
+    ):
+        self._repo = repo
+        self._fetch_many = fetch_many
+        self.cache: TTLCache[int, Any] = TTLCache(maxsize=maxsize, ttl=ttl)
+        self._writes = 0
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self._repo, name)
+
+    async def get_by_id(self, entity_id: int) -> Any:
+        entity = self.cache.get(entity_id)
+        if entity is None:
+            writes = self._writes
+            entity = await self._repo.get_by_id(entity_id)
+            if entity is not None and writes == self._writes:  # don't cache a raced read
+                self.cache.set(entity_id, entity)
+        return entity
+
+    async def get_many(self, entity_ids: Iterable[int]) -> dict[int, Any]:
+        found: dict[int, Any] = {}
+        misses: list[int] = []
+        for entity_id in dict.fromkeys(entity_ids):
+            entity = self.cache.get(entity_id)
+            if entity is None:
+                misses.append(entity_id)
+            else:
+                found[entity_id] = entity
+        if misses:
+            writes = self._writes
+            fetched = await self._fetch_many(misses)
+            if writes == self._writes:
+                for entity_id, entity in fetched.items():
+                    self.cache.set(entity_id, entity)
+            found.update(fetched)
+        return found
+
+    def invalidate(self, entity_id: int) -> None:
+        """Drop ``entity_id`` from the cache."""
+        self._writes += 1
+        self.cache.pop(entity_id)
+
+    def clear(self) -> None:
+        self._writes += 1
+        self.cache.clear()
+
+    def stats(self) -> dict[str, int]:
+        """Hit/miss counters and current size."""
+        return self.cache.stats()
+
+
+class CachedExperimentRepository(_CachedRepository):
+    """``ExperimentRepository`` wrapper with a TTL/LRU cache on reads by ID."""
+
+    def __init__(
+        self, repo: ExperimentRepository, maxsize: int = 1024, ttl: Optional[float] = 30.0
+    ):
+        async def fetch_many(ids: list[int]) -> dict[int, Experiment]:
+            return await get_many_experiments(repo, ids)
+
+        super().__init__(repo, fetch_many, maxsize, ttl)
+
+    async def update(self, experiment_id: int, **fields: Any) -> Optional[Experiment]:
+        self.invalidate(experiment_id)
+        try:
+            return await self._repo.update(experiment_id, **fields)
+        finally:
+            self.invalidate(experiment_id)
+
+    async def delete(self, experiment_id: int) -> bool:
+        try:
+            return await self._repo.delete(experiment_id)
+        finally:
+            self.invalidate(experiment_id)
+
+
+class CachedUserRepository(_CachedRepository):
+    """``UserRepository`` wrapper with a TTL/LRU cache on reads by ID."""
+
+    def __init__(
+        self, repo: UserRepository, maxsize: int = 1024, ttl: Optional[float] = 300.0
+    ):
+        async def fetch_many(ids: list[int]) -> dict[int, User]:
+            return await get_many_users(repo, ids)
+
+        super().__init__(repo, fetch_many, maxsize, ttl)
+
+
+class CachedPluginRoleRepository:
+    """``PluginRoleRepository`` wrapper caching roles per (plugin_id, user_id).
+
+    Absent roles are cached as well. ``set_role`` / ``remove_role`` update the
+    cache, and ``prefetch(plugin_id)`` loads every assignment of a plugin with
+    one ``list_plugin_roles`` call, after which any user of that plugin
+    resolves without a lookup until the TTL expires.
+
+    Args:
+        repo: Underlying role repository.
+        maxsize: Maximum cached (plugin_id, user_id) entries.
+        ttl: Seconds a role is served from cache (None = until evicted).
+    """
+
+    def __init__(
+        self, repo: PluginRoleRepository, maxsize: int = 4096, ttl: Optional[float] = 30.0
+    ):
+        self._repo = repo
+        self.cache: TTLCache[tuple[str, int], Optional[str]] = TTLCache(
+            maxsize=maxsize, ttl=ttl
+        )
+        # Complete user_id -> role snapshots from list_plugin_roles
+        self._snapshots: TTLCache[str, dict[int, str]] = TTLCache(maxsize=256, ttl=ttl)
+        self._writes = 0
+        self.hits = 0
+        self.misses = 0
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self._repo, name)
+
+    async def get_role(self, plugin_id: str, user_id: int) -> Optional[str]:
+        key = (plugin_id, user_id)
+        role = self.cache.get(key, _ROLE_MISS, count=False)
+        if role is _ROLE_MISS:
+            snapshot = self._snapshots.get(plugin_id, count=False)
+            if snapshot is not None:
+                role = snapshot.get(user_id)
+        if role is not _ROLE_MISS:
+            self.hits += 1
+            return role
+
+        self.misses += 1
+        writes = self._writes
+        role = await self._repo.get_role(plugin_id, user_id)
+        if writes == self._writes:  # don't cache a read that raced a write
+            self.cache.set(key, role)
+        return role
+
+    async def set_role(self, plugin_id: str, user_id: int, role: str) -> UserPluginRole:
+        self.invalidate(plugin_id, user_id)
+        assignment = await self._repo.set_role(plugin_id, user_id, role)
+        self.cache.set((plugin_id, user_id), assignment.role)
+        return assignment
+
+    async def remove_role(self, plugin_id: str, user_id: int) -> bool:
+        self.invalidate(plugin_id, user_id)
+        try:
+            return await self._repo.remove_role(plugin_id, user_id)
+        finally:
+            self.invalidate(plugin_id, user_id)
+
+    async def list_plugin_roles(self, plugin_id: str) -> list[UserPluginRole]:
+        writes = self._writes
+        assignments = await self._repo.list_plugin_roles(plugin_id)
+        if writes == self._writes:
+            self._snapshots.set(plugin_id, {a.user_id: a.role for a in assignments})
+        return assignments
+
+    async def prefetch(self, plugin_id: str) -> int:
+        """Load every role assignment of ``plugin_id``; return how many."""
+        return len(await self.list_plugin_roles(plugin_id))
+
+    async def has_role(self, plugin_id: str, user_id: int, *allowed_roles: str) -> bool:
+        """Whether the user holds one of ``allowed_roles`` (any role if none given)."""
+        role = await self.get_role(plugin_id, user_id)
+        if role is None:
+            return False
+        return not allowed_roles or role in allowed_roles
+
+    def invalidate(self, plugin_id: str, user_id: Optional[int] = None) -> None:
+        """Drop one user's cached role, or every cached role of ``plugin_id``."""
+        self._writes += 1
+        self._snapshots.pop(plugin_id)
+        if user_id is None:
+            self.cache.discard_where(lambda key: key[0] == plugin_id)
+        else:
+            self.cache.pop((plugin_id, user_id))
+
+    def clear(self) -> None:
+        self._writes += 1
+        self.cache.clear()
+        self._snapshots.clear()
+
+    def stats(self) -> dict[str, int]:
+        """Hit/miss counters and current size."""
+        return {"hits": self.hits, "misses": self.misses, "size": len(self.cache)}
+
+
+class RepositoryCache:
+    """Cached views of a ``PlatformContext``'s experiment and user repositories.
+
+    Args:
+        context: Platform context providing the underlying repositories.
+        maxsize: Maximum cached entities per repository.
+        experiment_ttl: Seconds an experiment is served from cache (None = until evicted).
+        user_ttl: Seconds a user is served from cache (None = until evicted).
+        role_ttl: Seconds a plugin role is served from cache (None = until evicted).
+    """
+
+    def __init__(
+        self,
+        context: "PlatformContext",
+        maxsize: int = 1024,
+        experiment_ttl: Optional[float] = 30.0,
+        user_ttl: Optional[float] = 300.0,
+        role_ttl: Optional[float] = 30.0,
+    ):
+        experiment_repo = context.get_experiment_repository()
+        user_repo = context.get_user_repository()
+        role_repo = context.get_plugin_role_repository()
+        self.experiments: Optional[CachedExperimentRepository] = (
+            CachedExperimentRepository(experiment_repo, maxsize, experiment_ttl)
+            if experiment_repo is not None
+            else None
+        )
+        self.users: Optional[CachedUserRepository] = (
+            CachedUserRepository(user_repo, maxsize, user_ttl)
+            if user_repo is not None
+            else None
+        )
+        self.roles: Optional[CachedPluginRoleRepository] = (
+            CachedPluginRoleRepository(role_repo, ttl=role_ttl)
+            if role_repo is not None
+            else None
+        )
+
+    def invalidate_experiment(self, experiment_id: int) -> None:
+        if self.experiments is not None:
+            self.experiments.invalidate(experiment_id)
+
+    def invalidate_user(self, user_id: int) -> None:
+        if self.users is not None:
+            self.users.invalidate(user_id)
+
+    def clear(self) -> None:
+        for repo in (self.experiments, self.users, self.roles):
+            if repo is not None:
+                repo.clear()
+
+    def stats(self) -> dict[str, dict[str, int]]:
+        """Hit/miss counters per repository."""
+        repos = (("experiments", self.experiments), ("users", self.users), ("roles", self.roles))
+        return {name: repo.stats() for name, repo in repos if repo is not None}
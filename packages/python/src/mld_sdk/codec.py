@@ -0,0 +1,541 @@
+"""
+Compact binary codec for design data and analysis result payloads.
+
+``DesignData.data`` and ``PluginAnalysisResult.result`` are JSON by default,
+which is slow to parse and large for numeric content. The ``mldb`` codec is a
+msgpack-style binary format with:
+
+- typed float arrays: lists of floats and NumPy / ``array.array`` values are
+  stored as raw little-endian bytes instead of decimal text;
+- optional whole-payload compression: ``zlib`` (always available), ``zstd``
+  (``pip install zstandard``) or ``lz4`` (``pip install lz4``).
+
+Encoded payloads travel through the existing dict-based repository API in an
+envelope ``{"$codec": "mldb/1", "payload": b"..."}``, and encoded design data
+records the codec in its ``schema_version`` (``"1.0"`` -> ``"1.0+mldb.1"``).
+Platforms advertise what they accept via
+``PlatformContext.get_supported_codecs()``; anything else falls back to JSON.
+
+Usage::
+
+    from mld_sdk import CodecRepository
+
+    repo = CodecRepository.for_context(context, compression="zstd")
+    await repo.save_analysis_result(experiment_id, "peaks", {"mz": mz_values})
+    result = await repo.get_analysis_result(experiment_id, "peaks")  # decoded dict
+"""
+
+import array
+import dataclasses
+import struct
+import sys
+import zlib
+from datetime import datetime
+from typing import TYPE_CHECKING, Any, Optional, Sequence
+
+from mld_sdk.arrays import decode_array, encode_array
+from mld_sdk.batching import get_many_analysis_results
+from mld_sdk.exceptions import ConfigurationException, NotFoundException, ValidationException
+from mld_sdk.patching import Patch, PatchFormat, _check_precondition, apply_patch
+from mld_sdk.projection import project_fields
+from mld_sdk.repositories import DesignData, PluginAnalysisResult, PluginDataRepository
+
+if TYPE_CHECKING:
+    from mld_sdk.context import PlatformContext
+
+_NUMPY_AVAILABLE = False
+try:
+    import numpy as np
+
+    _NUMPY_AVAILABLE = True
+except ImportError:
+    pass
+
+_ZSTD_AVAILABLE = False
+try:
+    import zstandard
+
+    _ZSTD_AVAILABLE = True
+except ImportError:
+    pass
+
+_LZ4_AVAILABLE = False
+try:
+    import lz4.frame
+
+    _LZ4_AVAILABLE = True
+except ImportError:
+    pass
+
+CODEC_NAME = "mldb"
+CODEC_VERSION = 1
+CODEC_ID = f"{CODEC_NAME}/{CODEC_VERSION}"
+CODEC_KEY = "$codec"
+JSON_CODEC = "json"
+
+_MAGIC = b"MLDB"
+_HEADER = struct.Struct("<4sBB")  # magic, version, compression
+_COMPRESSION_IDS = {None: 0, "zlib": 1, "zstd": 2, "lz4": 3}
+_COMPRESSION_NAMES = {v: k for k, v in _COMPRESSION_IDS.items()}
+# Float lists shorter than this are stored element by element
+_MIN_FLOAT_ARRAY = 8
+
+# Type tags
+_NONE, _FALSE, _TRUE = b"N", b"F", b"T"
+_INT, _BIGINT, _FLOAT = b"i", b"I", b"d"
+_STR, _BYTES, _LIST, _MAP = b"s", b"b", b"l", b"m"
+_FLOAT_ARRAY, _ARRAY = b"f", b"a"
+
+_I64 = struct.Struct("<q")
+_F64 = struct.Struct("<d")
+_I64_MIN, _I64_MAX = -(2**63), 2**63 - 1
+_LITTLE_ENDIAN = sys.byteorder == "little"
+
+
+def available_compressions() -> list[Optional[str]]:
+    """Compression methods usable in this environment."""
+    methods: list[Optional[str]] = [None, "zlib"]
+    if _ZSTD_AVAILABLE:
+        methods.append("zstd")
+    if _LZ4_AVAILABLE:
+        methods.append("lz4")
+    return methods
+
+
+def _require_compression(name: Optional[str]) -> None:
+    if name not in _COMPRESSION_IDS:
+        raise ValidationException(f"Unknown compression '{name}'", field="compression")
+    if name not in available_compressions():
+        package = "zstandard" if name == "zstd" else name
+        raise ConfigurationException(
+            f"Compression '{name}' requires the '{package}' package",
+            config_key="compression",
+        )
+
+
+def _compress(data: bytes, name: Optional[str]) -> bytes:
+    if name == "zlib":
+        return zlib.compress(data)
+    if name == "zstd":
+        return zstandard.ZstdCompressor().compress(data)
+    if name == "lz4":
+        return lz4.frame.compress(data)
+    return data
+
+
+def _decompress(data: memoryview, name: Optional[str]) -> bytes | memoryview:
+    if name == "zlib":
+        return zlib.decompress(data)
+    if name == "zstd":
+        return zstandard.ZstdDecompressor().decompress(data)
+    if name == "lz4":
+        return lz4.frame.decompress(data)
+    return data
+
+
+# --- Encoding ---
+
+
+def _write_varint(out: bytearray, n: int) -> None:
+    while n >= 0x80:
+        out.append((n & 0x7F) | 0x80)
+        n >>= 7
+    out.append(n)
+
+
+def _is_float_array(value: list) -> bool:
+    return len(value) >= _MIN_FLOAT_ARRAY and all(type(v) is float for v in value)
+
+
+def _encode_value(out: bytearray, value: Any) -> None:
+    if value is None:
+        out += _NONE
+    elif value is True:
+        out += _TRUE
+    elif value is False:
+        out += _FALSE
+    elif isinstance(value, int):
+        if _I64_MIN <= value <= _I64_MAX:
+            out += _INT
+            out += _I64.pack(value)
+        else:
+            digits = str(value).encode("ascii")
+            out += _BIGINT
+            _write_varint(out, len(digits))
+            out += digits
+    elif isinstance(value, float):
+        out += _FLOAT
+        out += _F64.pack(value)
+    elif isinstance(value, str):
+        data = value.encode("utf-8")
+        out += _STR
+        _write_varint(out, len(data))
+        out += data
+    elif isinstance(value, dict):
+        out += _MAP
+        _write_varint(out, len(value))
+        for key, item in value.items():
+            _encode_value(out, key)
+            _encode_value(out, item)
+    elif isinstance(value, (list, tuple)):
+        if _is_float_array(value):  # type: ignore[arg-type]
+            floats = array.array("d", value)
+            if not _LITTLE_ENDIAN:
+                floats.byteswap()
+            out += _FLOAT_ARRAY
+            _write_varint(out, len(floats))
+            out += floats.tobytes()
+        else:
+            out += _LIST
+            _write_varint(out, len(value))
+            for item in value:
+                _encode_value(out, item)
+    elif isinstance(value, (bytes, bytearray)):
+        out += _BYTES
+        _write_varint(out, len(value))
+        out += value
+    elif isinstance(value, (array.array, memoryview)) or (
+        _NUMPY_AVAILABLE and isinstance(value, np.ndarray)
+    ):
+        blob = encode_array(value)
+        out += _ARRAY
+        _write_varint(out, len(blob))
+        out += blob
+    elif _NUMPY_AVAILABLE and isinstance(value, np.generic):
+        _encode_value(out, value.item())
+    else:
+        raise ValidationException(
+            f"Cannot encode value of type {type(value).__name__}", field="value"
+        )
+
+
+def encode(value: Any, compression: Optional[str] = None) -> bytes:
+    """Encode ``value`` in the ``mldb`` binary format.
+
+    Supports None, bool, int, float, str, bytes, lists/tuples, dicts, NumPy
+    arrays and ``array.array``. Float lists decode as lists, arrays as arrays
+    (see ``mld_sdk.arrays.decode_array``).
+
+    Raises:
+        ValidationException: For unsupported value types.
+        ConfigurationException: If the compression library is not installed.
+    """
+    _require_compression(compression)
+    body = bytearray()
+    _encode_value(body, value)
+    header = _HEADER.pack(_MAGIC, CODEC_VERSION, _COMPRESSION_IDS[compression])
+    return header + _compress(bytes(body), compression)
+
+
+# --- Decoding ---
+
+
+class _Decoder:
+    __slots__ = ("data", "pos")
+
+    def __init__(self, data: memoryview):
+        self.data = data
+        self.pos = 0
+
+    def _take(self, n: int) -> memoryview:
+        start, end = self.pos, self.pos + n
+        if end > len(self.data):
+            raise ValidationException("Encoded payload is truncated")
+        self.pos = end
+        return self.data[start:end]
+
+    def _varint(self) -> int:
+        result = shift = 0
+        while True:
+            byte = self._take(1)[0]
+            result |= (byte & 0x7F) << shift
+            if byte < 0x80:
+                return result
+            shift += 7
+
+    def value(self) -> Any:
+        tag = bytes(self._take(1))
+        if tag == _NONE:
+            return None
+        if tag == _TRUE:
+            return True
+        if tag == _FALSE:
+            return False
+        if tag == _INT:
+            return _I64.unpack(self._take(8))[0]
+        if tag == _FLOAT:
+            return _F64.unpack(self._take(8))[0]
+        if tag == _STR:
+            return str(self._take(self._varint()), "utf-8")
+        if tag == _MAP:
+            return {self.value(): self.value() for _ in range(self._varint())}
+        if tag == _LIST:
+            return [self.value() for _ in range(self._varint())]
+        if tag == _FLOAT_ARRAY:
+            floats = array.array("d")
+            floats.frombytes(self._take(8 * self._varint()))
+            if not _LITTLE_ENDIAN:
+                floats.byteswap()
+            return floats.tolist()
+        if tag == _BYTES:
+            return bytes(self._take(self._varint()))
+        if tag == _ARRAY:
+            return decode_array(bytes(self._take(self._varint())))
+        if tag == _BIGINT:
+            return int(str(self._take(self._varint()), "ascii"))
+        raise ValidationException(f"Unknown type tag {tag!r} in encoded payload")
+
+
+def decode(data: bytes | memoryview) -> Any:
+    """Decode a payload produced by ``encode``."""
+    view = memoryview(data)
+    try:
+        magic, version, compression_id = _HEADER.unpack_from(view)
+    except struct.error as e:
+        raise ValidationException("Encoded payload is truncated") from e
+    if magic != _MAGIC:
+        raise ValidationException("Not an mldb payload (bad magic)")
+    if version > CODEC_VERSION:
+        raise ValidationException(
+            f"mldb version {version} is newer than supported version {CODEC_VERSION}"
+        )
+    if compression_id not in _COMPRESSION_NAMES:
+        raise ValidationException(f"Unknown compression id {compression_id}")
+    compression = _COMPRESSION_NAMES[compression_id]
+    _require_compression(compression)
+    body = _decompress(view[_HEADER.size :], compression)
+    decoder = _Decoder(memoryview(body))
+    value = decoder.value()
+    if decoder.pos != len(decoder.data):
+        raise ValidationException("Trailing bytes after encoded payload")
+    return value
+
+
+# --- Negotiation and envelopes ---
+
+
+def negotiate_codec(
+    supported: Sequence[str], preferred: Sequence[str] = (CODEC_ID, JSON_CODEC)
+) -> str:
+    """Return the first ``preferred`` codec the platform ``supported``, else JSON."""
+    for codec in preferred:
+        if codec in supported:
+            return codec
+    return JSON_CODEC
+
+
+def is_encoded(value: Any) -> bool:
+    """Whether ``value`` is an envelope produced by ``encode_payload``."""
+    return isinstance(value, dict) and isinstance(value.get(CODEC_KEY), str)
+
+
+def encode_payload(
+    data: dict[str, Any], codec: str = CODEC_ID, compression: Optional[str] = None
+) -> dict[str, Any]:
+    """Wrap ``data`` for storage with ``codec``; JSON returns ``data`` unchanged."""
+    if codec == JSON_CODEC:
+        return data
+    if codec != CODEC_ID:
+        raise ValidationException(f"Unsupported codec '{codec}'", field="codec")
+    return {CODEC_KEY: CODEC_ID, "payload": encode(data, compression)}
+
+
+def decode_payload(value: dict[str, Any]) -> dict[str, Any]:
+    """Unwrap an envelope from ``encode_payload``; plain dicts pass through."""
+    if not is_encoded(value):
+        return value
+    name, _, _ = value[CODEC_KEY].partition("/")
+    if name != CODEC_NAME:
+        raise ValidationException(f"Unsupported codec '{value[CODEC_KEY]}'", field="codec")
+    return decode(value["payload"])
+
+
+def codec_schema_version(schema_version: str, codec: str) -> str:
+    """Tag ``schema_version`` with ``codec`` (``"1.0"`` -> ``"1.0+mldb.1"``)."""
+    if codec == JSON_CODEC:
+        return schema_version
+    return f"{schema_version}+{codec.replace('/', '.')}"
+
+
+def split_schema_version(schema_version: str) -> tuple[str, str]:
+    """Split a tagged ``schema_version`` into (base version, codec).
+
+    Only a trailing ``mldb`` tag is recognised; other build metadata
+    (``"2.0+lab.3"``) is part of the base version.
+    """
+    base, sep, tag = schema_version.rpartition("+")
+    if not sep or not tag.startswith(f"{CODEC_NAME}."):
+        return schema_version, JSON_CODEC
+    return base, tag.replace(".", "/", 1)
+
+
+class CodecRepository:
+    """``PluginDataRepository`` wrapper storing payloads with a binary codec.
+
+    Saves encode ``data`` / ``result`` with ``codec`` and reads decode them,
+    so callers keep working with plain dicts. Payloads stored as JSON (or
+    by older SDKs) are read unchanged. ``patch_*`` decode, patch and re-encode
+    the payload. Other methods pass through.
+
+    Args:
+        repo: Underlying plugin data repository.
+        codec: ``"json"`` (no encoding, the default) or ``"mldb/1"``. Only
+            pass ``"mldb/1"`` for a platform known to accept it, or use
+            ``for_context()`` to negotiate.
+        compression: None, ``"zlib"``, ``"zstd"`` or ``"lz4"``.
+    """
+
+    def __init__(
+        self,
+        repo: PluginDataRepository,
+        codec: str = JSON_CODEC,
+        compression: Optional[str] = None,
+    ):
+        if codec not in (CODEC_ID, JSON_CODEC):
+            raise ValidationException(f"Unsupported codec '{codec}'", field="codec")
+        _require_compression(compression)
+        self._repo = repo
+        self.codec = codec
+        self.compression = compression
+
+    @classmethod
+    def for_context(
+        cls, context: "PlatformContext", compression: Optional[str] = None
+    ) -> "CodecRepository":
+        """Wrap the context's data repository with the best codec it supports."""
+        repo = context.get_plugin_data_repository()
+        if repo is None:
+            raise ConfigurationException(
+                "Platform does not provide a plugin data repository",
+                config_key="plugin_data_repository",
+            )
+        return cls(repo, negotiate_codec(context.get_supported_codecs()), compression)
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self._repo, name)
+
+    # Encoded payloads are opaque to the platform, so ``fields`` are applied
+    # after decoding rather than passed down.
+
+    def _decode_result(
+        self, result: PluginAnalysisResult, fields: Optional[Sequence[str]] = None
+    ) -> PluginAnalysisResult:
+        if not is_encoded(result.result) and fields is None:
+            return result
+        return dataclasses.replace(
+            result, result=project_fields(decode_payload(result.result), fields)
+        )
+
+    def _decode_data(
+        self, data: DesignData, fields: Optional[Sequence[str]] = None
+    ) -> DesignData:
+        if not is_encoded(data.data) and fields is None:
+            return data
+        base_version, _ = split_schema_version(data.schema_version)
+        return dataclasses.replace(
+            data,
+            data=project_fields(decode_payload(data.data), fields),
+            schema_version=base_version,
+        )
+
+    async def save_experiment_data(
+        self,
+        experiment_id: int,
+        plugin_id: str,
+        data: dict[str, Any],
+        schema_version: str = "1.0",
+    ) -> DesignData:
+        saved = await self._repo.save_experiment_data(
+            experiment_id,
+            plugin_id,
+            encode_payload(data, self.codec, self.compression),
+            schema_version=codec_schema_version(schema_version, self.codec),
+        )
+        return self._decode_data(saved)
+
+    async def get_experiment_data(
+        self, experiment_id: int, fields: Optional[Sequence[str]] = None
+    ) -> Optional[DesignData]:
+        data = await self._repo.get_experiment_data(experiment_id)
+        return self._decode_data(data, fields) if data is not None else None
+
+    async def patch_experiment_data(
+        self,
+        experiment_id: int,
+        plugin_id: str,
+        patch: Patch,
+        *,
+        patch_format: PatchFormat = "merge-patch",
+        if_updated_at: Optional[datetime] = None,
+    ) -> DesignData:
+        """Decode, patch and re-encode experiment data.
+
+        The underlying repository only sees the opaque envelope, so its own
+        patch method cannot be used. The precondition check is not atomic
+        with the write.
+        """
+        current = await self.get_experiment_data(experiment_id)
+        if current is None:
+            raise NotFoundException(
+                "Experiment data not found",
+                entity="experiment_data",
+                entity_id=str(experiment_id),
+            )
+        _check_precondition("experiment_data", current.updated_at, if_updated_at)
+        return await self.save_experiment_data(
+            experiment_id,
+            plugin_id,
+            apply_patch(current.data, patch, patch_format),
+            schema_version=current.schema_version,
+        )
+
+    async def save_analysis_result(
+        self, experiment_id: int, plugin_id: str, result: dict[str, Any]
+    ) -> PluginAnalysisResult:
+        saved = await self._repo.save_analysis_result(
+            experiment_id, plugin_id, encode_payload(result, self.codec, self.compression)
+        )
+        return self._decode_result(saved)
+
+    async def patch_analysis_result(
+        self,
+        experiment_id: int,
+        plugin_id: str,
+        patch: Patch,
+        *,
+        patch_format: PatchFormat = "merge-patch",
+        if_updated_at: Optional[datetime] = None,
+    ) -> PluginAnalysisResult:
+        """Decode, patch and re-encode an analysis result; see ``patch_experiment_data``."""
+        current = await self.get_analysis_result(experiment_id, plugin_id)
+        if current is None:
+            raise NotFoundException(
+                "Analysis result not found",
+                entity="analysis_result",
+                entity_id=f"{experiment_id}/{plugin_id}",
+            )
+        _check_precondition("analysis_result", current.updated_at, if_updated_at)
+        return await self.save_analysis_result(
+            experiment_id, plugin_id, apply_patch(current.result, patch, patch_format)
+        )
+
+    async def get_analysis_result(
+        self, experiment_id: int, plugin_id: str, fields: Optional[Sequence[str]] = None
+    ) -> Optional[PluginAnalysisResult]:
+        result = await self._repo.get_analysis_result(experiment_id, plugin_id)
+        return self._decode_result(result, fields) if result is not None else None
+
+    async def get_analysis_results(
+        self, experiment_id: int, fields: Optional[Sequence[str]] = None
+    ) -> list[PluginAnalysisResult]:
+        results = await self._repo.get_analysis_results(experiment_id)
+        return [self._decode_result(r, fields) for r in results]
+
+    async def get_many_analysis_results(
+        self,
+        experiment_ids: Sequence[int],
+        plugin_id: str,
+        fields: Optional[Sequence[str]] = None,
+    ) -> dict[int, PluginAnalysisResult]:
+        results = await get_many_analysis_results(self._repo, experiment_ids, plugin_id)
+        return {eid: self._decode_result(r, fields) for eid, r in results.items()}
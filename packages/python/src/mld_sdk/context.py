@@ -7,7 +7,7 @@ which provides access to platform services like auth, experiments, etc.
 
 from abc import ABC, abstractmethod
 from contextlib import asynccontextmanager
-from typing import Any, AsyncGenerator, Callable, Optional
+from typing import TYPE_CHECKING, Any, AsyncGenerator, Callable, Optional
 
 from mld_sdk.repositories import (
     ExperimentRepository,
@@ -17,6 +17,9 @@ from mld_sdk.repositories import (
     UserRepository,
 )
 
+if TYPE_CHECKING:
+    from mld_sdk.blobs import BlobStore
+
 
 class PlatformContext(ABC):
     """
@@ -73,7 +76,9 @@ class PlatformContext(ABC):
     def require_plugin_role(self, *allowed_roles: str) -> Any:
         """Return a FastAPI Depends() that checks plugin role for current plugin.
 
-        Platform admins automatically bypass plugin role checks.
+        Platform admins automatically bypass plugin role checks. Implementations
+        can resolve roles through ``CachedPluginRoleRepository`` to avoid a
+        database lookup per request.
 
         Usage::
 
@@ -82,6 +87,22 @@ class PlatformContext(ABC):
                 ...
         """
 
+    def get_blob_store(self) -> Optional["BlobStore"]:
+        """Get the platform's content-addressed blob store, if it provides one.
+
+        Used for offloading large analysis result values. Returns None by
+        default, in which case plugins fall back to a local store.
+        """
+        return None
+
+    def get_supported_codecs(self) -> list[str]:
+        """Payload codecs the platform can store, in addition to plain JSON.
+
+        ``mld_sdk.codec.CodecRepository.for_context`` picks the best codec
+        both sides support. Returns ``["json"]`` by default.
+        """
+        return ["json"]
+
     @abstractmethod
     def get_config(self) -> PlatformConfig:
         """Get platform configuration."""
@@ -0,0 +1,257 @@
+"""
+Cached, deadline-bounded health aggregation.
+
+Load balancers poll health every few seconds. If each poll calls every
+plugin's ``check_health()``, a slow database or R process makes the probe
+slow and multiplies load. ``HealthAggregator`` instead checks all plugins
+concurrently on a schedule in the background, and probes read the cached
+results without awaiting anything.
+
+A check that exceeds its deadline is reported as ``DEGRADED`` (configurable),
+one that raises as ``UNKNOWN``, and a cached result older than ``stale_after``
+as ``UNKNOWN``. The last ``history_size`` results per plugin are kept with
+their latencies.
+
+Usage::
+
+    from mld_sdk import HealthAggregator
+
+    health = HealthAggregator.for_host(host, interval=10.0, timeout=2.0)
+    await health.start()
+
+    @app.get("/health")
+    def probe():
+        return health.to_dict()              # never waits on a plugin
+
+    health.stats("peak-picker").p95_seconds
+    await health.stop()
+"""
+
+import asyncio
+import math
+import time
+from collections import deque
+from dataclasses import asdict, dataclass
+from datetime import datetime, timezone
+from typing import TYPE_CHECKING, Any, Optional
+
+from mld_sdk.exceptions import NotFoundException
+from mld_sdk.hooks import PluginSource
+from mld_sdk.plugin import AnalysisPlugin, HealthStatus, PluginHealth
+from mld_sdk.singleflight import SingleFlight
+
+if TYPE_CHECKING:
+    from mld_sdk.host import PluginHost
+
+# Worst status wins when aggregating
+_SEVERITY = {
+    HealthStatus.HEALTHY: 0,
+    HealthStatus.DEGRADED: 1,
+    HealthStatus.UNKNOWN: 2,
+    HealthStatus.UNHEALTHY: 3,
+}
+
+
+@dataclass(slots=True)
+class HealthSample:
+    """One ``check_health()`` result with the time it took."""
+
+    health: PluginHealth
+    latency_seconds: float
+    timed_out: bool = False
+
+
+@dataclass(slots=True)
+class HealthStats:
+    """Latency and outcome statistics over a plugin's recent checks."""
+
+    samples: int = 0
+    unhealthy: int = 0
+    timeouts: int = 0
+    last_seconds: float = 0.0
+    min_seconds: float = 0.0
+    mean_seconds: float = 0.0
+    p50_seconds: float = 0.0
+    p95_seconds: float = 0.0
+    max_seconds: float = 0.0
+
+    def to_dict(self) -> dict[str, Any]:
+        return asdict(self)
+
+
+def _percentile(ordered: list[float], fraction: float) -> float:
+    """Nearest-rank percentile of an already sorted list."""
+    index = max(0, min(len(ordered) - 1, math.ceil(fraction * len(ordered)) - 1))
+    return ordered[index]
+
+
+class HealthAggregator:
+    """Refreshes plugin health in the background and serves cached results.
+
+    Args:
+        plugins: Plugins to check, or a callable returning them (called on
+            every refresh, so plugins loaded later are included).
+        interval: Seconds between background refreshes.
+        timeout: Deadline in seconds for each ``check_health()`` call.
+        timeout_status: Status reported for a check that times out.
+        history_size: Number of recent samples kept per plugin.
+        stale_after: Age in seconds after which a cached result is reported
+            as ``UNKNOWN``; defaults to three intervals.
+    """
+
+    def __init__(
+        self,
+        plugins: PluginSource,
+        interval: float = 10.0,
+        timeout: float = 2.0,
+        timeout_status: HealthStatus = HealthStatus.DEGRADED,
+        history_size: int = 60,
+        stale_after: Optional[float] = None,
+    ):
+        self._plugins = plugins
+        self.interval = interval
+        self.timeout = timeout
+        self.timeout_status = timeout_status
+        self.history_size = history_size
+        self.stale_after = stale_after if stale_after is not None else 3 * interval
+        self._history: dict[str, deque[HealthSample]] = {}
+        self._checked: dict[str, float] = {}  # monotonic time of the latest sample
+        self._flight = SingleFlight()
+        self._task: Optional[asyncio.Task] = None
+
+    @classmethod
+    def for_host(cls, host: "PluginHost", **options: Any) -> "HealthAggregator":
+        """Check the host's ready plugins."""
+        return cls(lambda: host.plugins.values(), **options)
+
+    def _current_plugins(self) -> list[AnalysisPlugin]:
+        plugins = self._plugins() if callable(self._plugins) else self._plugins
+        return list(plugins)
+
+    async def _check(self, plugin: AnalysisPlugin) -> HealthSample:
+        started = time.perf_counter()
+        try:
+            health = await asyncio.wait_for(plugin.check_health(), self.timeout)
+        except asyncio.TimeoutError:
+            health = PluginHealth(
+                status=self.timeout_status,
+                message=f"check_health() exceeded {self.timeout}s",
+            )
+            return HealthSample(health, time.perf_counter() - started, timed_out=True)
+        except Exception as e:
+            health = PluginHealth(
+                status=HealthStatus.UNKNOWN, message=f"check_health() failed: {e!r}"
+            )
+        return HealthSample(health, time.perf_counter() - started)
+
+    async def _refresh_one(self, plugin: AnalysisPlugin) -> PluginHealth:
+        name = plugin.metadata.name
+        # A check still running from the last refresh is shared, not repeated
+        sample = await self._flight.do(name, lambda: self._check(plugin))
+        history = self._history.get(name)
+        if history is None:
+            history = self._history[name] = deque(maxlen=self.history_size)
+        if not history or history[-1] is not sample:
+            history.append(sample)
+            self._checked[name] = time.monotonic()
+        return sample.health
+
+    async def refresh(self) -> dict[str, PluginHealth]:
+        """Check every plugin now, concurrently, and update the cache."""
+        plugins = self._current_plugins()
+        results = await asyncio.gather(*(self._refresh_one(p) for p in plugins))
+        return {p.metadata.name: health for p, health in zip(plugins, results)}
+
+    async def _run(self, delay: float) -> None:
+        await asyncio.sleep(delay)
+        while True:
+            started = time.monotonic()
+            try:
+                await self.refresh()
+            except Exception:
+                pass  # keep serving the last results; they go stale if this persists
+            await asyncio.sleep(max(0.0, self.interval - (time.monotonic() - started)))
+
+    async def start(self, refresh: bool = True) -> None:
+        """Start background refreshes; by default run the first one before returning."""
+        if self.running:
+            return
+        if refresh:
+            await self.refresh()
+        self._task = asyncio.ensure_future(self._run(self.interval if refresh else 0.0))
+
+    async def stop(self) -> None:
+        """Stop background refreshes. Cached results remain available."""
+        if self._task is None:
+            return
+        self._task.cancel()
+        await asyncio.gather(self._task, return_exceptions=True)
+        self._task = None
+
+    @property
+    def running(self) -> bool:
+        return self._task is not None and not self._task.done()
+
+    def get(self, name: str) -> PluginHealth:
+        """Cached health of one plugin; ``UNKNOWN`` if never checked or stale."""
+        history = self._history.get(name)
+        if not history:
+            return PluginHealth(status=HealthStatus.UNKNOWN, message="Not checked yet")
+        age = time.monotonic() - self._checked[name]
+        if age > self.stale_after:
+            return PluginHealth(
+                status=HealthStatus.UNKNOWN,
+                message=f"Last check was {age:.0f}s ago",
+                checked_at=history[-1].health.checked_at,
+            )
+        return history[-1].health
+
+    def snapshot(self) -> dict[str, PluginHealth]:
+        """Cached health of every current plugin, by name."""
+        return {p.metadata.name: self.get(p.metadata.name) for p in self._current_plugins()}
+
+    def overall(self) -> HealthStatus:
+        """Worst cached status across plugins (``HEALTHY`` if there are none)."""
+        return max(
+            (health.status for health in self.snapshot().values()),
+            key=_SEVERITY.__getitem__,
+            default=HealthStatus.HEALTHY,
+        )
+
+    def history(self, name: str) -> list[HealthSample]:
+        """Recent samples for a plugin, oldest first."""
+        return list(self._history.get(name, ()))
+
+    def stats(self, name: str) -> HealthStats:
+        """Latency and outcome statistics over a plugin's recent samples."""
+        history = self._history.get(name)
+        if not history:
+            raise NotFoundException(
+                f"No health samples for plugin '{name}'", entity="plugin", entity_id=name
+            )
+        latencies = sorted(sample.latency_seconds for sample in history)
+        return HealthStats(
+            samples=len(history),
+            unhealthy=sum(s.health.status != HealthStatus.HEALTHY for s in history),
+            timeouts=sum(s.timed_out for s in history),
+            last_seconds=history[-1].latency_seconds,
+            min_seconds=latencies[0],
+            mean_seconds=sum(latencies) / len(latencies),
+            p50_seconds=_percentile(latencies, 0.50),
+            p95_seconds=_percentile(latencies, 0.95),
+            max_seconds=latencies[-1],
+        )
+
+    def to_dict(self) -> dict[str, Any]:
+        """Cached report for a health endpoint."""
+        plugins = {}
+        for name, health in self.snapshot().items():
+            entry = health.to_dict()
+            if self._history.get(name):
+                entry["latency"] = self.stats(name).to_dict()
+            plugins[name] = entry
+        return {
+            "status": self.overall().value,
+            "checked_at": datetime.now(timezone.utc).isoformat(),
+            "plugins": plugins,
+        }
@@ -0,0 +1,302 @@
+"""
+Concurrent lifecycle hook dispatch.
+
+Calling every plugin's hooks one after another puts the sum of all of them on
+the experiment save path. ``HookDispatcher`` runs ``on_before_experiment_save``
+across plugins concurrently with a per-hook deadline, and stops at the first
+plugin that rejects the save. ``on_after_experiment_save`` and
+``on_experiment_status_change`` only notify plugins, so they are queued and
+run by background workers instead of delaying the response.
+
+Usage::
+
+    from mld_sdk import HookDispatcher
+
+    hooks = HookDispatcher.for_host(host, timeout=2.0)
+    await hooks.start()
+
+    result = await hooks.before_experiment_save(experiment_id, data)
+    if not result.success:
+        raise ValidationException(result.message, field=result.failed.plugin_name)
+    await save(experiment_id, data)
+    hooks.after_experiment_save(experiment_id, data)   # returns immediately
+
+    await hooks.stop()
+"""
+
+import asyncio
+import time
+from collections import deque
+from dataclasses import dataclass, field
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Awaitable,
+    Callable,
+    Iterable,
+    Literal,
+    Optional,
+    Union,
+)
+
+from mld_sdk.plugin import AnalysisPlugin, LifecycleHookResult
+
+if TYPE_CHECKING:
+    from mld_sdk.host import PluginHost
+
+HookStatus = Literal["ok", "failed", "error", "timeout", "cancelled"]
+
+PluginSource = Union[Iterable[AnalysisPlugin], Callable[[], Iterable[AnalysisPlugin]]]
+
+
+@dataclass(slots=True)
+class HookOutcome:
+    """Outcome of one plugin's hook call. ``seconds`` is the time it ran."""
+
+    plugin_name: str
+    hook: str
+    status: HookStatus
+    seconds: float = 0.0
+    result: Optional[LifecycleHookResult] = None
+    error: Optional[str] = None
+
+
+@dataclass(slots=True)
+class HookDispatchResult:
+    """Combined result of a ``before`` hook across plugins.
+
+    ``failed`` is the first outcome that rejected the save, if any; hooks
+    still running at that point are cancelled.
+    """
+
+    success: bool = True
+    failed: Optional[HookOutcome] = None
+    outcomes: list[HookOutcome] = field(default_factory=list)
+
+    @property
+    def message(self) -> Optional[str]:
+        if self.failed is None:
+            return None
+        if self.failed.result is not None and self.failed.result.message:
+            detail = self.failed.result.message
+        else:
+            detail = self.failed.error or self.failed.status
+        return f"{self.failed.plugin_name}: {detail}"
+
+
+@dataclass(slots=True)
+class _Job:
+    plugin: AnalysisPlugin
+    hook: str
+    args: tuple[Any, ...]
+
+
+class HookDispatcher:
+    """Runs plugin lifecycle hooks concurrently with per-hook deadlines.
+
+    Args:
+        plugins: Plugins to dispatch to, or a callable returning them (called
+            on every dispatch, so plugins loaded later are included).
+        timeout: Deadline in seconds for each ``on_before_*`` call.
+        fail_on_timeout: Treat a ``before`` hook exceeding ``timeout`` as a
+            rejection; otherwise it is recorded and ignored.
+        background_timeout: Deadline for each queued ``on_after_*`` /
+            status-change call.
+        workers: Number of background worker tasks.
+        max_queue: Queue capacity; notifications beyond it are dropped.
+    """
+
+    def __init__(
+        self,
+        plugins: PluginSource,
+        timeout: Optional[float] = 5.0,
+        fail_on_timeout: bool = True,
+        background_timeout: Optional[float] = 30.0,
+        workers: int = 4,
+        max_queue: int = 1000,
+    ):
+        self._plugins = plugins
+        self.timeout = timeout
+        self.fail_on_timeout = fail_on_timeout
+        self.background_timeout = background_timeout
+        self.workers = workers
+        self._queue: asyncio.Queue[_Job] = asyncio.Queue(maxsize=max_queue)
+        self._workers: list[asyncio.Task] = []
+        self._stats = {"queued": 0, "processed": 0, "failed": 0, "timed_out": 0, "dropped": 0}
+        self.recent_failures: deque[HookOutcome] = deque(maxlen=100)
+
+    @classmethod
+    def for_host(cls, host: "PluginHost", **options: Any) -> "HookDispatcher":
+        """Dispatch to the host's ready plugins."""
+        return cls(lambda: host.plugins.values(), **options)
+
+    def _current_plugins(self) -> list[AnalysisPlugin]:
+        plugins = self._plugins() if callable(self._plugins) else self._plugins
+        return list(plugins)
+
+    async def _call(
+        self,
+        plugin: AnalysisPlugin,
+        hook: str,
+        args: tuple[Any, ...],
+        timeout: Optional[float],
+    ) -> HookOutcome:
+        name = plugin.metadata.name
+        started = time.perf_counter()
+        try:
+            result = await asyncio.wait_for(getattr(plugin, hook)(*args), timeout)
+        except asyncio.TimeoutError:
+            error = f"{hook}() exceeded {timeout}s"
+            return HookOutcome(name, hook, "timeout", time.perf_counter() - started, error=error)
+        except Exception as e:
+            error = f"{hook}() failed: {e!r}"
+            return HookOutcome(name, hook, "error", time.perf_counter() - started, error=error)
+        seconds = time.perf_counter() - started
+        if isinstance(result, LifecycleHookResult) and not result.success:
+            return HookOutcome(name, hook, "failed", seconds, result=result)
+        return HookOutcome(name, hook, "ok", seconds, result=result)
+
+    def _rejects(self, outcome: HookOutcome) -> bool:
+        if outcome.status == "timeout":
+            return self.fail_on_timeout
+        return outcome.status in ("failed", "error")
+
+    async def before_experiment_save(
+        self, experiment_id: int, data: dict[str, Any]
+    ) -> HookDispatchResult:
+        """Run ``on_before_experiment_save`` on all plugins concurrently.
+
+        Returns as soon as one plugin rejects the save (a failing
+        ``LifecycleHookResult``, an exception or, with ``fail_on_timeout``, a
+        timeout), cancelling the hooks still running. Plugins that do not
+        override the hook are skipped.
+        """
+        plugins = [
+            p
+            for p in self._current_plugins()
+            if type(p).on_before_experiment_save is not AnalysisPlugin.on_before_experiment_save
+        ]
+        result = HookDispatchResult()
+        if not plugins:
+            return result
+        hook = "on_before_experiment_save"
+        tasks = {
+            asyncio.ensure_future(self._call(p, hook, (experiment_id, data), self.timeout)): p
+            for p in plugins
+        }
+        try:
+            for next_done in asyncio.as_completed(tasks):
+                outcome = await next_done
+                result.outcomes.append(outcome)
+                if self._rejects(outcome):
+                    result.success = False
+                    result.failed = outcome
+                    break
+        finally:
+            pending = [task for task in tasks if not task.done()]
+            for task in pending:
+                task.cancel()
+            await asyncio.gather(*pending, return_exceptions=True)
+        for task in pending:
+            result.outcomes.append(HookOutcome(tasks[task].metadata.name, hook, "cancelled"))
+        return result
+
+    async def _run_now(self, hook: str, args: tuple[Any, ...]) -> list[HookOutcome]:
+        outcomes = await asyncio.gather(
+            *(self._call(p, hook, args, self.background_timeout) for p in self._current_plugins())
+        )
+        for outcome in outcomes:
+            self._record(outcome)
+        return list(outcomes)
+
+    def _enqueue(self, hook: str, args: tuple[Any, ...]) -> int:
+        self._ensure_workers()
+        queued = 0
+        for plugin in self._current_plugins():
+            try:
+                self._queue.put_nowait(_Job(plugin, hook, args))
+            except asyncio.QueueFull:
+                self._stats["dropped"] += 1
+                continue
+            self._stats["queued"] += 1
+            queued += 1
+        return queued
+
+    def after_experiment_save(
+        self, experiment_id: int, data: dict[str, Any], background: bool = True
+    ) -> Union[int, Awaitable[list[HookOutcome]]]:
+        """Notify plugins that an experiment was saved.
+
+        With ``background=True`` (default) the calls are queued and the number
+        of queued calls is returned immediately; otherwise an awaitable
+        running them concurrently is returned.
+        """
+        args = (experiment_id, dict(data))
+        if not background:
+            return self._run_now("on_after_experiment_save", args)
+        return self._enqueue("on_after_experiment_save", args)
+
+    def experiment_status_change(
+        self, experiment_id: int, old_status: str, new_status: str, background: bool = True
+    ) -> Union[int, Awaitable[list[HookOutcome]]]:
+        """Notify plugins of an experiment status change; see ``after_experiment_save``."""
+        args = (experiment_id, old_status, new_status)
+        if not background:
+            return self._run_now("on_experiment_status_change", args)
+        return self._enqueue("on_experiment_status_change", args)
+
+    def _record(self, outcome: HookOutcome) -> None:
+        self._stats["processed"] += 1
+        if outcome.status == "timeout":
+            self._stats["timed_out"] += 1
+        if outcome.status != "ok":
+            self._stats["failed"] += 1
+            self.recent_failures.append(outcome)
+
+    async def _worker(self) -> None:
+        while True:
+            job = await self._queue.get()
+            try:
+                self._record(
+                    await self._call(job.plugin, job.hook, job.args, self.background_timeout)
+                )
+            finally:
+                self._queue.task_done()
+
+    def _ensure_workers(self) -> None:
+        self._workers = [task for task in self._workers if not task.done()]
+        for _ in range(self.workers - len(self._workers)):
+            self._workers.append(asyncio.ensure_future(self._worker()))
+
+    async def start(self) -> None:
+        """Start the background workers (also done on the first notification)."""
+        self._ensure_workers()
+
+    async def drain(self) -> None:
+        """Wait until every queued notification has run."""
+        await self._queue.join()
+
+    async def stop(self, timeout: Optional[float] = 10.0) -> int:
+        """Drain the queue for up to ``timeout`` seconds, then stop the workers.
+
+        Returns the number of queued notifications that were discarded.
+        """
+        if self._workers:
+            try:
+                await asyncio.wait_for(self._queue.join(), timeout)
+            except asyncio.TimeoutError:
+                pass
+        for task in self._workers:
+            task.cancel()
+        await asyncio.gather(*self._workers, return_exceptions=True)
+        self._workers = []
+        discarded = 0
+        while not self._queue.empty():
+            self._queue.get_nowait()
+            self._queue.task_done()
+            discarded += 1
+        return discarded
+
+    def stats(self) -> dict[str, int]:
+        """Background counters plus the current queue depth."""
+        return {**self._stats, "pending": self._queue.qsize()}
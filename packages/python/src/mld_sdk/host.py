@@ -0,0 +1,527 @@
+"""
+Concurrent plugin host.
+
+Starting plugins one after another makes platform startup as slow as the sum
+of every ``initialize()``. ``PluginHost`` initializes all plugins
+concurrently, waiting only where a plugin declares a dependency on another,
+enforces a per-plugin timeout, and mounts each plugin's routers as soon as
+it is ready. Every plugin's startup is timed for diagnosis.
+
+Usage::
+
+    from fastapi import FastAPI
+    from mld_sdk import PluginHost
+
+    app = FastAPI()
+    host = PluginHost(context, app=app, timeout=30.0)
+    host.discover()                      # "mld.plugins" entry points
+    await host.start()
+    for startup in host.report():
+        print(startup.name, startup.status, startup.initialize_seconds)
+    ...
+    await host.shutdown()
+
+Plugins declare dependencies by overriding
+``AnalysisPlugin.get_plugin_dependencies()`` or via ``host.add(plugin,
+depends_on=[...])``. A plugin whose dependency fails is skipped.
+
+With ``discover(lazy=True)``, plugins that ship a static manifest (see
+``mld_sdk.manifest``) are registered from it without being imported. They
+are imported and initialized on the first request under their
+``routes_prefix`` - install ``LazyPluginMiddleware`` for that - or at
+startup if listed in ``warm_up``::
+
+    host = PluginHost(context, app=app, warm_up=["peak-picker"])
+    host.discover(lazy=True)
+    app.add_middleware(LazyPluginMiddleware, host=host)
+"""
+
+import asyncio
+import json
+import time
+from dataclasses import asdict, dataclass, field
+from importlib.metadata import entry_points
+from typing import Any, Callable, Iterable, Literal, Optional, Sequence
+
+from mld_sdk.context import PlatformContext
+from mld_sdk.exceptions import (
+    ConflictException,
+    PluginLifecycleException,
+    ValidationException,
+)
+from mld_sdk.manifest import find_plugin_manifest, metadata_from_manifest
+from mld_sdk.models import PluginMetadata
+from mld_sdk.plugin import AnalysisPlugin
+
+ENTRY_POINT_GROUP = "mld.plugins"
+
+StartupStatus = Literal["deferred", "pending", "ready", "failed", "timeout", "skipped"]
+
+
+@dataclass(slots=True)
+class PluginStartup:
+    """Startup record for one plugin. Times are in seconds.
+
+    ``started_at`` / ``finished_at`` are relative to the start of
+    ``PluginHost.start()``; ``wait_seconds`` is time spent waiting for
+    dependencies.
+    """
+
+    name: str
+    status: StartupStatus = "pending"
+    depends_on: list[str] = field(default_factory=list)
+    import_seconds: float = 0.0
+    wait_seconds: float = 0.0
+    initialize_seconds: float = 0.0
+    mount_seconds: float = 0.0
+    started_at: Optional[float] = None
+    finished_at: Optional[float] = None
+    error: Optional[str] = None
+
+    @property
+    def total_seconds(self) -> float:
+        return self.import_seconds + self.wait_seconds + self.initialize_seconds + self.mount_seconds
+
+    def to_dict(self) -> dict[str, Any]:
+        data = asdict(self)
+        data["total_seconds"] = self.total_seconds
+        return data
+
+
+@dataclass(slots=True)
+class _Entry:
+    plugin: Optional[AnalysisPlugin]
+    depends_on: list[str]
+    timeout: Optional[float]
+    startup: PluginStartup
+    done: asyncio.Event = field(default_factory=asyncio.Event)
+    # Deferred plugins: manifest metadata and a loader returning the plugin class
+    metadata: Optional[PluginMetadata] = None
+    loader: Optional[Callable[[], Any]] = None
+    lock: asyncio.Lock = field(default_factory=asyncio.Lock)
+
+
+class PluginHost:
+    """Discovers, concurrently initializes, mounts and shuts down plugins.
+
+    Args:
+        context: Platform context passed to ``initialize()`` (None = standalone).
+        app: Object with FastAPI's ``include_router(router, prefix=...)``
+            (a ``FastAPI`` app or ``APIRouter``); None to skip mounting.
+        timeout: Default per-plugin ``initialize()`` timeout (None = no limit).
+        warm_up: Names of deferred plugins to load during ``start()``.
+    """
+
+    def __init__(
+        self,
+        context: Optional[PlatformContext] = None,
+        app: Any = None,
+        timeout: Optional[float] = 30.0,
+        warm_up: Iterable[str] = (),
+    ):
+        self.context = context
+        self.app = app
+        self.timeout = timeout
+        self.warm_up = set(warm_up)
+        self._entries: dict[str, _Entry] = {}
+        self._clock = time.perf_counter
+        self._started_at: Optional[float] = None
+        self._starting: set[str] = set()
+
+    @property
+    def plugins(self) -> dict[str, AnalysisPlugin]:
+        """Plugins that initialized successfully, by name."""
+        return {
+            name: entry.plugin
+            for name, entry in self._entries.items()
+            if entry.startup.status == "ready" and entry.plugin is not None
+        }
+
+    def add(
+        self,
+        plugin: AnalysisPlugin,
+        depends_on: Optional[Sequence[str]] = None,
+        timeout: Optional[float] = None,
+        import_seconds: float = 0.0,
+    ) -> None:
+        """Register a plugin instance.
+
+        Args:
+            plugin: Plugin to host.
+            depends_on: Names of plugins that must be ready first; defaults to
+                ``plugin.get_plugin_dependencies()``.
+            timeout: Overrides the host's ``initialize()`` timeout.
+            import_seconds: Time spent importing/instantiating, for the report.
+        """
+        name = plugin.metadata.name
+        if name in self._entries:
+            raise ConflictException(
+                f"Plugin '{name}' is already registered",
+                entity="plugin",
+                conflict_field="name",
+            )
+        deps = list(depends_on if depends_on is not None else plugin.get_plugin_dependencies())
+        self._entries[name] = _Entry(
+            plugin=plugin,
+            depends_on=deps,
+            timeout=timeout if timeout is not None else self.timeout,
+            startup=PluginStartup(name=name, depends_on=deps, import_seconds=import_seconds),
+        )
+
+    def add_deferred(
+        self,
+        metadata: PluginMetadata,
+        loader: Callable[[], Any],
+        depends_on: Sequence[str] = (),
+        timeout: Optional[float] = None,
+    ) -> None:
+        """Register a plugin by metadata, importing it only when first needed.
+
+        Args:
+            metadata: Metadata from the plugin's manifest.
+            loader: Returns the plugin class (e.g. ``EntryPoint.load``).
+            depends_on: Names of plugins that must be ready first.
+            timeout: Overrides the host's ``initialize()`` timeout.
+        """
+        if metadata.name in self._entries:
+            raise ConflictException(
+                f"Plugin '{metadata.name}' is already registered",
+                entity="plugin",
+                conflict_field="name",
+            )
+        deps = list(depends_on)
+        self._entries[metadata.name] = _Entry(
+            plugin=None,
+            depends_on=deps,
+            timeout=timeout if timeout is not None else self.timeout,
+            startup=PluginStartup(name=metadata.name, status="deferred", depends_on=deps),
+            metadata=metadata,
+            loader=loader,
+        )
+
+    def discover(self, group: str = ENTRY_POINT_GROUP, lazy: bool = False) -> list[str]:
+        """Register plugins from entry points.
+
+        With ``lazy=True``, plugins that ship a manifest are registered
+        without importing them; the rest are imported as usual. Plugins that
+        fail to import, or whose manifest is invalid, are recorded as failed
+        in the report under their entry point name. Returns the names
+        registered.
+        """
+        names = []
+        for ep in entry_points(group=group):
+            started = self._clock()
+            failure = "import failed"
+            try:
+                if lazy:
+                    failure = "invalid manifest"
+                    manifest = find_plugin_manifest(ep)
+                    if manifest is not None:
+                        metadata = metadata_from_manifest(manifest)
+                        self.add_deferred(
+                            metadata, ep.load, depends_on=manifest.get("dependencies", ())
+                        )
+                        names.append(metadata.name)
+                        continue
+                    failure = "import failed"
+                plugin = ep.load()()
+                name = plugin.metadata.name
+            except ConflictException:
+                raise
+            except Exception as e:
+                self._entries[ep.name] = _Entry(
+                    plugin=None,
+                    depends_on=[],
+                    timeout=None,
+                    startup=PluginStartup(
+                        name=ep.name,
+                        status="failed",
+                        import_seconds=self._clock() - started,
+                        error=f"{failure}: {e!r}",
+                    ),
+                )
+                continue
+            self.add(plugin, import_seconds=self._clock() - started)
+            names.append(name)
+        return names
+
+    def _elapsed(self) -> float:
+        return self._clock() - (self._started_at or 0.0)
+
+    def _find_cycles(self) -> set[str]:
+        """Names of plugins on a dependency cycle."""
+        on_cycle: set[str] = set()
+        state: dict[str, int] = {}  # 1 = visiting, 2 = done
+        stack: list[str] = []
+
+        def visit(name: str) -> None:
+            state[name] = 1
+            stack.append(name)
+            for dep in self._entries[name].depends_on:
+                if dep not in self._entries:
+                    continue
+                if state.get(dep) == 1:
+                    on_cycle.update(stack[stack.index(dep) :])
+                elif dep not in state:
+                    visit(dep)
+            stack.pop()
+            state[name] = 2
+
+        for name in self._entries:
+            if name not in state:
+                visit(name)
+        return on_cycle
+
+    def _finish(self, entry: _Entry, status: StartupStatus, error: Optional[str] = None) -> None:
+        entry.startup.status = status
+        entry.startup.error = error
+        entry.startup.finished_at = self._elapsed()
+        entry.done.set()
+
+    def _mount(self, plugin: AnalysisPlugin) -> None:
+        if self.app is None:
+            return
+        prefix = plugin.metadata.routes_prefix.rstrip("/")
+        for router, suffix in plugin.get_routers():
+            self.app.include_router(router, prefix=f"{prefix}{suffix}")
+
+    async def _start_one(self, name: str, on_cycle: set[str]) -> None:
+        self._starting.add(name)
+        try:
+            await self._initialize_one(name, on_cycle)
+        finally:
+            self._starting.discard(name)
+
+    async def _initialize_one(self, name: str, on_cycle: set[str]) -> None:
+        entry = self._entries[name]
+        startup = entry.startup
+        if name in on_cycle:
+            self._finish(entry, "failed", "dependency cycle")
+            return
+        missing = [dep for dep in entry.depends_on if dep not in self._entries]
+        if missing:
+            self._finish(entry, "skipped", f"unknown dependencies: {', '.join(missing)}")
+            return
+
+        waited = self._clock()
+        await asyncio.gather(*(self._entries[dep].done.wait() for dep in entry.depends_on))
+        startup.wait_seconds = self._clock() - waited
+        not_ready = [d for d in entry.depends_on if self._entries[d].startup.status != "ready"]
+        if not_ready:
+            self._finish(entry, "skipped", f"dependencies not ready: {', '.join(not_ready)}")
+            return
+
+        assert entry.plugin is not None
+        startup.started_at = self._elapsed()
+        started = self._clock()
+        try:
+            await asyncio.wait_for(entry.plugin.initialize(self.context), entry.timeout)
+        except asyncio.TimeoutError:
+            startup.initialize_seconds = self._clock() - started
+            self._finish(entry, "timeout", f"initialize() exceeded {entry.timeout}s")
+            return
+        except Exception as e:
+            startup.initialize_seconds = self._clock() - started
+            self._finish(entry, "failed", f"initialize() failed: {e!r}")
+            return
+        startup.initialize_seconds = self._clock() - started
+
+        started = self._clock()
+        try:
+            self._mount(entry.plugin)
+        except Exception as e:
+            self._finish(entry, "failed", f"mounting routers failed: {e!r}")
+            return
+        startup.mount_seconds = self._clock() - started
+        self._finish(entry, "ready")
+
+    async def start(self, raise_on_failure: bool = False) -> list[PluginStartup]:
+        """Initialize every pending plugin concurrently; return the report.
+
+        Raises:
+            PluginLifecycleException: If ``raise_on_failure`` and any plugin
+                did not become ready.
+        """
+        self._started_at = self._clock()
+        # Deferred plugins needed now: warm-up ones and dependencies of eager ones
+        needed = {n for n, e in self._entries.items() if e.startup.status == "pending"}
+        needed |= self.warm_up & self._entries.keys()
+        needed = self._with_dependencies(needed)
+        await asyncio.gather(
+            *(self._import(self._entries[n]) for n in needed if self._is_deferred(n))
+        )
+        pending = [n for n in needed if self._entries[n].startup.status == "pending"]
+        on_cycle = self._find_cycles()
+        await asyncio.gather(*(self._start_one(name, on_cycle) for name in pending))
+        report = self.report()
+        failed = [s for s in report if s.status not in ("ready", "deferred")]
+        if raise_on_failure and failed:
+            raise PluginLifecycleException(
+                f"{len(failed)} plugin(s) failed to start: "
+                + ", ".join(f"{s.name} ({s.status})" for s in failed),
+                phase="initialize",
+                details={"plugins": {s.name: s.error for s in failed}},
+            )
+        return report
+
+    def _is_deferred(self, name: str) -> bool:
+        return self._entries[name].startup.status == "deferred"
+
+    def _with_dependencies(self, names: set[str]) -> set[str]:
+        result: set[str] = set()
+        stack = list(names)
+        while stack:
+            name = stack.pop()
+            if name in result or name not in self._entries:
+                continue
+            result.add(name)
+            stack.extend(self._entries[name].depends_on)
+        return result
+
+    async def _import(self, entry: _Entry) -> None:
+        """Import and instantiate a deferred plugin (in a worker thread)."""
+        assert entry.loader is not None and entry.metadata is not None
+        started = self._clock()
+        try:
+            plugin = (await asyncio.to_thread(entry.loader))()
+            if plugin.metadata.name != entry.metadata.name:
+                raise ValidationException(
+                    f"manifest name '{entry.metadata.name}' does not match "
+                    f"plugin name '{plugin.metadata.name}'",
+                    field="name",
+                )
+        except Exception as e:
+            entry.startup.import_seconds = self._clock() - started
+            self._finish(entry, "failed", f"import failed: {e!r}")
+            return
+        entry.startup.import_seconds = self._clock() - started
+        entry.plugin = plugin
+        entry.startup.status = "pending"
+
+    def deferred_prefixes(self) -> dict[str, str]:
+        """Routes prefixes of plugins not yet loaded, mapped to plugin names."""
+        return {
+            entry.metadata.routes_prefix.rstrip("/"): name
+            for name, entry in self._entries.items()
+            if entry.startup.status == "deferred" and entry.metadata is not None
+        }
+
+    async def ensure_loaded(self, name: str) -> AnalysisPlugin:
+        """Import, initialize and mount a plugin (and its dependencies) if needed.
+
+        Concurrent callers share one load. Raises ``PluginLifecycleException``
+        if the plugin cannot be made ready.
+        """
+        entry = self._entries.get(name)
+        if entry is None:
+            raise PluginLifecycleException(
+                f"Unknown plugin '{name}'", phase="initialize", plugin_name=name
+            )
+        if name in self._starting:
+            await entry.done.wait()
+        async with entry.lock:
+            if entry.startup.status in ("deferred", "pending"):
+                if self._started_at is None:
+                    self._started_at = self._clock()
+                on_cycle = self._find_cycles()
+                if name not in on_cycle:
+                    for dep in entry.depends_on:
+                        dep_entry = self._entries.get(dep)
+                        if dep_entry is not None and dep_entry.startup.status in (
+                            "deferred",
+                            "pending",
+                        ):
+                            try:
+                                await self.ensure_loaded(dep)
+                            except PluginLifecycleException:
+                                pass  # _start_one marks this plugin skipped
+                if entry.startup.status == "deferred":
+                    await self._import(entry)
+                if entry.startup.status == "pending" and name not in self._starting:
+                    await self._start_one(name, on_cycle)
+            if name in self._starting:
+                await entry.done.wait()
+        if entry.startup.status != "ready" or entry.plugin is None:
+            raise PluginLifecycleException(
+                f"Plugin '{name}' is not available ({entry.startup.status}): "
+                f"{entry.startup.error}",
+                phase="initialize",
+                plugin_name=name,
+            )
+        return entry.plugin
+
+    def report(self) -> list[PluginStartup]:
+        """Per-plugin startup records, in the order plugins finished."""
+        return sorted(
+            (entry.startup for entry in self._entries.values()),
+            key=lambda s: (s.finished_at is None, s.finished_at or 0.0),
+        )
+
+    async def shutdown(self, timeout: Optional[float] = 10.0) -> dict[str, str]:
+        """Shut down ready plugins, dependents before their dependencies.
+
+        Errors and timeouts are collected rather than raised; returns a
+        mapping of plugin name to error message for those that failed.
+        """
+        errors: dict[str, str] = {}
+        ready = [e for e in self._entries.values() if e.startup.status == "ready"]
+        for entry in sorted(ready, key=lambda e: e.startup.finished_at or 0.0, reverse=True):
+            assert entry.plugin is not None
+            try:
+                await asyncio.wait_for(entry.plugin.shutdown(), timeout)
+            except asyncio.TimeoutError:
+                errors[entry.startup.name] = f"shutdown() exceeded {timeout}s"
+            except Exception as e:
+                errors[entry.startup.name] = f"shutdown() failed: {e!r}"
+            entry.startup.status = "pending"
+            entry.done = asyncio.Event()
+        return errors
+
+
+class LazyPluginMiddleware:
+    """ASGI middleware loading deferred plugins on the first request to their prefix.
+
+    Add with ``app.add_middleware(LazyPluginMiddleware, host=host)``. Requests
+    for a plugin that fails to load get a 503 response. Once every deferred
+    plugin is loaded the middleware only costs a dict check per request.
+    """
+
+    def __init__(self, app: Any, host: PluginHost):
+        self.app = app
+        self.host = host
+
+    def _match(self, path: str) -> Optional[str]:
+        prefixes = self.host.deferred_prefixes()
+        if not prefixes:
+            return None
+        for prefix, name in prefixes.items():
+            if path == prefix or path.startswith(prefix + "/"):
+                return name
+        return None
+
+    async def __call__(self, scope: dict, receive: Callable, send: Callable) -> None:
+        if scope["type"] in ("http", "websocket"):
+            name = self._match(scope.get("path", ""))
+            if name is not None:
+                try:
+                    await self.host.ensure_loaded(name)
+                except PluginLifecycleException as e:
+                    if scope["type"] == "http":
+                        await self._unavailable(send, str(e))
+                        return
+        await self.app(scope, receive, send)
+
+    @staticmethod
+    async def _unavailable(send: Callable, message: str) -> None:
+        body = json.dumps({"detail": message}).encode()
+        await send(
+            {
+                "type": "http.response.start",
+                "status": 503,
+                "headers": [
+                    (b"content-type", b"application/json"),
+                    (b"content-length", str(len(body)).encode()),
+                ],
+            }
+        )
+        await send({"type": "http.response.body", "body": body})
@@ -10,16 +10,57 @@ SQLModel is an optional dependency. Install with:
 
 from __future__ import annotations
 
+import asyncio
+import dataclasses
+import functools
+import hashlib
+import json
+import re
+import threading
+import time
+import weakref
+from collections import OrderedDict
 from contextlib import asynccontextmanager, contextmanager
 from dataclasses import dataclass
+from datetime import datetime, timezone
+from itertools import islice
 from pathlib import Path
-from typing import TYPE_CHECKING, AsyncGenerator, Generator
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    AsyncGenerator,
+    AsyncIterator,
+    Awaitable,
+    Callable,
+    Generator,
+    Iterable,
+    Iterator,
+    Mapping,
+    Sequence,
+    TypeVar,
+)
+from urllib.parse import quote
 
 if TYPE_CHECKING:
-    from sqlalchemy import Engine
-    from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession
+    from sqlalchemy import Engine, Table
+    from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession, async_sessionmaker
     from sqlmodel import Session
 
+from mld_sdk._cache import TTLCache
+
+T = TypeVar("T")
+_KV_MISS = object()
+WriteUnit = Callable[["AsyncSession"], Awaitable[T]]
+
+# One strict codec for the key-value store, whatever happens to be installed:
+# NaN/Infinity and non-JSON types (datetime, set, ...) are rejected, and
+# non-string dict keys are converted to strings as JSON requires.
+_json_dumps = functools.partial(
+    json.dumps, separators=(",", ":"), ensure_ascii=False, allow_nan=False
+)
+_json_loads = json.loads
+_JSON_ENCODE_ERRORS = (TypeError, ValueError)
+
 _SQLMODEL_AVAILABLE = False
 try:
     from sqlmodel import SQLModel
@@ -40,13 +81,252 @@ def _require_sqlmodel() -> None:
         )
 
 
+# PRAGMA presets selectable through ``LocalDatabaseConfig.profile``.
+SQLITE_PROFILES: dict[str, dict[str, Any]] = {
+    "durable": {
+        "auto_vacuum": "INCREMENTAL",
+        "journal_mode": "WAL",
+        "synchronous": "FULL",
+        "busy_timeout": 5000,
+    },
+    "balanced": {
+        "auto_vacuum": "INCREMENTAL",
+        "journal_mode": "WAL",
+        "synchronous": "NORMAL",
+        "cache_size": -64_000,  # 64 MiB
+        "mmap_size": 256 * 1024 * 1024,
+        "temp_store": "MEMORY",
+        "busy_timeout": 5000,
+    },
+    "throughput": {
+        "auto_vacuum": "INCREMENTAL",
+        "journal_mode": "WAL",
+        "synchronous": "OFF",
+        "cache_size": -256_000,  # 256 MiB
+        "mmap_size": 1024 * 1024 * 1024,
+        "temp_store": "MEMORY",
+        "busy_timeout": 10000,
+    },
+}
+
+_PRAGMA_CHOICES: dict[str, frozenset[str]] = {
+    # auto_vacuum only takes effect before the first table is created.
+    "auto_vacuum": frozenset({"NONE", "FULL", "INCREMENTAL"}),
+    "journal_mode": frozenset({"DELETE", "TRUNCATE", "PERSIST", "MEMORY", "WAL", "OFF"}),
+    "synchronous": frozenset({"OFF", "NORMAL", "FULL", "EXTRA"}),
+    "temp_store": frozenset({"DEFAULT", "FILE", "MEMORY"}),
+}
+_INT_PRAGMAS = ("mmap_size", "cache_size", "busy_timeout")
+
+_SHARD_MODES = ("experiment", "hash")
+_SAFE_SHARD_NAME = re.compile(r"^[A-Za-z0-9_.-]{1,64}$")
+
+
 @dataclass(slots=True)
 class LocalDatabaseConfig:
-    """Configuration for a plugin's local database."""
+    """Configuration for a plugin's local database.
+
+    Pool settings apply to both the sync and the async (aiosqlite) engine.
+    With ``warm_up`` enabled, ``initialize()`` opens ``pool_size`` sync
+    connections up front; call ``LocalDatabase.warm_up()`` from async code
+    to do the same for the async pool.
+
+    ``profile`` selects a PRAGMA preset from ``SQLITE_PROFILES`` ("durable",
+    "balanced", "throughput"; None applies no preset). Any individual PRAGMA
+    field that is set overrides the preset value.
+
+    With ``serialize_writes`` enabled, ``LocalDatabase.run_write()`` hands
+    write units to a single writer task that commits up to
+    ``write_batch_size`` queued units per transaction.
+
+    The key-value API keeps up to ``kv_cache_size`` decoded-on-read entries
+    in a write-through LRU cache (0 disables it); ``kv_cache_ttl`` bounds
+    how long an entry is served without re-reading SQLite.
+
+    ``shard_by`` enables an experiment-sharded layout for plugin tables:
+    "experiment" gives every experiment its own SQLite file, "hash" spreads
+    experiments over ``shard_count`` bucket files. Shard files live in
+    ``<storage_dir>/shards/`` and at most ``max_open_shards`` idle ones are
+    kept open.
+
+    ``LocalDatabase.get_read_session()`` / ``get_async_read_session()`` use a
+    separate pool of read-only (``mode=ro``, ``query_only``) connections
+    sized by ``read_pool_size`` and ``read_max_overflow``.
+
+    With ``maintenance_interval`` set (seconds), a background task runs
+    ``wal_checkpoint(TRUNCATE)`` once the WAL reaches
+    ``checkpoint_wal_bytes``, ``PRAGMA optimize`` every
+    ``optimize_interval`` seconds and an incremental vacuum once
+    ``vacuum_free_pages`` pages are free. A tick is skipped while more than
+    ``maintenance_busy_connections`` connections are checked out.
+    """
 
     storage_dir: Path | None = None
     db_filename: str = "data.db"
     echo_sql: bool = False
+    # Connection pool
+    pool_size: int = 5
+    max_overflow: int = 10
+    pool_timeout: float = 30.0
+    pool_pre_ping: bool = False
+    warm_up: bool = False
+    # SQLite performance profile
+    profile: str | None = "balanced"
+    auto_vacuum: str | None = None
+    journal_mode: str | None = None
+    synchronous: str | None = None
+    mmap_size: int | None = None
+    cache_size: int | None = None
+    temp_store: str | None = None
+    busy_timeout: int | None = None
+    # Write serialization
+    serialize_writes: bool = False
+    write_batch_size: int = 100
+    # Key-value cache
+    kv_cache_size: int = 1024
+    kv_cache_ttl: float | None = None
+    # Read-only replica pool
+    read_pool_size: int = 10
+    read_max_overflow: int = 20
+    # Experiment sharding
+    shard_by: str | None = None
+    shard_count: int = 16
+    max_open_shards: int = 32
+    # Online maintenance
+    maintenance_interval: float | None = None
+    checkpoint_wal_bytes: int = 64 * 1024 * 1024
+    optimize_interval: float = 3600.0
+    vacuum_free_pages: int = 1000
+    maintenance_busy_connections: int = 2
+
+    def sqlite_pragmas(self) -> dict[str, Any]:
+        """Resolve the PRAGMAs to apply on every new connection.
+
+        Raises:
+            ConfigurationException: If the profile or a PRAGMA value is invalid.
+        """
+        from mld_sdk.exceptions import ConfigurationException
+
+        pragmas: dict[str, Any] = {}
+        if self.profile is not None:
+            if self.profile not in SQLITE_PROFILES:
+                raise ConfigurationException(
+                    f"Unknown SQLite profile '{self.profile}'. "
+                    f"Choose one of: {', '.join(SQLITE_PROFILES)}",
+                    config_key="profile",
+                )
+            pragmas.update(SQLITE_PROFILES[self.profile])
+
+        for name in (*_PRAGMA_CHOICES, *_INT_PRAGMAS):
+            value = getattr(self, name)
+            if value is not None:
+                pragmas[name] = value
+
+        for name, value in pragmas.items():
+            if name in _PRAGMA_CHOICES:
+                value = str(value).upper()
+                if value not in _PRAGMA_CHOICES[name]:
+                    raise ConfigurationException(
+                        f"Invalid value '{value}' for PRAGMA {name}",
+                        config_key=name,
+                    )
+                pragmas[name] = value
+            elif not isinstance(value, int):
+                raise ConfigurationException(
+                    f"PRAGMA {name} must be an integer, got {value!r}",
+                    config_key=name,
+                )
+        return pragmas
+
+
+# PRAGMAs that write to the database file; skipped on read-only connections.
+_WRITE_PRAGMAS = ("auto_vacuum", "journal_mode")
+
+
+def _pragma_listener(pragmas: dict[str, Any]):
+    """Build a ``connect`` event handler that applies ``pragmas``."""
+
+    def _apply(dbapi_connection: Any, _connection_record: Any) -> None:
+        cursor = dbapi_connection.cursor()
+        try:
+            for name, value in pragmas.items():
+                cursor.execute(f"PRAGMA {name}={value}")
+        finally:
+            cursor.close()
+
+    return _apply
+
+
+def _chunked(items: Iterable[T], size: int) -> Generator[list[T], None, None]:
+    iterator = iter(items)
+    while chunk := list(islice(iterator, size)):
+        yield chunk
+
+
+def _table_of(model: type) -> Any:
+    table = getattr(model, "__table__", None)
+    if table is None:
+        from mld_sdk.exceptions import ValidationException
+
+        raise ValidationException(
+            f"{getattr(model, '__name__', model)!r} is not a table model",
+            field="model",
+        )
+    return table
+
+
+def _upsert_statement(
+    model: type,
+    conflict_cols: Sequence[str],
+    update_cols: Sequence[str] | None,
+    sample_row: Mapping[str, Any],
+) -> Any:
+    from sqlalchemy.dialects.sqlite import insert
+
+    stmt = insert(_table_of(model))
+    if update_cols is None:
+        update_cols = [col for col in sample_row if col not in conflict_cols]
+    if not update_cols:
+        return stmt.on_conflict_do_nothing(index_elements=list(conflict_cols))
+    return stmt.on_conflict_do_update(
+        index_elements=list(conflict_cols),
+        set_={col: stmt.excluded[col] for col in update_cols},
+    )
+
+
+@functools.cache
+def _kv_table() -> Table:
+    """Backing table for the key-value API, kept out of ``SQLModel.metadata``."""
+    from sqlalchemy import Column, DateTime, MetaData, String, Table, Text, func
+
+    return Table(
+        "mld_kv_store",
+        MetaData(),
+        Column("namespace", String, primary_key=True),
+        Column("key", String, primary_key=True),
+        Column("value", Text, nullable=False),
+        Column("updated_at", DateTime, nullable=False, server_default=func.now()),
+        sqlite_with_rowid=False,
+    )
+
+
+def _encode_value(key: str, value: Any) -> str:
+    try:
+        return _json_dumps(value)
+    except _JSON_ENCODE_ERRORS as e:
+        from mld_sdk.exceptions import ValidationException
+
+        raise ValidationException(
+            f"Value for key '{key}' is not JSON-serializable: {e}",
+            field="value",
+        ) from e
+
+
+def _is_scalar_select(statement: Any) -> bool:
+    """Mirror ``Session.exec``: single-entity ``sqlmodel.select()`` yields scalars."""
+    from sqlmodel.sql.expression import SelectOfScalar
+
+    return isinstance(statement, SelectOfScalar)
 
 
 class LocalDatabase:
@@ -62,12 +342,42 @@ class LocalDatabase:
         self._config = config or LocalDatabaseConfig()
         self._engine: Engine | None = None
         self._async_engine: AsyncEngine | None = None
+        self._async_session_factory: async_sessionmaker[AsyncSession] | None = None
+        self._read_engine: Engine | None = None
+        self._async_read_engine: AsyncEngine | None = None
+        self._async_read_session_factory: async_sessionmaker[AsyncSession] | None = None
         self._initialized: bool = False
+        self._write_queue: asyncio.Queue[tuple[WriteUnit[Any], asyncio.Future[Any]]] | None = None
+        self._writer_task: asyncio.Task[None] | None = None
+        # (namespace, key) -> JSON text, or None for a known-absent key
+        self._kv_cache: TTLCache[tuple[str, str], str | None] = TTLCache(
+            maxsize=self._config.kv_cache_size, ttl=self._config.kv_cache_ttl
+        )
+        # Bumped on every KV write; reads that raced a write don't fill the cache
+        self._kv_writes = 0
+        self._kv_lock = threading.Lock()
+        self._models: list[type] | None = None
+        self._shards: OrderedDict[str, LocalDatabase] = OrderedDict()
+        # Every shard handle still referenced anywhere, open or evicted
+        self._shard_handles: weakref.WeakValueDictionary[str, LocalDatabase] = (
+            weakref.WeakValueDictionary()
+        )
+        self._shards_lock = threading.RLock()
+        # Set on shards: reopens an evicted shard on its next use
+        self._reopen: Callable[[], None] | None = None
+        self._maintenance_task: asyncio.Task[None] | None = None
+        self._maintenance_lock = threading.Lock()
+        self._last_optimize: float | None = None
+        self._maintenance_status: dict[str, Any] = {"runs": 0, "skipped_busy": 0}
 
     @property
     def is_initialized(self) -> bool:
         return self._initialized
 
+    @property
+    def config(self) -> LocalDatabaseConfig:
+        return self._config
+
     @property
     def db_path(self) -> Path:
         storage_dir = self._config.storage_dir
@@ -77,6 +387,12 @@ class LocalDatabase:
 
     @property
     def engine(self) -> Engine:
+        self._require_initialized()
+        return self._engine
+
+    def _require_initialized(self) -> None:
+        if not self._initialized and self._reopen is not None:
+            self._reopen()
         if not self._initialized:
             from mld_sdk.exceptions import ConfigurationException
 
@@ -84,7 +400,17 @@ class LocalDatabase:
                 "LocalDatabase not initialized. Call initialize() first.",
                 config_key="local_database",
             )
-        return self._engine
+
+    def _engine_kwargs(self, read_only: bool = False) -> dict[str, Any]:
+        return {
+            "echo": self._config.echo_sql,
+            "pool_size": self._config.read_pool_size if read_only else self._config.pool_size,
+            "max_overflow": (
+                self._config.read_max_overflow if read_only else self._config.max_overflow
+            ),
+            "pool_timeout": self._config.pool_timeout,
+            "pool_pre_ping": self._config.pool_pre_ping,
+        }
 
     def initialize(self, models: list[type] | None = None) -> None:
         """Create the database and tables.
@@ -93,14 +419,36 @@ class LocalDatabase:
             models: Optional list of SQLModel classes to create tables for.
         """
         _require_sqlmodel()
+        from sqlalchemy import URL, event
+        from sqlalchemy.ext.asyncio import AsyncSession as _AsyncSession
+        from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
         from sqlmodel import SQLModel as _SQLModel
         from sqlmodel import create_engine
 
+        pragmas = self._config.sqlite_pragmas()
+        if self._config.shard_by not in (None, *_SHARD_MODES):
+            from mld_sdk.exceptions import ConfigurationException
+
+            raise ConfigurationException(
+                f"Unknown shard_by '{self._config.shard_by}'. "
+                f"Choose one of: {', '.join(_SHARD_MODES)}",
+                config_key="shard_by",
+            )
+        self._models = list(models) if models else None
         self.db_path.parent.mkdir(parents=True, exist_ok=True)
 
         self._engine = create_engine(
-            f"sqlite:///{self.db_path}",
-            echo=self._config.echo_sql,
+            f"sqlite:///{self.db_path}", **self._engine_kwargs()
+        )
+        self._async_engine = create_async_engine(
+            f"sqlite+aiosqlite:///{self.db_path}", **self._engine_kwargs()
+        )
+        if pragmas:
+            listener = _pragma_listener(pragmas)
+            event.listen(self._engine, "connect", listener)
+            event.listen(self._async_engine.sync_engine, "connect", listener)
+        self._async_session_factory = async_sessionmaker(
+            self._async_engine, class_=_AsyncSession, expire_on_commit=False
         )
 
         if models:
@@ -112,23 +460,93 @@ class LocalDatabase:
                 _SQLModel.metadata.create_all(self._engine, tables=tables)
         else:
             _SQLModel.metadata.create_all(self._engine)
+        _kv_table().create(self._engine, checkfirst=True)
 
-        self._initialized = True
+        # Read-only replica pool; the file must exist before opening mode=ro.
+        # URL.create keeps the percent-encoding SQLite's URI parser expects.
+        ro_database = f"file:{quote(str(self.db_path))}"
+        ro_query = {"mode": "ro", "uri": "true"}
+        self._read_engine = create_engine(
+            URL.create("sqlite", database=ro_database, query=ro_query),
+            **self._engine_kwargs(read_only=True),
+        )
+        self._async_read_engine = create_async_engine(
+            URL.create("sqlite+aiosqlite", database=ro_database, query=ro_query),
+            **self._engine_kwargs(read_only=True),
+        )
+        read_listener = _pragma_listener(
+            {
+                **{k: v for k, v in pragmas.items() if k not in _WRITE_PRAGMAS},
+                "query_only": "ON",
+            }
+        )
+        event.listen(self._read_engine, "connect", read_listener)
+        event.listen(self._async_read_engine.sync_engine, "connect", read_listener)
+        self._async_read_session_factory = async_sessionmaker(
+            self._async_read_engine, class_=_AsyncSession, expire_on_commit=False
+        )
 
-    def close(self) -> None:
-        if self._engine is not None:
-            self._engine.dispose()
-            self._engine = None
-        if self._async_engine is not None:
-            # async engine disposal is sync-safe in SQLAlchemy
-            import asyncio
+        if self._config.warm_up:
+            self._warm_up_sync()
 
+        self._initialized = True
+
+        if self._config.maintenance_interval is not None:
             try:
-                loop = asyncio.get_running_loop()
-                loop.create_task(self._async_engine.dispose())
+                asyncio.get_running_loop()
             except RuntimeError:
-                asyncio.run(self._async_engine.dispose())
-            self._async_engine = None
+                pass  # no event loop yet; call start_maintenance() later
+            else:
+                self.start_maintenance()
+
+    def _warm_up_sync(self) -> None:
+        connections = [
+            self._engine.connect() for _ in range(self._config.pool_size)
+        ]
+        for connection in connections:
+            connection.close()
+
+    async def warm_up(self) -> None:
+        """Pre-open ``pool_size`` connections on the async engine."""
+        self._require_initialized()
+        connections = [
+            await self._async_engine.connect() for _ in range(self._config.pool_size)
+        ]
+        for connection in connections:
+            await connection.close()
+
+    def close(self) -> None:
+        if self._maintenance_task is not None:
+            self._maintenance_task.cancel()
+            self._maintenance_task = None
+        with self._shards_lock:
+            shards = list(self._shards.values())
+            self._shards.clear()
+            for handle in self._shard_handles.values():
+                handle._reopen = None
+        for shard in shards:
+            shard.close()
+        if self._writer_task is not None:
+            self._writer_task.cancel()
+            self._writer_task = None
+        self._write_queue = None
+        for engine in (self._engine, self._read_engine):
+            if engine is not None:
+                engine.dispose()
+        for async_engine in (self._async_engine, self._async_read_engine):
+            if async_engine is not None:
+                # async engine disposal is sync-safe in SQLAlchemy
+                try:
+                    loop = asyncio.get_running_loop()
+                    loop.create_task(async_engine.dispose())
+                except RuntimeError:
+                    asyncio.run(async_engine.dispose())
+        self._engine = self._read_engine = None
+        self._async_engine = self._async_read_engine = None
+        self._async_session_factory = self._async_read_session_factory = None
+        with self._kv_lock:
+            self._kv_writes += 1
+            self._kv_cache.clear()
         self._initialized = False
 
     @contextmanager
@@ -140,27 +558,655 @@ class LocalDatabase:
         with Session(self.engine) as session:
             yield session
 
+    @contextmanager
+    def get_read_session(self) -> Generator[Session, None, None]:
+        """Get a sync SQLModel Session on the read-only connection pool."""
+        self._require_initialized()
+        from sqlmodel import Session
+
+        with Session(self._read_engine) as session:
+            yield session
+
+    @asynccontextmanager
+    async def get_async_read_session(self) -> AsyncGenerator[AsyncSession, None]:
+        """Get an async session on the read-only connection pool."""
+        self._require_initialized()
+        async with self._async_read_session_factory() as session:
+            yield session
+
     @asynccontextmanager
     async def get_async_session(self) -> AsyncGenerator[AsyncSession, None]:
         """Get an async SQLAlchemy session (uses aiosqlite)."""
-        if self._async_engine is None:
-            from sqlalchemy.ext.asyncio import create_async_engine
+        self._require_initialized()
+        async with self._async_session_factory() as session:
+            try:
+                yield session
+                await session.commit()
+            except Exception:
+                await session.rollback()
+                raise
+
+    # --- Serialized writes ---
+
+    async def run_write(self, work: WriteUnit[T]) -> T:
+        """Run a write unit of work and return its result.
+
+        ``work`` receives an ``AsyncSession`` and must not commit it. Without
+        ``serialize_writes`` the unit runs in its own transaction. With it, the
+        unit is queued for the single writer task, which group-commits batches
+        of units so concurrent requests never contend for SQLite's write lock.
+        If any unit in a batch fails, the batch is rolled back and each unit
+        is re-run in its own transaction, so units must only touch the
+        database.
+        """
+        self._require_initialized()
+        if not self._config.serialize_writes:
+            async with self._async_session_factory() as session:
+                async with session.begin():
+                    return await work(session)
+
+        loop = asyncio.get_running_loop()
+        if self._writer_task is None or self._writer_task.get_loop() is not loop:
+            self._write_queue = asyncio.Queue()
+            self._writer_task = loop.create_task(self._writer_loop(self._write_queue))
+
+        future: asyncio.Future[T] = loop.create_future()
+        await self._write_queue.put((work, future))
+        return await future
+
+    async def _writer_loop(
+        self, queue: asyncio.Queue[tuple[WriteUnit[Any], asyncio.Future[Any]]]
+    ) -> None:
+        batch: list[tuple[WriteUnit[Any], asyncio.Future[Any]]] = []
+        try:
+            while True:
+                batch = [await queue.get()]
+                while len(batch) < self._config.write_batch_size and not queue.empty():
+                    batch.append(queue.get_nowait())
+                await self._commit_batch(batch)
+                batch = []
+        except asyncio.CancelledError:
+            pending = batch + [queue.get_nowait() for _ in range(queue.qsize())]
+            for _, future in pending:
+                if not future.done():
+                    future.cancel()
+            raise
+
+    async def _commit_batch(
+        self, batch: list[tuple[WriteUnit[Any], asyncio.Future[Any]]]
+    ) -> None:
+        batch = [(work, future) for work, future in batch if not future.cancelled()]
+        if not batch:
+            return
+        try:
+            async with self._async_session_factory() as session:
+                async with session.begin():
+                    results = [await work(session) for work, _ in batch]
+        except Exception as exc:
+            if len(batch) == 1:
+                _, future = batch[0]
+                if not future.done():
+                    future.set_exception(exc)
+                return
+            # Isolate the failing unit(s): retry each on its own.
+            for item in batch:
+                await self._commit_batch([item])
+            return
+        for (_, future), result in zip(batch, results):
+            if not future.done():
+                future.set_result(result)
+
+    # --- Bulk writes ---
+
+    def bulk_insert(
+        self,
+        model: type,
+        rows: Iterable[Mapping[str, Any]],
+        chunk_size: int = 10_000,
+    ) -> int:
+        """Insert plain-dict rows into ``model``'s table without building ORM objects.
+
+        Rows are sent with ``executemany`` in chunks of ``chunk_size`` inside a
+        single transaction. Every row must have the same keys.
+
+        Returns:
+            Number of rows inserted.
+        """
+        from sqlalchemy import insert
+
+        stmt = insert(_table_of(model))
+        count = 0
+        with self.engine.begin() as conn:
+            for chunk in _chunked(rows, chunk_size):
+                conn.execute(stmt, chunk)
+                count += len(chunk)
+        return count
+
+    def bulk_upsert(
+        self,
+        model: type,
+        rows: Iterable[Mapping[str, Any]],
+        conflict_cols: Sequence[str],
+        update_cols: Sequence[str] | None = None,
+        chunk_size: int = 10_000,
+    ) -> int:
+        """Insert rows, updating existing ones on a ``conflict_cols`` clash.
 
-            self._async_engine = create_async_engine(
-                f"sqlite+aiosqlite:///{self.db_path}",
-                echo=self._config.echo_sql,
+        ``conflict_cols`` must match a primary key or unique index.
+        ``update_cols`` defaults to every non-conflict column of the rows; an
+        empty list turns the upsert into ``INSERT ... ON CONFLICT DO NOTHING``.
+
+        Returns:
+            Number of rows processed.
+        """
+        count = 0
+        with self.engine.begin() as conn:
+            stmt = None
+            for chunk in _chunked(rows, chunk_size):
+                if stmt is None:
+                    stmt = _upsert_statement(model, conflict_cols, update_cols, chunk[0])
+                conn.execute(stmt, chunk)
+                count += len(chunk)
+        return count
+
+    async def bulk_insert_async(
+        self,
+        model: type,
+        rows: Iterable[Mapping[str, Any]],
+        chunk_size: int = 10_000,
+    ) -> int:
+        """Async variant of ``bulk_insert()``.
+
+        ``rows`` is consumed one chunk at a time and each chunk is written as
+        its own ``run_write()`` unit, so a generator of millions of rows is
+        never held in memory. Unlike ``bulk_insert()`` the load is not one
+        transaction: if a chunk fails, the chunks before it stay committed.
+        """
+        from sqlalchemy import insert
+
+        stmt = insert(_table_of(model))
+        return await self._write_chunks(lambda chunk: stmt, rows, chunk_size)
+
+    async def bulk_upsert_async(
+        self,
+        model: type,
+        rows: Iterable[Mapping[str, Any]],
+        conflict_cols: Sequence[str],
+        update_cols: Sequence[str] | None = None,
+        chunk_size: int = 10_000,
+    ) -> int:
+        """Async variant of ``bulk_upsert()``; streams like ``bulk_insert_async()``."""
+        stmt = None
+
+        def statement(chunk: list[Mapping[str, Any]]) -> Any:
+            nonlocal stmt
+            if stmt is None:
+                stmt = _upsert_statement(model, conflict_cols, update_cols, chunk[0])
+            return stmt
+
+        return await self._write_chunks(statement, rows, chunk_size)
+
+    async def _write_chunks(
+        self,
+        statement: Callable[[list[Mapping[str, Any]]], Any],
+        rows: Iterable[Mapping[str, Any]],
+        chunk_size: int,
+    ) -> int:
+        count = 0
+        for chunk in _chunked(rows, chunk_size):
+            stmt = statement(chunk)
+
+            # Bind this chunk: run_write may re-run the unit after a batch failure
+            async def work(
+                session: AsyncSession, stmt: Any = stmt, chunk: list[Any] = chunk
+            ) -> None:
+                conn = await session.connection()
+                await conn.execute(stmt, chunk)
+
+            await self.run_write(work)
+            count += len(chunk)
+        return count
+
+    # --- Streaming reads ---
+
+    def stream(
+        self, statement: Any, batch_size: int = 1000, batches: bool = False
+    ) -> Iterator[Any]:
+        """Iterate over a query's results with bounded memory.
+
+        Rows are fetched ``batch_size`` at a time (``yield_per``) instead of
+        materializing the whole result set. Like ``Session.exec``, a
+        single-entity ``sqlmodel.select(Model)`` yields model instances.
+
+        Args:
+            statement: A select statement.
+            batch_size: Rows fetched from SQLite per round trip.
+            batches: Yield lists of up to ``batch_size`` rows instead of rows.
+        """
+        from sqlmodel import Session
+
+        with Session(self.engine) as session:
+            result = session.execute(
+                statement, execution_options={"yield_per": batch_size}
             )
+            if _is_scalar_select(statement):
+                result = result.scalars()
+            for partition in result.partitions():
+                if batches:
+                    yield partition
+                else:
+                    yield from partition
 
-        from sqlalchemy.ext.asyncio import AsyncSession as _AsyncSession
-        from sqlalchemy.orm import sessionmaker
+    async def stream_async(
+        self, statement: Any, batch_size: int = 1000, batches: bool = False
+    ) -> AsyncIterator[Any]:
+        """Async variant of ``stream()``, e.g. to feed a ``StreamingResponse``."""
+        self._require_initialized()
+        async with self._async_session_factory() as session:
+            result = await session.stream(
+                statement, execution_options={"yield_per": batch_size}
+            )
+            if _is_scalar_select(statement):
+                result = result.scalars()
+            async for partition in result.partitions():
+                if batches:
+                    yield partition
+                else:
+                    for row in partition:
+                        yield row
 
-        async_session = sessionmaker(
-            self._async_engine, class_=_AsyncSession, expire_on_commit=False
+    # --- Key-value API ---
+
+    def set(self, key: str, value: Any, namespace: str = "default") -> None:
+        """Store a JSON-serializable value."""
+        self.set_many({key: value}, namespace=namespace)
+
+    def set_many(self, items: Mapping[str, Any], namespace: str = "default") -> None:
+        """Store several values in one transaction."""
+        if not items:
+            return
+        from sqlalchemy import func
+        from sqlalchemy.dialects.sqlite import insert
+
+        encoded = {key: _encode_value(key, value) for key, value in items.items()}
+        writes = self._kv_writes
+        stmt = insert(_kv_table())
+        stmt = stmt.on_conflict_do_update(
+            index_elements=["namespace", "key"],
+            set_={"value": stmt.excluded.value, "updated_at": func.now()},
+        )
+        with self.engine.begin() as conn:
+            conn.execute(
+                stmt,
+                [
+                    {"namespace": namespace, "key": key, "value": text}
+                    for key, text in encoded.items()
+                ],
+            )
+        self._kv_cache_written(
+            writes, [((namespace, key), text) for key, text in encoded.items()]
+        )
+
+    def get(self, key: str, namespace: str = "default", default: Any = None) -> Any:
+        """Retrieve a value, or ``default`` if the key does not exist."""
+        return self.get_many([key], namespace=namespace).get(key, default)
+
+    def get_many(self, keys: Iterable[str], namespace: str = "default") -> dict[str, Any]:
+        """Retrieve several values; missing keys are omitted from the result."""
+        from sqlalchemy import select
+
+        found: dict[str, str] = {}
+        misses: list[str] = []
+        for key in dict.fromkeys(keys):
+            cached = self._kv_cache.get((namespace, key), _KV_MISS)
+            if cached is _KV_MISS:
+                misses.append(key)
+            elif cached is not None:
+                found[key] = cached
+
+        if misses:
+            table = _kv_table()
+            writes = self._kv_writes
+            fetched: dict[str, str] = {}
+            with self.engine.connect() as conn:
+                for chunk in _chunked(misses, 500):
+                    rows = conn.execute(
+                        select(table.c.key, table.c.value).where(
+                            table.c.namespace == namespace, table.c.key.in_(chunk)
+                        )
+                    )
+                    fetched.update(rows.all())
+            self._kv_cache_read(writes, [((namespace, key), fetched.get(key)) for key in misses])
+            found.update(fetched)
+
+        return {key: _json_loads(text) for key, text in found.items()}
+
+    def delete(self, key: str, namespace: str = "default") -> bool:
+        """Delete a key. Returns True if it existed."""
+        from sqlalchemy import delete
+
+        table = _kv_table()
+        writes = self._kv_writes
+        with self.engine.begin() as conn:
+            result = conn.execute(
+                delete(table).where(table.c.namespace == namespace, table.c.key == key)
+            )
+        self._kv_cache_written(writes, [((namespace, key), None)])
+        return result.rowcount > 0
+
+    def list_keys(self, namespace: str = "default") -> list[str]:
+        """List all keys in a namespace."""
+        from sqlalchemy import select
+
+        table = _kv_table()
+        with self.engine.connect() as conn:
+            return list(
+                conn.execute(
+                    select(table.c.key)
+                    .where(table.c.namespace == namespace)
+                    .order_by(table.c.key)
+                ).scalars()
+            )
+
+    def get_all(self, namespace: str = "default") -> dict[str, Any]:
+        """Get all key-value pairs in a namespace."""
+        from sqlalchemy import select
+
+        table = _kv_table()
+        writes = self._kv_writes
+        with self.engine.connect() as conn:
+            rows = conn.execute(
+                select(table.c.key, table.c.value)
+                .where(table.c.namespace == namespace)
+                .order_by(table.c.key)
+            ).all()
+        self._kv_cache_read(writes, [((namespace, key), text) for key, text in rows])
+        return {key: _json_loads(text) for key, text in rows}
+
+    def clear(self, namespace: str | None = None) -> int:
+        """Delete all entries in ``namespace`` (or every namespace if None).
+
+        Returns:
+            Number of entries deleted.
+        """
+        from sqlalchemy import delete
+
+        table = _kv_table()
+        stmt = delete(table)
+        if namespace is not None:
+            stmt = stmt.where(table.c.namespace == namespace)
+        with self.engine.begin() as conn:
+            result = conn.execute(stmt)
+        with self._kv_lock:
+            self._kv_writes += 1
+            if namespace is None:
+                self._kv_cache.clear()
+            else:
+                self._kv_cache.discard_where(lambda cache_key: cache_key[0] == namespace)
+        return result.rowcount
+
+    def _kv_cache_read(
+        self, writes: int, entries: list[tuple[tuple[str, str], str | None]]
+    ) -> None:
+        """Cache values read since generation ``writes`` unless a write landed meanwhile."""
+        with self._kv_lock:
+            if writes == self._kv_writes:
+                for cache_key, text in entries:
+                    self._kv_cache.set(cache_key, text)
+
+    def _kv_cache_written(
+        self, writes: int, entries: list[tuple[tuple[str, str], str | None]]
+    ) -> None:
+        """Cache values just written, or drop them if another write overlapped."""
+        with self._kv_lock:
+            self._kv_writes += 1
+            overlapped = self._kv_writes != writes + 1
+            for cache_key, text in entries:
+                if overlapped:
+                    self._kv_cache.pop(cache_key)
+                else:
+                    self._kv_cache.set(cache_key, text)
+
+    @property
+    def kv_cache_stats(self) -> dict[str, int]:
+        """Hit/miss counters of the key-value cache."""
+        return self._kv_cache.stats()
+
+    # --- Experiment sharding ---
+
+    @property
+    def shards_dir(self) -> Path:
+        return self.db_path.parent / "shards"
+
+    def _shard_name(self, experiment_id: int | str) -> str:
+        if self._config.shard_by is None:
+            from mld_sdk.exceptions import ConfigurationException
+
+            raise ConfigurationException(
+                "Sharding is disabled. Set LocalDatabaseConfig.shard_by.",
+                config_key="shard_by",
+            )
+        key = str(experiment_id)
+        digest = hashlib.sha1(key.encode()).hexdigest()
+        if self._config.shard_by == "hash":
+            return f"bucket-{int(digest, 16) % self._config.shard_count:04d}"
+        if _SAFE_SHARD_NAME.match(key) and not key.startswith("."):
+            return f"exp-{key}"
+        return f"exp-{digest}"
+
+    def shard_path(self, experiment_id: int | str) -> Path:
+        """Path of the SQLite file holding ``experiment_id``'s plugin tables."""
+        return self.shards_dir / f"{self._shard_name(experiment_id)}.db"
+
+    def shard(self, experiment_id: int | str) -> LocalDatabase:
+        """Return the (initialized) shard database for ``experiment_id``.
+
+        Shards share this database's configuration and models; use their
+        ``get_session()`` / ``get_async_session()`` etc. as usual. Opening a
+        shard beyond ``max_open_shards`` closes the least recently used idle
+        one; shards with checked-out connections or queued writes are never
+        evicted. A handle to an evicted shard reopens it on its next use.
+        """
+        self._require_initialized()
+        return self._open_shard(self._shard_name(experiment_id))
+
+    def _open_shard(self, name: str) -> LocalDatabase:
+        with self._shards_lock:
+            shard = self._shards.get(name)
+            if shard is not None and shard.is_initialized:
+                self._shards.move_to_end(name)
+                return shard
+            self._require_initialized()
+            shard = self._shard_handles.get(name)
+            if shard is None:
+                shard = LocalDatabase(
+                    self._plugin_name,
+                    dataclasses.replace(
+                        self._config,
+                        storage_dir=self.shards_dir,
+                        db_filename=f"{name}.db",
+                        shard_by=None,
+                        warm_up=False,
+                        maintenance_interval=None,
+                    ),
+                )
+                shard._reopen = functools.partial(self._open_shard, name)
+                self._shard_handles[name] = shard
+            shard.initialize(models=self._models)
+            self._shards[name] = shard
+            evicted = self._evict_idle_shards(keep=name)
+        for old in evicted:
+            old.close()
+        return shard
+
+    def _evict_idle_shards(self, keep: str) -> list[LocalDatabase]:
+        """Pop least recently used idle shards beyond ``max_open_shards``."""
+        excess = len(self._shards) - self._config.max_open_shards
+        evicted = []
+        for name, shard in list(self._shards.items()):
+            if excess <= 0:
+                break
+            if name == keep or shard._in_use():
+                continue
+            del self._shards[name]
+            evicted.append(shard)
+            excess -= 1
+        return evicted
+
+    def _connections_in_use(self) -> int:
+        return sum(
+            engine.pool.checkedout()
+            for engine in (
+                self._engine,
+                self._async_engine,
+                self._read_engine,
+                self._async_read_engine,
+            )
+            if engine is not None
         )
-        async with async_session() as session:
+
+    def _in_use(self) -> bool:
+        queued = self._write_queue.qsize() if self._write_queue is not None else 0
+        return queued > 0 or self._connections_in_use() > 0
+
+    def drop_shard(self, experiment_id: int | str) -> bool:
+        """Delete an experiment's shard file (``shard_by="experiment"`` only).
+
+        Returns:
+            True if a shard file was removed.
+        """
+        if self._config.shard_by != "experiment":
+            from mld_sdk.exceptions import ConfigurationException
+
+            raise ConfigurationException(
+                "drop_shard() requires shard_by='experiment'; hash buckets "
+                "hold several experiments.",
+                config_key="shard_by",
+            )
+        name = self._shard_name(experiment_id)
+        with self._shards_lock:
+            shard = self._shards.pop(name, None)
+            handle = self._shard_handles.pop(name, None)
+            if handle is not None:
+                handle._reopen = None
+        if shard is not None:
+            shard.close()
+        path = self.shard_path(experiment_id)
+        existed = path.exists()
+        for suffix in ("", "-wal", "-shm", "-journal"):
+            path.with_name(path.name + suffix).unlink(missing_ok=True)
+        return existed
+
+    # --- Online maintenance ---
+
+    def _is_busy(self) -> bool:
+        queued = self._write_queue.qsize() if self._write_queue is not None else 0
+        in_use = self._connections_in_use()
+        return queued > 0 or in_use > self._config.maintenance_busy_connections
+
+    def run_maintenance(self, force: bool = False) -> dict[str, Any]:
+        """Run the maintenance steps that are due, on this database and open shards.
+
+        Args:
+            force: Run every step regardless of thresholds and current load.
+
+        Returns:
+            A report of what was done; also kept for ``maintenance_status()``.
+        """
+        self._require_initialized()
+        if not force and self._is_busy():
+            self._maintenance_status["skipped_busy"] += 1
+            return {"skipped": "busy"}
+
+        with self._maintenance_lock:
+            report: dict[str, Any] = {
+                "checkpointed": False,
+                "optimized": False,
+                "vacuumed_pages": 0,
+            }
+            wal_path = self.db_path.with_name(self.db_path.name + "-wal")
+            wal_bytes = wal_path.stat().st_size if wal_path.exists() else 0
+            now = time.monotonic()
+            optimize_due = (
+                self._last_optimize is None
+                or now - self._last_optimize >= self._config.optimize_interval
+            )
+
+            with self.engine.connect() as conn:
+                auto_vacuum = conn.exec_driver_sql("PRAGMA auto_vacuum").scalar()
+                free_pages = conn.exec_driver_sql("PRAGMA freelist_count").scalar()
+                if auto_vacuum == 2 and free_pages and (
+                    force or free_pages >= self._config.vacuum_free_pages
+                ):
+                    # SQLite frees one page per step of this statement, and the
+                    # sqlite3 cursor steps it only once; executescript() runs it
+                    # to completion. Only PRAGMA reads ran, so no transaction is
+                    # open that its implicit COMMIT could end early.
+                    conn.connection.dbapi_connection.executescript(
+                        "PRAGMA incremental_vacuum;"
+                    )
+                    remaining = conn.exec_driver_sql("PRAGMA freelist_count").scalar()
+                    report["vacuumed_pages"] = free_pages - remaining
+                if force or optimize_due:
+                    conn.exec_driver_sql("PRAGMA optimize")
+                    self._last_optimize = now
+                    report["optimized"] = True
+                conn.commit()
+                # Checkpoint last so it also folds in the pages written above.
+                if force or wal_bytes >= self._config.checkpoint_wal_bytes:
+                    busy, _, _ = conn.exec_driver_sql(
+                        "PRAGMA wal_checkpoint(TRUNCATE)"
+                    ).one()
+                    report["checkpointed"] = busy == 0
+
+            report["wal_bytes"] = wal_bytes
+            report["free_pages"] = free_pages
+
+            with self._shards_lock:
+                shards = dict(self._shards)
+            if shards:
+                report["shards"] = {
+                    name: shard.run_maintenance(force=force)
+                    for name, shard in shards.items()
+                }
+
+            self._maintenance_status["runs"] += 1
+            self._maintenance_status["last_run_at"] = datetime.now(timezone.utc).isoformat()
+            self._maintenance_status["last_report"] = report
+            return report
+
+    def maintenance_status(self) -> dict[str, Any]:
+        """Maintenance counters and the last report, for health checks."""
+        return {
+            **self._maintenance_status,
+            "scheduled": self._maintenance_task is not None,
+        }
+
+    def start_maintenance(self) -> None:
+        """Start the background maintenance task on the running event loop.
+
+        Called automatically by ``initialize()`` when ``maintenance_interval``
+        is set and an event loop is running.
+        """
+        self._require_initialized()
+        if self._config.maintenance_interval is None:
+            from mld_sdk.exceptions import ConfigurationException
+
+            raise ConfigurationException(
+                "Set LocalDatabaseConfig.maintenance_interval to enable maintenance.",
+                config_key="maintenance_interval",
+            )
+        if self._maintenance_task is None or self._maintenance_task.done():
+            self._maintenance_task = asyncio.get_running_loop().create_task(
+                self._maintenance_loop()
+            )
+
+    async def _maintenance_loop(self) -> None:
+        while True:
+            await asyncio.sleep(self._config.maintenance_interval)
             try:
-                yield session
-                await session.commit()
-            except Exception:
-                await session.rollback()
+                await asyncio.to_thread(self.run_maintenance)
+            except asyncio.CancelledError:
                 raise
+            except Exception as e:
+                self._maintenance_status["last_error"] = str(e)
@@ -0,0 +1,125 @@
+"""
+Static plugin manifests for import-free discovery.
+
+Importing a plugin module to read its ``metadata`` drags in its whole
+scientific stack. A manifest is a small JSON file holding the same
+``PluginMetadata`` plus declared dependencies, which ``PluginHost`` can read
+without importing anything from the plugin::
+
+    {
+      "name": "peak-picker",
+      "version": "1.2.0",
+      "description": "Peak picking",
+      "analysis_type": "metabolomics",
+      "routes_prefix": "/peaks",
+      "dependencies": []
+    }
+
+The manifest is looked up as ``mld_plugin.json`` in the distribution's
+``.dist-info`` directory, then next to the entry point's module inside the
+package (ship it as package data). Generate it at build time with
+``write_plugin_manifest``::
+
+    python -c "from my_pkg.plugin import MyPlugin; \\
+        from mld_sdk.manifest import write_plugin_manifest; \\
+        write_plugin_manifest(MyPlugin(), 'src/my_pkg/mld_plugin.json')"
+"""
+
+import dataclasses
+import importlib.util
+import json
+from importlib.metadata import EntryPoint
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Optional
+
+from mld_sdk.exceptions import ValidationException
+from mld_sdk.models import PluginCapabilities, PluginMetadata, PluginType
+
+if TYPE_CHECKING:
+    from mld_sdk.plugin import AnalysisPlugin
+
+MANIFEST_FILENAME = "mld_plugin.json"
+MANIFEST_VERSION = 1
+
+_REQUIRED = ("name", "version", "description", "analysis_type", "routes_prefix")
+
+
+def plugin_manifest(plugin: "AnalysisPlugin") -> dict[str, Any]:
+    """Build the manifest dict for a plugin instance."""
+    metadata = plugin.metadata
+    manifest = dataclasses.asdict(metadata)
+    manifest["plugin_type"] = metadata.plugin_type.value
+    manifest["dependencies"] = list(plugin.get_plugin_dependencies())
+    manifest["manifest_version"] = MANIFEST_VERSION
+    return manifest
+
+
+def write_plugin_manifest(plugin: "AnalysisPlugin", path: Path | str) -> Path:
+    """Write ``plugin``'s manifest to ``path`` (a file or a directory)."""
+    path = Path(path)
+    if path.is_dir():
+        path = path / MANIFEST_FILENAME
+    path.write_text(json.dumps(plugin_manifest(plugin), indent=2) + "\n")
+    return path
+
+
+def metadata_from_manifest(manifest: dict[str, Any]) -> PluginMetadata:
+    """Build ``PluginMetadata`` from a manifest dict."""
+    missing = [key for key in _REQUIRED if not isinstance(manifest.get(key), str)]
+    if missing:
+        raise ValidationException(
+            f"Plugin manifest is missing {', '.join(missing)}",
+            field=missing[0],
+        )
+    fields = {f.name for f in dataclasses.fields(PluginMetadata)}
+    values = {key: value for key, value in manifest.items() if key in fields}
+    try:
+        values["plugin_type"] = PluginType(values.get("plugin_type", PluginType.ANALYSIS))
+        values["capabilities"] = PluginCapabilities(**values.get("capabilities", {}))
+    except (TypeError, ValueError) as e:
+        raise ValidationException(f"Invalid plugin manifest: {e}", field="manifest") from e
+    return PluginMetadata(**values)
+
+
+def _package_manifest(ep: EntryPoint) -> Optional[str]:
+    """Read the manifest next to the entry point's module without importing it."""
+    parts = ep.module.split(".")
+    try:
+        spec = importlib.util.find_spec(parts[0])
+    except (ImportError, ValueError):
+        return None
+    if spec is None or not spec.submodule_search_locations:
+        return None
+    for root in spec.submodule_search_locations:
+        directory = Path(root).joinpath(*parts[1:-1])
+        # Closest manifest wins, from the module's directory up to the package root
+        for candidate in [directory, *directory.parents][: len(parts) - 1]:
+            path = candidate / MANIFEST_FILENAME
+            if path.is_file():
+                return path.read_text()
+    return None
+
+
+def find_plugin_manifest(ep: EntryPoint) -> Optional[dict[str, Any]]:
+    """Return the manifest for an entry point, or None if it ships none.
+
+    Never imports the plugin module.
+    """
+    text = None
+    if ep.dist is not None:
+        text = ep.dist.read_text(MANIFEST_FILENAME)
+    if text is None:
+        text = _package_manifest(ep)
+    if text is None:
+        return None
+    try:
+        manifest = json.loads(text)
+    except json.JSONDecodeError as e:
+        raise ValidationException(
+            f"Invalid plugin manifest for '{ep.name}': {e}", field="manifest"
+        ) from e
+    if not isinstance(manifest, dict):
+        raise ValidationException(
+            f"Plugin manifest for '{ep.name}' must be an object", field="manifest"
+        )
+    return manifest
@@ -0,0 +1,61 @@
+"""
+Pagination helpers for repository scans.
+
+``iter_experiments`` walks every matching experiment without loading them
+all at once. It uses the platform's keyset ``iter_all``
+(``ExperimentKeysetRepository``) when available and falls back to offset
+paging over ``list_all`` on older platforms.
+"""
+
+from typing import Any, AsyncIterator, Literal, Optional
+
+from mld_sdk.repositories import Experiment, ExperimentRepository
+
+
+async def iter_experiments(
+    repo: ExperimentRepository,
+    *,
+    batch_size: int = 100,
+    order_by: Literal["id", "updated_at"] = "id",
+    status: Optional[str] = None,
+    experiment_type: Optional[str] = None,
+    project: Optional[str] = None,
+    created_by: Optional[int] = None,
+    parent_experiment_id: Optional[int] = None,
+    search: Optional[str] = None,
+) -> AsyncIterator[Experiment]:
+    """Yield every experiment matching the filters.
+
+    Example:
+        async for experiment in iter_experiments(repo, status="completed"):
+            ...
+
+    ``order_by`` is only honoured by platforms implementing ``iter_all``;
+    the offset fallback yields experiments in ``list_all``'s order.
+    """
+    filters: dict[str, Any] = {
+        "status": status,
+        "experiment_type": experiment_type,
+        "project": project,
+        "created_by": created_by,
+        "parent_experiment_id": parent_experiment_id,
+        "search": search,
+    }
+
+    iter_all = getattr(repo, "iter_all", None)
+    if iter_all is not None:
+        async for experiment in iter_all(
+            batch_size=batch_size, order_by=order_by, **filters
+        ):
+            yield experiment
+        return
+
+    # Page by the reported total, not by short pages: platforms may cap limit
+    skip = 0
+    while True:
+        page, total = await repo.list_all(skip=skip, limit=batch_size, **filters)
+        for experiment in page:
+            yield experiment
+        skip += len(page)
+        if not page or skip >= total:
+            return
@@ -0,0 +1,381 @@
+"""
+Partial updates for analysis results and experiment design data.
+
+Updating one field of a multi-megabyte result should not resend the whole
+document. This module computes minimal patches between two documents and
+applies them, in either format:
+
+- JSON Merge Patch (RFC 7386): a partial document; ``None`` deletes a key and
+  lists are replaced as a whole.
+- JSON Patch (RFC 6902): a list of ``add`` / ``remove`` / ``replace`` /
+  ``move`` / ``copy`` / ``test`` operations addressed by JSON Pointer.
+
+``patch_analysis_result`` / ``patch_experiment_data`` call the repository's
+native patch methods (``PluginDataPatchRepository``) when the platform provides
+them, and otherwise fall back to read-modify-write with the same
+``if_updated_at`` precondition check.
+
+Usage::
+
+    from mld_sdk import diff_merge_patch, patch_analysis_result
+
+    patch = diff_merge_patch(old.result, new_result)
+    await patch_analysis_result(
+        repo, experiment_id, "my-plugin", patch, if_updated_at=old.updated_at
+    )
+"""
+
+from datetime import datetime
+from typing import Any, Literal, Optional, Union
+
+from mld_sdk.exceptions import ConflictException, NotFoundException, ValidationException
+from mld_sdk.repositories import DesignData, PluginAnalysisResult, PluginDataRepository
+
+PatchFormat = Literal["merge-patch", "json-patch"]
+Patch = Union[dict[str, Any], list[dict[str, Any]]]
+
+_MISSING = object()
+
+
+# --- JSON Merge Patch (RFC 7386) ---
+
+
+def _null_member(value: Any, path: str) -> Optional[str]:
+    """Path of the first ``None`` member nested in ``value``'s dicts, if any."""
+    if not isinstance(value, dict):
+        return None
+    for key, member in value.items():
+        member_path = f"{path}.{key}"
+        if member is None:
+            return member_path
+        found = _null_member(member, member_path)
+        if found is not None:
+            return found
+    return None
+
+
+def diff_merge_patch(old: dict[str, Any], new: dict[str, Any]) -> dict[str, Any]:
+    """Compute the smallest merge patch turning ``old`` into ``new``.
+
+    Raises:
+        ValidationException: If ``new`` sets a key to ``None`` anywhere the
+            patch would carry it (including inside a newly added or replaced
+            dict), which a merge patch cannot express (use ``diff_json_patch``
+            instead).
+    """
+    patch: dict[str, Any] = {}
+    for key in old.keys() - new.keys():
+        patch[key] = None
+    for key, value in new.items():
+        if value is None:
+            if key not in old or old[key] is not None:
+                raise ValidationException(
+                    f"Merge patch cannot set '{key}' to null; use a JSON Patch",
+                    field=key,
+                )
+            continue
+        previous = old.get(key, _MISSING)
+        if isinstance(previous, dict) and isinstance(value, dict):
+            nested = diff_merge_patch(previous, value)
+            if nested:
+                patch[key] = nested
+        elif previous is _MISSING or previous != value or type(previous) is not type(value):
+            null_path = _null_member(value, key)
+            if null_path is not None:
+                raise ValidationException(
+                    f"Merge patch cannot set '{null_path}' to null; use a JSON Patch",
+                    field=null_path,
+                )
+            patch[key] = value
+    return patch
+
+
+def apply_merge_patch(target: Any, patch: Any) -> Any:
+    """Apply a merge patch, returning a new document.
+
+    Unchanged sub-documents are shared with ``target`` rather than copied.
+    """
+    if not isinstance(patch, dict):
+        return patch
+    result = dict(target) if isinstance(target, dict) else {}
+    for key, value in patch.items():
+        if value is None:
+            result.pop(key, None)
+        else:
+            result[key] = apply_merge_patch(result.get(key), value)
+    return result
+
+
+# --- JSON Patch (RFC 6902) ---
+
+
+def _escape(token: Union[str, int]) -> str:
+    return str(token).replace("~", "~0").replace("/", "~1")
+
+
+def _parse_pointer(pointer: str) -> list[str]:
+    if pointer == "":
+        return []
+    if not pointer.startswith("/"):
+        raise ValidationException(f"Invalid JSON pointer '{pointer}'", field="path")
+    return [t.replace("~1", "/").replace("~0", "~") for t in pointer[1:].split("/")]
+
+
+def diff_json_patch(old: Any, new: Any, path: str = "") -> list[dict[str, Any]]:
+    """Compute a minimal JSON Patch turning ``old`` into ``new``.
+
+    Dicts are compared key by key and lists index by index, so a change deep
+    inside a large document yields a single ``replace`` at that location.
+    """
+    if isinstance(old, dict) and isinstance(new, dict):
+        ops: list[dict[str, Any]] = []
+        for key in old:
+            if key not in new:
+                ops.append({"op": "remove", "path": f"{path}/{_escape(key)}"})
+        for key, value in new.items():
+            child = f"{path}/{_escape(key)}"
+            if key in old:
+                ops.extend(diff_json_patch(old[key], value, child))
+            else:
+                ops.append({"op": "add", "path": child, "value": value})
+        return ops
+    if isinstance(old, list) and isinstance(new, list):
+        ops = []
+        common = min(len(old), len(new))
+        for i in range(common):
+            ops.extend(diff_json_patch(old[i], new[i], f"{path}/{i}"))
+        # Remove from the end so earlier indices stay valid
+        for i in range(len(old) - 1, common - 1, -1):
+            ops.append({"op": "remove", "path": f"{path}/{i}"})
+        for i in range(common, len(new)):
+            ops.append({"op": "add", "path": f"{path}/{i}", "value": new[i]})
+        return ops
+    if old != new or type(old) is not type(new):
+        return [{"op": "replace", "path": path, "value": new}]
+    return []
+
+
+class _Patcher:
+    """Applies operations with copy-on-write along each touched path."""
+
+    def __init__(self, document: Any):
+        self.root = document
+        # Copies made by this patcher, keyed by id; holding them keeps ids unique
+        self._owned: dict[int, Any] = {}
+
+    def _own(self, container: Any) -> Any:
+        if id(container) in self._owned:
+            return container
+        copied = dict(container) if isinstance(container, dict) else list(container)
+        self._owned[id(copied)] = copied
+        return copied
+
+    def _index(self, container: list, token: str, allow_end: bool) -> int:
+        if token == "-" and allow_end:
+            return len(container)
+        if not token.isdigit() or (token != "0" and token.startswith("0")):
+            raise ValidationException(f"Invalid list index '{token}'", field="path")
+        index = int(token)
+        if index > len(container) or (index == len(container) and not allow_end):
+            raise ValidationException(f"List index {index} out of range", field="path")
+        return index
+
+    def get(self, tokens: list[str]) -> Any:
+        node = self.root
+        for token in tokens:
+            if isinstance(node, dict):
+                if token not in node:
+                    raise ValidationException(f"Path member '{token}' not found", field="path")
+                node = node[token]
+            elif isinstance(node, list):
+                node = node[self._index(node, token, allow_end=False)]
+            else:
+                raise ValidationException(f"Cannot traverse into '{token}'", field="path")
+        return node
+
+    def _parent(self, tokens: list[str]) -> Any:
+        """Return the (owned) parent container of ``tokens``."""
+        if not isinstance(self.root, (dict, list)):
+            raise ValidationException("Cannot traverse into a scalar document", field="path")
+        self.root = self._own(self.root)
+        node = self.root
+        for token in tokens[:-1]:
+            if isinstance(node, dict):
+                if token not in node:
+                    raise ValidationException(f"Path member '{token}' not found", field="path")
+                key: Any = token
+            elif isinstance(node, list):
+                key = self._index(node, token, allow_end=False)
+            else:
+                raise ValidationException(f"Cannot traverse into '{token}'", field="path")
+            if not isinstance(node[key], (dict, list)):
+                raise ValidationException(f"Cannot traverse into '{token}'", field="path")
+            node[key] = self._own(node[key])
+            node = node[key]
+        return node
+
+    def add(self, tokens: list[str], value: Any) -> None:
+        if not tokens:
+            self.root = value
+            return
+        parent, last = self._parent(tokens), tokens[-1]
+        if isinstance(parent, dict):
+            parent[last] = value
+        elif isinstance(parent, list):
+            parent.insert(self._index(parent, last, allow_end=True), value)
+        else:
+            raise ValidationException(f"Cannot add to '{last}'", field="path")
+
+    def remove(self, tokens: list[str]) -> Any:
+        if not tokens:
+            raise ValidationException("Cannot remove the document root", field="path")
+        parent, last = self._parent(tokens), tokens[-1]
+        if isinstance(parent, dict):
+            if last not in parent:
+                raise ValidationException(f"Path member '{last}' not found", field="path")
+            return parent.pop(last)
+        if isinstance(parent, list):
+            return parent.pop(self._index(parent, last, allow_end=False))
+        raise ValidationException(f"Cannot remove '{last}'", field="path")
+
+    def apply(self, operation: dict[str, Any]) -> None:
+        op = operation.get("op")
+        tokens = _parse_pointer(operation.get("path", ""))
+        if op in ("add", "replace", "test") and "value" not in operation:
+            raise ValidationException(f"'{op}' operation requires a value", field="value")
+        if op == "add":
+            self.add(tokens, operation["value"])
+        elif op == "remove":
+            self.remove(tokens)
+        elif op == "replace":
+            self.get(tokens)
+            if tokens:
+                self.remove(tokens)
+            self.add(tokens, operation["value"])
+        elif op in ("move", "copy"):
+            source = _parse_pointer(operation.get("from", ""))
+            if op == "move":
+                if tokens[: len(source)] == source and tokens != source:
+                    raise ValidationException("Cannot move a value into itself", field="from")
+                value = self.remove(source)
+            else:
+                value = self.get(source)
+            self.add(tokens, value)
+        elif op == "test":
+            if self.get(tokens) != operation["value"]:
+                raise ConflictException(
+                    f"Patch test failed at '{operation.get('path', '')}'",
+                    conflict_field=operation.get("path", ""),
+                )
+        else:
+            raise ValidationException(f"Unknown patch operation '{op}'", field="op")
+
+
+def apply_json_patch(document: Any, operations: list[dict[str, Any]]) -> Any:
+    """Apply a JSON Patch, returning a new document.
+
+    ``document`` is not modified; only containers along the patched paths are
+    copied. A failing ``test`` operation raises ``ConflictException``; any
+    other invalid operation raises ``ValidationException``.
+    """
+    patcher = _Patcher(document)
+    for operation in operations:
+        patcher.apply(operation)
+    return patcher.root
+
+
+def apply_patch(document: Any, patch: Patch, patch_format: PatchFormat = "merge-patch") -> Any:
+    """Apply ``patch`` in the given format, returning a new document."""
+    if patch_format == "merge-patch":
+        return apply_merge_patch(document, patch)
+    if patch_format == "json-patch":
+        if not isinstance(patch, list):
+            raise ValidationException("JSON Patch must be a list of operations", field="patch")
+        return apply_json_patch(document, patch)
+    raise ValidationException(f"Unknown patch format '{patch_format}'", field="patch_format")
+
+
+# --- Repository helpers ---
+
+
+def _check_precondition(
+    entity: str, current_updated_at: datetime, if_updated_at: Optional[datetime]
+) -> None:
+    if if_updated_at is not None and current_updated_at != if_updated_at:
+        raise ConflictException(
+            f"{entity} was modified since {if_updated_at.isoformat()}",
+            entity=entity,
+            conflict_field="updated_at",
+        )
+
+
+async def patch_analysis_result(
+    repo: PluginDataRepository,
+    experiment_id: int,
+    plugin_id: str,
+    patch: Patch,
+    *,
+    patch_format: PatchFormat = "merge-patch",
+    if_updated_at: Optional[datetime] = None,
+) -> PluginAnalysisResult:
+    """Patch an analysis result, natively if the repository supports it.
+
+    The fallback reads, patches and saves the full result; its precondition
+    check is not atomic with the write.
+    """
+    native = getattr(repo, "patch_analysis_result", None)
+    if native is not None:
+        return await native(
+            experiment_id,
+            plugin_id,
+            patch,
+            patch_format=patch_format,
+            if_updated_at=if_updated_at,
+        )
+    current = await repo.get_analysis_result(experiment_id, plugin_id)
+    if current is None:
+        raise NotFoundException(
+            "Analysis result not found",
+            entity="analysis_result",
+            entity_id=f"{experiment_id}/{plugin_id}",
+        )
+    _check_precondition("analysis_result", current.updated_at, if_updated_at)
+    result = apply_patch(current.result, patch, patch_format)
+    return await repo.save_analysis_result(experiment_id, plugin_id, result)
+
+
+async def patch_experiment_data(
+    repo: PluginDataRepository,
+    experiment_id: int,
+    plugin_id: str,
+    patch: Patch,
+    *,
+    patch_format: PatchFormat = "merge-patch",
+    if_updated_at: Optional[datetime] = None,
+) -> DesignData:
+    """Patch experiment design data, natively if the repository supports it.
+
+    The fallback reads, patches and saves the full data, keeping its
+    ``schema_version``; its precondition check is not atomic with the write.
+    """
+    native = getattr(repo, "patch_experiment_data", None)
+    if native is not None:
+        return await native(
+            experiment_id,
+            plugin_id,
+            patch,
+            patch_format=patch_format,
+            if_updated_at=if_updated_at,
+        )
+    current = await repo.get_experiment_data(experiment_id)
+    if current is None:
+        raise NotFoundException(
+            "Experiment data not found",
+            entity="experiment_data",
+            entity_id=str(experiment_id),
+        )
+    _check_precondition("experiment_data", current.updated_at, if_updated_at)
+    data = apply_patch(current.data, patch, patch_format)
+    return await repo.save_experiment_data(
+        experiment_id, plugin_id, data, schema_version=current.schema_version
+    )
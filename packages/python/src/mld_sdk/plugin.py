@@ -5,6 +5,7 @@ This module provides the AnalysisPlugin base class that all plugins must inherit
 from, as well as lifecycle hooks and health status interfaces.
 """
 
+import asyncio
 from abc import ABC, abstractmethod
 from contextlib import asynccontextmanager
 from dataclasses import dataclass, field
@@ -18,7 +19,9 @@ from mld_sdk.models import PluginMetadata
 if TYPE_CHECKING:
     from fastapi import APIRouter
 
-    from mld_sdk.local_database import LocalDatabase
+    from mld_sdk.blobs import BlobStore
+    from mld_sdk.caching import RepositoryCache
+    from mld_sdk.local_database import LocalDatabase, LocalDatabaseConfig
 
 
 class HealthStatus(str, Enum):
@@ -73,6 +76,8 @@ class AnalysisPlugin(ABC):
 
     _context: Optional[PlatformContext] = None
     _standalone_db: Optional["LocalDatabase"] = None
+    _repository_cache: Optional["RepositoryCache"] = None
+    _blob_store: Optional["BlobStore"] = None
 
     @property
     @abstractmethod
@@ -98,8 +103,15 @@ class AnalysisPlugin(ABC):
     # --- Optional lifecycle hooks ---
 
     async def check_health(self) -> PluginHealth:
-        """Check plugin health status."""
-        return PluginHealth(status=HealthStatus.HEALTHY)
+        """Check plugin health status.
+
+        The default reports HEALTHY, with standalone database maintenance
+        status in ``details`` when a standalone database is set up.
+        """
+        details: dict[str, Any] = {}
+        if self._standalone_db is not None and self._standalone_db.is_initialized:
+            details["local_database"] = self._standalone_db.maintenance_status()
+        return PluginHealth(status=HealthStatus.HEALTHY, details=details)
 
     async def on_before_experiment_save(
         self, experiment_id: int, data: dict[str, Any]
@@ -110,14 +122,24 @@ class AnalysisPlugin(ABC):
     async def on_after_experiment_save(
         self, experiment_id: int, data: dict[str, Any]
     ) -> None:
-        """Called after experiment data is saved successfully."""
-        pass
+        """Called after experiment data is saved successfully.
+
+        The default invalidates the experiment in the repository cache;
+        overrides should call ``super()`` when caching is enabled.
+        """
+        if self._repository_cache is not None:
+            self._repository_cache.invalidate_experiment(experiment_id)
 
     async def on_experiment_status_change(
         self, experiment_id: int, old_status: str, new_status: str
     ) -> None:
-        """Called when experiment status changes."""
-        pass
+        """Called when experiment status changes.
+
+        The default invalidates the experiment in the repository cache;
+        overrides should call ``super()`` when caching is enabled.
+        """
+        if self._repository_cache is not None:
+            self._repository_cache.invalidate_experiment(experiment_id)
 
     # --- Properties ---
 
@@ -150,6 +172,13 @@ class AnalysisPlugin(ABC):
         """Return the range of compatible platform versions."""
         return None
 
+    def get_plugin_dependencies(self) -> list[str]:
+        """Return names of plugins that must be initialized before this one.
+
+        Used by ``PluginHost`` to order concurrent startup.
+        """
+        return []
+
     # --- Shared database support ---
 
     def get_shared_models(self) -> list[type]:
@@ -163,6 +192,14 @@ class AnalysisPlugin(ABC):
         """
         return []
 
+    def get_local_database_config(self) -> Optional["LocalDatabaseConfig"]:
+        """Return the standalone database configuration, or None for defaults.
+
+        Override to tune the SQLite file location, connection pool, etc.
+        A ``storage_dir`` passed to ``_setup_standalone_db()`` takes precedence.
+        """
+        return None
+
     @asynccontextmanager
     async def get_plugin_db_session(self) -> AsyncGenerator[Any, None]:
         """Unified DB access -- PostgreSQL (platform) or SQLite (standalone).
@@ -182,6 +219,54 @@ class AnalysisPlugin(ABC):
             async with self._standalone_db.get_async_session() as session:
                 yield session
 
+    # --- Repository caching ---
+
+    @property
+    def repository_cache(self) -> Optional["RepositoryCache"]:
+        """Get the repository cache, or None if not set up."""
+        return self._repository_cache
+
+    def _setup_repository_cache(self, **options: Any) -> Optional["RepositoryCache"]:
+        """Wrap the context's experiment and user repositories in a TTL/LRU cache.
+
+        Call from ``initialize()`` after setting ``self._context``; a no-op in
+        standalone mode. Options are passed to ``RepositoryCache``.
+        """
+        if self._context is None:
+            return None
+        from mld_sdk.caching import RepositoryCache
+
+        self._repository_cache = RepositoryCache(self._context, **options)
+        return self._repository_cache
+
+    # --- Blob storage ---
+
+    def get_blob_store(self) -> "BlobStore":
+        """Get the store for offloaded analysis result values.
+
+        Uses the platform's store when ``PlatformContext.get_blob_store()``
+        provides one, otherwise a ``LocalBlobStore`` in ``blobs/`` under the
+        plugin's storage directory (``~/.mld/plugins/{name}`` by default). A
+        ``storage_dir`` passed to ``_setup_standalone_db()`` takes precedence.
+        """
+        if self._blob_store is None:
+            store = self._context.get_blob_store() if self._context else None
+            if store is None:
+                from pathlib import Path
+
+                from mld_sdk.blobs import LocalBlobStore
+
+                if self._standalone_db is not None:
+                    storage_dir = self._standalone_db.db_path.parent
+                else:
+                    config = self.get_local_database_config()
+                    storage_dir = config.storage_dir if config is not None else None
+                    if storage_dir is None:
+                        storage_dir = Path.home() / ".mld" / "plugins" / self.metadata.name
+                store = LocalBlobStore(storage_dir / "blobs")
+            self._blob_store = store
+        return self._blob_store
+
     # --- Standalone database (SQLite fallback) ---
 
     @property
@@ -201,12 +286,22 @@ class AnalysisPlugin(ABC):
         from mld_sdk.local_database import LocalDatabase, LocalDatabaseConfig
         from pathlib import Path
 
-        config = LocalDatabaseConfig()
+        config = self.get_local_database_config() or LocalDatabaseConfig()
         if storage_dir is not None:
             config.storage_dir = Path(storage_dir) if not isinstance(storage_dir, Path) else storage_dir
         self._standalone_db = LocalDatabase(self.metadata.name, config)
         self._standalone_db.initialize(models=self.get_shared_models())
 
+    async def _setup_standalone_db_async(self, storage_dir: "Any | None" = None) -> None:
+        """Like ``_setup_standalone_db()``, but opens the database in a worker thread.
+
+        Keeps the event loop free while other plugins initialize concurrently.
+        """
+        await asyncio.to_thread(self._setup_standalone_db, storage_dir)
+        db = self._standalone_db
+        if db is not None and db.config.maintenance_interval is not None:
+            db.start_maintenance()
+
     def _teardown_standalone_db(self) -> None:
         """Close the standalone database."""
         if self._standalone_db is not None:
@@ -0,0 +1,141 @@
+"""
+Field projection for analysis results and experiment design data.
+
+List views and status polls rarely need a plugin's full multi-megabyte
+``result``. ``PluginDataRepository`` read methods accept ``fields``, a list of
+dot-separated paths, and return only those parts of each document::
+
+    {"status": "done", "summary": {"peaks": 3, "snr": 11.0}, "spectra": [...]}
+    # fields=["status", "summary.peaks"] ->
+    {"status": "done", "summary": {"peaks": 3}}
+
+A path applied to a list projects every element, so ``"peaks.mz"`` keeps only
+``mz`` of each peak. Missing paths are omitted rather than raising.
+
+The ``get_*`` helpers here pass ``fields`` to the platform when its repository
+supports it, and otherwise fetch the full document and project it locally.
+
+Usage::
+
+    from mld_sdk import get_analysis_results
+
+    results = await get_analysis_results(repo, experiment_id, fields=["status"])
+"""
+
+import dataclasses
+import functools
+import inspect
+from typing import Any, Callable, Optional, Sequence
+
+from mld_sdk.exceptions import ValidationException
+from mld_sdk.repositories import DesignData, PluginAnalysisResult, PluginDataRepository
+
+_OMIT = object()
+
+
+def _field_tree(fields: Sequence[str]) -> dict[str, Any]:
+    """Build a nested dict of path tokens; ``True`` marks a selected subtree."""
+    if isinstance(fields, str):
+        raise ValidationException("fields must be a list of paths", field="fields")
+    tree: dict[str, Any] = {}
+    for path in fields:
+        tokens = path.split(".")
+        if not all(tokens):
+            raise ValidationException(f"Invalid field path '{path}'", field="fields")
+        node = tree
+        for token in tokens[:-1]:
+            child = node.setdefault(token, {})
+            if child is True:
+                break
+            node = child
+        else:
+            node[tokens[-1]] = True
+    return tree
+
+
+def _project(value: Any, tree: Any) -> Any:
+    if tree is True:
+        return value
+    if isinstance(value, dict):
+        projected = {}
+        for key, subtree in tree.items():
+            if key in value:
+                child = _project(value[key], subtree)
+                if child is not _OMIT:
+                    projected[key] = child
+        return projected
+    if isinstance(value, list):
+        return [item for item in (_project(v, tree) for v in value) if item is not _OMIT]
+    return _OMIT
+
+
+def project_fields(document: dict[str, Any], fields: Optional[Sequence[str]]) -> dict[str, Any]:
+    """Return the parts of ``document`` selected by dot-separated ``fields``.
+
+    ``None`` returns ``document`` unchanged. Selected values are shared with
+    ``document``, not copied.
+    """
+    if fields is None:
+        return document
+    projected = _project(document, _field_tree(fields))
+    return {} if projected is _OMIT else projected
+
+
+@functools.lru_cache(maxsize=256)
+def _accepts_fields(function: Callable[..., Any]) -> bool:
+    try:
+        return "fields" in inspect.signature(function).parameters
+    except (TypeError, ValueError):
+        return False
+
+
+def _supports_fields(method: Callable[..., Any]) -> bool:
+    return _accepts_fields(getattr(method, "__func__", method))
+
+
+def _project_result(result: PluginAnalysisResult, fields: Sequence[str]) -> PluginAnalysisResult:
+    return dataclasses.replace(result, result=project_fields(result.result, fields))
+
+
+async def get_analysis_result(
+    repo: PluginDataRepository,
+    experiment_id: int,
+    plugin_id: str,
+    fields: Optional[Sequence[str]] = None,
+) -> Optional[PluginAnalysisResult]:
+    """Get one analysis result, projected to ``fields``."""
+    if fields is None:
+        return await repo.get_analysis_result(experiment_id, plugin_id)
+    if _supports_fields(repo.get_analysis_result):
+        return await repo.get_analysis_result(experiment_id, plugin_id, fields=fields)
+    result = await repo.get_analysis_result(experiment_id, plugin_id)
+    return _project_result(result, fields) if result is not None else None
+
+
+async def get_analysis_results(
+    repo: PluginDataRepository,
+    experiment_id: int,
+    fields: Optional[Sequence[str]] = None,
+) -> list[PluginAnalysisResult]:
+    """Get every plugin's analysis result for an experiment, projected to ``fields``."""
+    if fields is None:
+        return await repo.get_analysis_results(experiment_id)
+    if _supports_fields(repo.get_analysis_results):
+        return await repo.get_analysis_results(experiment_id, fields=fields)
+    return [_project_result(r, fields) for r in await repo.get_analysis_results(experiment_id)]
+
+
+async def get_experiment_data(
+    repo: PluginDataRepository,
+    experiment_id: int,
+    fields: Optional[Sequence[str]] = None,
+) -> Optional[DesignData]:
+    """Get experiment design data, projected to ``fields``."""
+    if fields is None:
+        return await repo.get_experiment_data(experiment_id)
+    if _supports_fields(repo.get_experiment_data):
+        return await repo.get_experiment_data(experiment_id, fields=fields)
+    data = await repo.get_experiment_data(experiment_id)
+    if data is None:
+        return None
+    return dataclasses.replace(data, data=project_fields(data.data, fields))
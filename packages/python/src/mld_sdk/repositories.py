@@ -9,11 +9,27 @@ Repository types correspond to plugin capabilities:
 - ExperimentRepository: Basic experiment access (read-only for ANALYSIS plugins)
 - PluginDataRepository: Design data and analysis result storage
 - UserRepository: User information
+
+Methods added after the base protocols shipped live in separate optional
+capability protocols (ExperimentBatchRepository, ExperimentKeysetRepository,
+AnalysisResultBatchRepository, PluginDataPatchRepository,
+UserBatchRepository), so existing platform implementations keep satisfying
+``isinstance(repo, ExperimentRepository)`` and friends. The SDK helpers use
+a capability when the repository has it and fall back otherwise.
 """
 
 from dataclasses import dataclass, field
 from datetime import datetime
-from typing import Any, Optional, Protocol, runtime_checkable
+from typing import (
+    Any,
+    AsyncIterator,
+    Literal,
+    Optional,
+    Protocol,
+    Sequence,
+    Union,
+    runtime_checkable,
+)
 
 
 # --- Data Models ---
@@ -170,6 +186,52 @@ class ExperimentRepository(Protocol):
         ...
 
 
+@runtime_checkable
+class ExperimentBatchRepository(Protocol):
+    """Optional ``ExperimentRepository`` capability: batched reads.
+
+    ``mld_sdk.batching.get_many_experiments`` falls back to concurrent
+    ``get_by_id`` calls on platforms without it.
+    """
+
+    async def get_many(self, experiment_ids: Sequence[int]) -> dict[int, Experiment]:
+        """Get several experiments in one round trip, keyed by ID.
+
+        Missing IDs are omitted from the result.
+        """
+        ...
+
+
+@runtime_checkable
+class ExperimentKeysetRepository(Protocol):
+    """Optional ``ExperimentRepository`` capability: keyset iteration.
+
+    ``mld_sdk.pagination.iter_experiments`` falls back to offset paging over
+    ``list_all`` on platforms without it.
+    """
+
+    def iter_all(
+        self,
+        *,
+        batch_size: int = 100,
+        order_by: Literal["id", "updated_at"] = "id",
+        status: Optional[str] = None,
+        experiment_type: Optional[str] = None,
+        project: Optional[str] = None,
+        created_by: Optional[int] = None,
+        parent_experiment_id: Optional[int] = None,
+        search: Optional[str] = None,
+    ) -> AsyncIterator[Experiment]:
+        """Iterate over all matching experiments using keyset pagination.
+
+        Implementations fetch ``batch_size`` rows per query, resuming after the
+        last seen ``id`` (or ``(updated_at, id)``) instead of using OFFSET, and
+        never compute a total count. Use ``mld_sdk.pagination.iter_experiments``
+        to fall back to ``list_all`` on platforms without this method.
+        """
+        ...
+
+
 @runtime_checkable
 class PluginDataRepository(Protocol):
     """
@@ -190,9 +252,16 @@ class PluginDataRepository(Protocol):
         ...
 
     async def get_experiment_data(
-        self, experiment_id: int
+        self,
+        experiment_id: int,
+        fields: Optional[Sequence[str]] = None,
     ) -> Optional[DesignData]:
-        """Get experiment data for an experiment."""
+        """Get experiment data for an experiment.
+
+        ``fields`` restricts the returned ``data`` to the given dot-separated
+        paths (e.g. ``["status", "summary.peaks"]``); see
+        ``mld_sdk.projection.project_fields``.
+        """
         ...
 
     async def delete_experiment_data(self, experiment_id: int) -> bool:
@@ -212,14 +281,25 @@ class PluginDataRepository(Protocol):
         self,
         experiment_id: int,
         plugin_id: str,
+        fields: Optional[Sequence[str]] = None,
     ) -> Optional[PluginAnalysisResult]:
-        """Get analysis result for a specific plugin."""
+        """Get analysis result for a specific plugin.
+
+        ``fields`` restricts the returned ``result`` to the given dot-separated
+        paths (e.g. ``["status", "summary.peaks"]``); see
+        ``mld_sdk.projection.project_fields``.
+        """
         ...
 
     async def get_analysis_results(
-        self, experiment_id: int
+        self,
+        experiment_id: int,
+        fields: Optional[Sequence[str]] = None,
     ) -> list[PluginAnalysisResult]:
-        """Get all analysis results for an experiment."""
+        """Get all analysis results for an experiment.
+
+        ``fields`` projects each ``result`` as in ``get_analysis_result``.
+        """
         ...
 
     async def delete_analysis_result(
@@ -231,6 +311,75 @@ class PluginDataRepository(Protocol):
         ...
 
 
+@runtime_checkable
+class AnalysisResultBatchRepository(Protocol):
+    """Optional ``PluginDataRepository`` capability: batched result reads.
+
+    ``mld_sdk.batching.get_many_analysis_results`` falls back to concurrent
+    ``get_analysis_result`` calls on platforms without it.
+    """
+
+    async def get_many_analysis_results(
+        self,
+        experiment_ids: Sequence[int],
+        plugin_id: str,
+        fields: Optional[Sequence[str]] = None,
+    ) -> dict[int, PluginAnalysisResult]:
+        """Get a plugin's analysis results for several experiments, keyed by experiment ID.
+
+        Experiments without a result are omitted. ``fields`` projects each
+        ``result`` as in ``get_analysis_result``.
+        """
+        ...
+
+
+@runtime_checkable
+class PluginDataPatchRepository(Protocol):
+    """Optional ``PluginDataRepository`` capability: partial updates.
+
+    ``mld_sdk.patching.patch_experiment_data`` / ``patch_analysis_result``
+    fall back to read-modify-write on platforms without it.
+    """
+
+    async def patch_experiment_data(
+        self,
+        experiment_id: int,
+        plugin_id: str,
+        patch: Union[dict[str, Any], list[dict[str, Any]]],
+        *,
+        patch_format: Literal["merge-patch", "json-patch"] = "merge-patch",
+        if_updated_at: Optional[datetime] = None,
+    ) -> DesignData:
+        """Apply a JSON Merge Patch (RFC 7386) or JSON Patch (RFC 6902) to experiment data.
+
+        If ``if_updated_at`` is given and the stored ``updated_at`` differs,
+        raises ``ConflictException`` without writing. Raises
+        ``NotFoundException`` if the experiment has no data. Use
+        ``mld_sdk.patching.patch_experiment_data`` to fall back to
+        read-modify-write on platforms without this method.
+        """
+        ...
+
+    async def patch_analysis_result(
+        self,
+        experiment_id: int,
+        plugin_id: str,
+        patch: Union[dict[str, Any], list[dict[str, Any]]],
+        *,
+        patch_format: Literal["merge-patch", "json-patch"] = "merge-patch",
+        if_updated_at: Optional[datetime] = None,
+    ) -> PluginAnalysisResult:
+        """Apply a JSON Merge Patch (RFC 7386) or JSON Patch (RFC 6902) to an analysis result.
+
+        If ``if_updated_at`` is given and the stored ``updated_at`` differs,
+        raises ``ConflictException`` without writing. Raises
+        ``NotFoundException`` if no result exists. Use
+        ``mld_sdk.patching.patch_analysis_result`` to fall back to
+        read-modify-write on platforms without this method.
+        """
+        ...
+
+
 @runtime_checkable
 class UserRepository(Protocol):
     """Repository for user data."""
@@ -248,6 +397,22 @@ class UserRepository(Protocol):
         ...
 
 
+@runtime_checkable
+class UserBatchRepository(Protocol):
+    """Optional ``UserRepository`` capability: batched reads.
+
+    ``mld_sdk.batching.get_many_users`` falls back to concurrent
+    ``get_by_id`` calls on platforms without it.
+    """
+
+    async def get_many(self, user_ids: Sequence[int]) -> dict[int, User]:
+        """Get several users in one round trip, keyed by ID.
+
+        Missing IDs are omitted from the result.
+        """
+        ...
+
+
 @runtime_checkable
 class PluginRoleRepository(Protocol):
     """Repository for plugin-scoped user roles.
@@ -0,0 +1,100 @@
+"""
+Single-flight coalescing of concurrent identical async calls.
+
+When many requests ask for the same thing at once (a popular experiment page
+calling ``get_experiment_data(experiment_id)``), only the first call runs;
+concurrent callers with identical arguments await the same result. Once the
+call finishes the next caller starts a fresh one - nothing is cached.
+
+Usage::
+
+    from mld_sdk import single_flight
+
+    class MyDataRepository:
+        @single_flight
+        async def get_experiment_data(self, experiment_id: int): ...
+
+    # or wrap an existing repository's bound method
+    repo.get_analysis_results = single_flight(repo.get_analysis_results)
+"""
+
+import asyncio
+import functools
+from typing import Any, Awaitable, Callable, Hashable, Optional, TypeVar, overload
+
+T = TypeVar("T")
+F = TypeVar("F", bound=Callable[..., Awaitable[Any]])
+
+
+class SingleFlight:
+    """Group of in-flight calls keyed by an arbitrary hashable key."""
+
+    def __init__(self) -> None:
+        self._in_flight: dict[Hashable, asyncio.Future] = {}
+
+    def __len__(self) -> int:
+        return len(self._in_flight)
+
+    async def do(self, key: Hashable, fn: Callable[[], Awaitable[T]]) -> T:
+        """Run ``fn()`` unless a call for ``key`` is already in flight.
+
+        Callers share the outcome, including exceptions. Cancelling one caller
+        does not cancel the shared call for the others.
+        """
+        future = self._in_flight.get(key)
+        if future is None:
+            future = asyncio.ensure_future(fn())
+            self._in_flight[key] = future
+            future.add_done_callback(functools.partial(self._forget, key))
+        return await asyncio.shield(future)
+
+    def _forget(self, key: Hashable, future: asyncio.Future) -> None:
+        if self._in_flight.get(key) is future:
+            del self._in_flight[key]
+
+
+def _call_key(args: tuple, kwargs: dict[str, Any]) -> Hashable:
+    return (args, tuple(sorted(kwargs.items()))) if kwargs else args
+
+
+@overload
+def single_flight(func: F) -> F: ...
+
+
+@overload
+def single_flight(
+    func: None = None, *, key: Optional[Callable[..., Hashable]] = None
+) -> Callable[[F], F]: ...
+
+
+def single_flight(
+    func: Optional[F] = None, *, key: Optional[Callable[..., Hashable]] = None
+) -> Any:
+    """Decorate an async function so concurrent identical calls run once.
+
+    Args:
+        func: Async function or method to wrap.
+        key: Optional function mapping the call arguments to a hashable key.
+            Defaults to the positional and keyword arguments themselves
+            (including ``self`` for methods). Calls whose key is unhashable
+            are not coalesced.
+    """
+
+    def decorate(fn: F) -> F:
+        group = SingleFlight()
+
+        @functools.wraps(fn)
+        async def wrapper(*args: Any, **kwargs: Any) -> Any:
+            call_key = key(*args, **kwargs) if key is not None else _call_key(args, kwargs)
+            try:
+                hash(call_key)
+            except TypeError:
+                return await fn(*args, **kwargs)
+            return await group.do(call_key, lambda: fn(*args, **kwargs))
+
+        wrapper.single_flight = group  # type: ignore[attr-defined]
+        return wrapper  # type: ignore[return-value]
+
+    if func is not None:
+        return decorate(func)
+    return decorate
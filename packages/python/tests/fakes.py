@@ -0,0 +1,176 @@
+"""In-memory repository fakes shared by the repository-helper tests."""
+
+from datetime import datetime, timezone
+from typing import Any, Optional
+
+from mld_sdk.repositories import (
+    DesignData,
+    Experiment,
+    PluginAnalysisResult,
+    User,
+    UserPluginRole,
+)
+
+NOW = datetime(2026, 1, 1, tzinfo=timezone.utc)
+
+
+def make_experiment(experiment_id: int, status: str = "draft") -> Experiment:
+    return Experiment(
+        id=experiment_id,
+        name=f"exp-{experiment_id}",
+        experiment_type="lcms",
+        status=status,
+        created_at=NOW,
+        updated_at=NOW,
+    )
+
+
+def make_user(user_id: int) -> User:
+    return User(
+        id=user_id,
+        username=f"user{user_id}",
+        role="member",
+        is_active=True,
+        created_at=NOW,
+        updated_at=NOW,
+    )
+
+
+class FakeExperimentRepository:
+    """Experiment repository without batch methods; records every call."""
+
+    def __init__(self, experiments: list[Experiment]):
+        self.experiments = {e.id: e for e in experiments}
+        self.calls: list[tuple[str, Any]] = []
+
+    async def get_by_id(self, experiment_id: int) -> Optional[Experiment]:
+        self.calls.append(("get_by_id", experiment_id))
+        return self.experiments.get(experiment_id)
+
+    async def list_all(self, skip=0, limit=100, **filters):
+        self.calls.append(("list_all", (skip, limit)))
+        items = list(self.experiments.values())
+        return items[skip : skip + limit], len(items)
+
+    async def update(self, experiment_id: int, **fields) -> Optional[Experiment]:
+        self.calls.append(("update", experiment_id))
+        experiment = self.experiments.get(experiment_id)
+        if experiment is None:
+            return None
+        for name, value in fields.items():
+            if value is not None:
+                setattr(experiment, name, value)
+        return experiment
+
+    async def delete(self, experiment_id: int) -> bool:
+        self.calls.append(("delete", experiment_id))
+        return self.experiments.pop(experiment_id, None) is not None
+
+
+class BatchExperimentRepository(FakeExperimentRepository):
+    """Experiment repository with a native ``get_many``."""
+
+    async def get_many(self, experiment_ids):
+        self.calls.append(("get_many", list(experiment_ids)))
+        return {i: self.experiments[i] for i in experiment_ids if i in self.experiments}
+
+
+class FakeUserRepository:
+    def __init__(self, users: list[User]):
+        self.users = {u.id: u for u in users}
+        self.calls: list[tuple[str, Any]] = []
+
+    async def get_by_id(self, user_id: int) -> Optional[User]:
+        self.calls.append(("get_by_id", user_id))
+        return self.users.get(user_id)
+
+    async def get_by_username(self, username: str) -> Optional[User]:
+        self.calls.append(("get_by_username", username))
+        return next((u for u in self.users.values() if u.username == username), None)
+
+
+class FakePluginDataRepository:
+    def __init__(self):
+        self.results: dict[tuple[int, str], PluginAnalysisResult] = {}
+        self.design: dict[int, DesignData] = {}
+        self.calls: list[tuple[str, Any]] = []
+
+    async def save_analysis_result(self, experiment_id, plugin_id, result):
+        self.calls.append(("save_analysis_result", experiment_id))
+        saved = PluginAnalysisResult(
+            id=len(self.results) + 1,
+            experiment_id=experiment_id,
+            plugin_id=plugin_id,
+            result=result,
+            created_at=NOW,
+            updated_at=NOW,
+        )
+        self.results[(experiment_id, plugin_id)] = saved
+        return saved
+
+    async def get_analysis_result(self, experiment_id, plugin_id):
+        self.calls.append(("get_analysis_result", experiment_id))
+        return self.results.get((experiment_id, plugin_id))
+
+    async def get_analysis_results(self, experiment_id):
+        self.calls.append(("get_analysis_results", experiment_id))
+        return [r for (eid, _), r in self.results.items() if eid == experiment_id]
+
+    async def save_experiment_data(self, experiment_id, plugin_id, data, schema_version="1.0"):
+        self.calls.append(("save_experiment_data", experiment_id))
+        saved = DesignData(
+            id=experiment_id,
+            experiment_id=experiment_id,
+            plugin_id=plugin_id,
+            data=data,
+            schema_version=schema_version,
+            created_at=NOW,
+            updated_at=NOW,
+        )
+        self.design[experiment_id] = saved
+        return saved
+
+    async def get_experiment_data(self, experiment_id):
+        self.calls.append(("get_experiment_data", experiment_id))
+        return self.design.get(experiment_id)
+
+
+class FakePluginRoleRepository:
+    def __init__(self):
+        self.roles: dict[tuple[str, int], str] = {}
+        self.calls: list[tuple[str, Any]] = []
+
+    async def get_role(self, plugin_id: str, user_id: int) -> Optional[str]:
+        self.calls.append(("get_role", (plugin_id, user_id)))
+        return self.roles.get((plugin_id, user_id))
+
+    async def set_role(self, plugin_id: str, user_id: int, role: str) -> UserPluginRole:
+        self.calls.append(("set_role", (plugin_id, user_id)))
+        self.roles[(plugin_id, user_id)] = role
+        return UserPluginRole(
+            id=user_id,
+            user_id=user_id,
+            plugin_id=plugin_id,
+            role=role,
+            created_at=NOW,
+            updated_at=NOW,
+        )
+
+    async def remove_role(self, plugin_id: str, user_id: int) -> bool:
+        self.calls.append(("remove_role", (plugin_id, user_id)))
+        return self.roles.pop((plugin_id, user_id), None) is not None
+
+    async def list_plugin_roles(self, plugin_id: str) -> list[UserPluginRole]:
+        self.calls.append(("list_plugin_roles", plugin_id))
+        return [
+            UserPluginRole(
+                id=user_id,
+                user_id=user_id,
+                plugin_id=pid,
+                role=role,
+                created_at=NOW,
+                updated_at=NOW,
+            )
+            for (pid, user_id), role in self.roles.items()
+            if pid == plugin_id
+        ]
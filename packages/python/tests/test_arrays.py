@@ -0,0 +1,106 @@
+import array
+from pathlib import Path
+from typing import Any
+
+import pytest
+from sqlmodel import Column, Field, SQLModel, select
+
+from mld_sdk import arrays
+from mld_sdk.arrays import ArrayType, decode_array, encode_array
+from mld_sdk.exceptions import ValidationException
+from mld_sdk.local_database import LocalDatabase, LocalDatabaseConfig
+
+
+class Trace(SQLModel, table=True):
+    """Test model with array columns."""
+
+    __tablename__ = "array_trace"
+
+    id: int | None = Field(default=None, primary_key=True)
+    raw: Any = Field(sa_column=Column(ArrayType()))
+    packed: Any = Field(sa_column=Column(ArrayType(compress=True), nullable=True))
+
+
+@pytest.fixture
+def no_numpy(monkeypatch):
+    monkeypatch.setattr(arrays, "_NUMPY_AVAILABLE", False)
+
+
+class TestCodecWithoutNumpy:
+    def test_list_round_trip(self, no_numpy):
+        view = decode_array(encode_array([1.0, 2.5, -3.0]))
+        assert isinstance(view, memoryview)
+        assert view.format == "d"
+        assert view.tolist() == [1.0, 2.5, -3.0]
+
+    def test_array_array_round_trip(self, no_numpy):
+        values = array.array("i", range(100))
+        view = decode_array(encode_array(values, compress=True))
+        assert view.format == "i"
+        assert view.tolist() == list(range(100))
+
+    def test_multidimensional_buffer(self, no_numpy):
+        values = memoryview(array.array("f", range(6))).cast("B").cast("f", (2, 3))
+        view = decode_array(encode_array(values))
+        assert view.shape == (2, 3)
+        assert view.tolist() == [[0.0, 1.0, 2.0], [3.0, 4.0, 5.0]]
+
+    def test_uncompressed_decode_is_zero_copy(self, no_numpy):
+        blob = bytearray(encode_array([1.0, 2.0]))
+        view = decode_array(blob)
+        blob[-8:] = memoryview(array.array("d", [9.0])).cast("B")
+        assert view[1] == 9.0
+
+    def test_compression_shrinks_repetitive_data(self):
+        values = [0.0] * 10_000
+        assert len(encode_array(values, compress=True)) < len(encode_array(values)) / 10
+
+    def test_rejects_unsupported_values(self):
+        with pytest.raises(ValidationException, match="Cannot store"):
+            encode_array(object())
+
+    def test_rejects_foreign_blob(self):
+        with pytest.raises(ValidationException, match="bad magic"):
+            decode_array(b"NOPE" + b"\x00" * 16)
+        with pytest.raises(ValidationException, match="truncated"):
+            decode_array(b"MLD")
+
+
+class TestCodecWithNumpy:
+    def test_ndarray_round_trip(self):
+        np = pytest.importorskip("numpy")
+        values = np.arange(12, dtype=np.float32).reshape(3, 4)
+        result = decode_array(encode_array(values, compress=True))
+        assert result.dtype == np.float32
+        assert result.shape == (3, 4)
+        assert np.array_equal(result, values)
+
+    def test_non_contiguous_input(self):
+        np = pytest.importorskip("numpy")
+        values = np.arange(20, dtype=np.int64).reshape(4, 5)[:, ::2]
+        assert np.array_equal(decode_array(encode_array(values)), values)
+
+    def test_decoded_array_is_read_only_view(self):
+        np = pytest.importorskip("numpy")
+        result = decode_array(encode_array(np.ones(4)))
+        assert result.flags.writeable is False
+
+
+class TestArrayType:
+    def test_store_and_load(self, tmp_path: Path):
+        ldb = LocalDatabase("array-test", LocalDatabaseConfig(storage_dir=tmp_path))
+        ldb.initialize(models=[Trace])
+
+        with ldb.get_session() as session:
+            session.add(Trace(raw=[1.0, 2.0, 3.0], packed=[0.5] * 100))
+            session.add(Trace(raw=array.array("d", [4.0]), packed=None))
+            session.commit()
+
+        with ldb.get_session() as session:
+            first, second = session.exec(select(Trace).order_by(Trace.id)).all()
+            assert list(first.raw) == [1.0, 2.0, 3.0]
+            assert list(first.packed) == [0.5] * 100
+            assert list(second.raw) == [4.0]
+            assert second.packed is None
+
+        ldb.close()
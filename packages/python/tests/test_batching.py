@@ -0,0 +1,207 @@
+import asyncio
+
+import pytest
+
+from mld_sdk.batching import (
+    BatchedExperimentRepository,
+    BatchedUserRepository,
+    BatchLoader,
+    fan_out,
+    get_many_analysis_results,
+    get_many_experiments,
+    get_many_users,
+)
+from tests.fakes import (
+    BatchExperimentRepository,
+    FakeExperimentRepository,
+    FakePluginDataRepository,
+    FakeUserRepository,
+    make_experiment,
+    make_user,
+)
+
+
+class TestFanOut:
+    @pytest.mark.asyncio
+    async def test_bounded_concurrency(self):
+        in_flight = 0
+        peak = 0
+
+        async def fetch(key: int) -> int:
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0)
+            in_flight -= 1
+            return key * 2
+
+        result = await fan_out(fetch, range(50), concurrency=5)
+        assert result == {i: i * 2 for i in range(50)}
+        assert peak == 5
+
+    @pytest.mark.asyncio
+    async def test_deduplicates_and_drops_none(self):
+        calls = []
+
+        async def fetch(key: int):
+            calls.append(key)
+            return None if key == 2 else key
+
+        assert await fan_out(fetch, [1, 2, 1, 3]) == {1: 1, 3: 3}
+        assert calls == [1, 2, 3]
+
+
+class TestGetMany:
+    @pytest.mark.asyncio
+    async def test_experiments_fallback(self):
+        repo = FakeExperimentRepository([make_experiment(i) for i in range(3)])
+        result = await get_many_experiments(repo, [0, 2, 2, 99])
+        assert sorted(result) == [0, 2]
+        assert repo.calls == [("get_by_id", 0), ("get_by_id", 2), ("get_by_id", 99)]
+
+    @pytest.mark.asyncio
+    async def test_experiments_native(self):
+        repo = BatchExperimentRepository([make_experiment(i) for i in range(3)])
+        result = await get_many_experiments(repo, [0, 1, 0])
+        assert sorted(result) == [0, 1]
+        assert repo.calls == [("get_many", [0, 1])]
+
+    @pytest.mark.asyncio
+    async def test_empty_ids(self):
+        repo = BatchExperimentRepository([])
+        assert await get_many_experiments(repo, []) == {}
+        assert repo.calls == []
+
+    @pytest.mark.asyncio
+    async def test_users(self):
+        repo = FakeUserRepository([make_user(1), make_user(2)])
+        result = await get_many_users(repo, [1, 2, 3])
+        assert {uid: u.username for uid, u in result.items()} == {1: "user1", 2: "user2"}
+
+    @pytest.mark.asyncio
+    async def test_analysis_results(self):
+        repo = FakePluginDataRepository()
+        await repo.save_analysis_result(1, "peaks", {"n": 1})
+        await repo.save_analysis_result(2, "other", {"n": 2})
+        result = await get_many_analysis_results(repo, [1, 2], "peaks")
+        assert list(result) == [1]
+        assert result[1].result == {"n": 1}
+
+
+class TestBatchLoader:
+    @pytest.mark.asyncio
+    async def test_coalesces_same_tick_loads(self):
+        batches = []
+
+        async def batch_fn(keys):
+            batches.append(keys)
+            return {k: k * 10 for k in keys if k != 3}
+
+        loader = BatchLoader(batch_fn)
+        results = await asyncio.gather(*(loader.load(k) for k in [1, 2, 3, 1]))
+        assert results == [10, 20, None, 10]
+        assert batches == [[1, 2, 3]]
+
+    @pytest.mark.asyncio
+    async def test_memoizes_across_ticks(self):
+        batches = []
+
+        async def batch_fn(keys):
+            batches.append(keys)
+            return {k: k for k in keys}
+
+        loader = BatchLoader(batch_fn)
+        await loader.load(1)
+        await loader.load(1)
+        await loader.load(2)
+        assert batches == [[1], [2]]
+        loader.clear(1)
+        await loader.load(1)
+        assert batches[-1] == [1]
+
+    @pytest.mark.asyncio
+    async def test_nested_helpers_share_a_batch(self):
+        batches = []
+
+        async def batch_fn(keys):
+            batches.append(sorted(keys))
+            return {k: k for k in keys}
+
+        loader = BatchLoader(batch_fn)
+
+        async def inner_helper(key):
+            return await loader.load(key)
+
+        async def helper(key):
+            return await inner_helper(key)
+
+        assert await asyncio.gather(helper(1), helper(2), loader.load(3)) == [1, 2, 3]
+        assert batches == [[1, 2, 3]]
+
+    @pytest.mark.asyncio
+    async def test_max_batch_size(self):
+        batches = []
+
+        async def batch_fn(keys):
+            batches.append(keys)
+            return {}
+
+        loader = BatchLoader(batch_fn, max_batch_size=2)
+        await asyncio.gather(*(loader.load(k) for k in range(5)))
+        assert batches == [[0, 1], [2, 3], [4]]
+
+    @pytest.mark.asyncio
+    async def test_errors_propagate_and_are_not_cached(self):
+        attempts = 0
+
+        async def batch_fn(keys):
+            nonlocal attempts
+            attempts += 1
+            if attempts == 1:
+                raise RuntimeError("db down")
+            return {k: k for k in keys}
+
+        loader = BatchLoader(batch_fn)
+        with pytest.raises(RuntimeError, match="db down"):
+            await loader.load(1)
+        assert await loader.load(1) == 1
+
+    @pytest.mark.asyncio
+    async def test_prime(self):
+        async def batch_fn(keys):
+            raise AssertionError("should not be called")
+
+        loader = BatchLoader(batch_fn)
+        loader.prime(1, "known")
+        assert await loader.load(1) == "known"
+
+
+class TestBatchedRepositories:
+    @pytest.mark.asyncio
+    async def test_experiment_loop_becomes_one_batch(self):
+        inner = BatchExperimentRepository([make_experiment(i) for i in range(10)])
+        repo = BatchedExperimentRepository(inner)
+        experiments = await asyncio.gather(*(repo.get_by_id(i) for i in range(10)))
+        assert [e.id for e in experiments] == list(range(10))
+        await repo.get_by_id(3)
+        assert inner.calls == [("get_many", list(range(10)))]
+
+    @pytest.mark.asyncio
+    async def test_passthrough_and_write_invalidation(self):
+        inner = FakeExperimentRepository([make_experiment(1)])
+        repo = BatchedExperimentRepository(inner)
+        assert (await repo.get_by_id(1)).status == "draft"
+        await repo.update(1, status="running")
+        assert (await repo.get_by_id(1)).status == "running"
+        assert await repo.list_all() == ([inner.experiments[1]], 1)
+        await repo.delete(1)
+        assert await repo.get_by_id(1) is None
+
+    @pytest.mark.asyncio
+    async def test_users(self):
+        inner = FakeUserRepository([make_user(1), make_user(2)])
+        repo = BatchedUserRepository(inner)
+        users = await asyncio.gather(repo.get_by_id(1), repo.get_by_id(2), repo.get_by_id(1))
+        assert [u.id for u in users] == [1, 2, 1]
+        assert inner.calls == [("get_by_id", 1), ("get_by_id", 2)]
+        assert (await repo.get_by_username("user2")).id == 2
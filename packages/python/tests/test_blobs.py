@@ -0,0 +1,201 @@
+import pytest
+
+from mld_sdk.blobs import (
+    BLOB_KEY,
+    BlobOffloadingRepository,
+    BlobRef,
+    BlobStore,
+    LocalBlobStore,
+    content_digest,
+    is_blob_reference,
+    offload_blobs,
+    resolve_blobs,
+)
+from mld_sdk.exceptions import NotFoundException, ValidationException
+from mld_sdk.models import PluginMetadata
+from mld_sdk.plugin import AnalysisPlugin
+from tests.fakes import FakePluginDataRepository
+
+BIG = list(range(5000))
+
+
+class CountingStore(LocalBlobStore):
+    def __init__(self, root):
+        super().__init__(root)
+        self.gets = 0
+
+    async def get(self, digest):
+        self.gets += 1
+        return await super().get(digest)
+
+
+@pytest.fixture
+def store(tmp_path):
+    return CountingStore(tmp_path / "blobs")
+
+
+class TestLocalBlobStore:
+    @pytest.mark.asyncio
+    async def test_round_trip(self, store):
+        assert isinstance(store, BlobStore)
+        digest = await store.put(b"payload")
+        assert digest == content_digest(b"payload")
+        assert await store.exists(digest)
+        assert await store.get(digest) == b"payload"
+        assert await store.delete(digest)
+        assert not await store.delete(digest)
+        with pytest.raises(NotFoundException):
+            await store.get(digest)
+
+    @pytest.mark.asyncio
+    async def test_identical_content_stored_once(self, store):
+        assert await store.put(b"x" * 10) == await store.put(b"x" * 10)
+        assert len([p for p in store.root.rglob("*") if p.is_file()]) == 1
+
+    @pytest.mark.parametrize("digest", ["md5:abc", "sha256:../../etc", "sha256:" + "G" * 64])
+    def test_invalid_digest(self, store, digest):
+        with pytest.raises(ValidationException):
+            store.path_for(digest)
+
+
+class TestOffload:
+    @pytest.mark.asyncio
+    async def test_large_values_offloaded_small_kept(self, store):
+        document = {"status": "done", "nested": {"series": BIG, "n": 1}}
+        offloaded = await offload_blobs(document, store, threshold=1024)
+        assert offloaded["status"] == "done"
+        assert offloaded["nested"]["n"] == 1
+        ref = offloaded["nested"]["series"]
+        assert is_blob_reference(ref)
+        assert ref["encoding"] == "json"
+        assert document["nested"]["series"] is BIG  # input untouched
+
+    @pytest.mark.asyncio
+    async def test_round_trip_eager(self, store):
+        document = {"raw": b"\x00" * 4096, "series": BIG}
+        offloaded = await offload_blobs(document, store, threshold=1024)
+        assert offloaded["raw"]["encoding"] == "bytes"
+        resolved = await resolve_blobs(offloaded, store, lazy=False)
+        assert resolved == document
+
+    @pytest.mark.asyncio
+    async def test_ndarray_round_trip(self, store):
+        np = pytest.importorskip("numpy")
+        matrix = np.arange(4096, dtype="f8").reshape(64, 64)
+        offloaded = await offload_blobs({"matrix": matrix}, store, threshold=1024)
+        assert offloaded["matrix"]["encoding"] == "array"
+        resolved = await resolve_blobs(offloaded, store, lazy=False)
+        np.testing.assert_array_equal(resolved["matrix"], matrix)
+
+    @pytest.mark.asyncio
+    async def test_json_blobs_are_strict_and_stable(self, store):
+        trace = [float("nan")] + [1.0] * 2000
+        offloaded = await offload_blobs({"trace": trace}, store, threshold=1024)
+        assert offloaded["trace"] is trace  # not representable as strict JSON
+        labels = ["µg/mL"] * 500
+        offloaded = await offload_blobs({"labels": labels}, store, threshold=1024)
+        data = await store.get(offloaded["labels"][BLOB_KEY])
+        assert data == ('["' + '","'.join(labels) + '"]').encode("utf-8")
+
+    @pytest.mark.asyncio
+    async def test_lazy_loading(self, store):
+        offloaded = await offload_blobs({"series": BIG}, store, threshold=1024)
+        resolved = await resolve_blobs(offloaded, store)
+        ref = resolved["series"]
+        assert isinstance(ref, BlobRef) and not ref.is_loaded
+        assert store.gets == 0
+        assert await ref.load() == BIG
+        assert await ref.load() == BIG
+        assert store.gets == 1
+
+    @pytest.mark.asyncio
+    async def test_blob_refs_saved_back_as_references(self, store):
+        offloaded = await offload_blobs({"series": BIG}, store, threshold=1024)
+        resolved = await resolve_blobs(offloaded, store)
+        again = await offload_blobs({**resolved, "status": "ok"}, store, threshold=1024)
+        assert again["series"] == offloaded["series"]
+        assert store.gets == 0
+
+    @pytest.mark.asyncio
+    async def test_unserializable_values_left_inline(self, store):
+        value = {object()}
+        assert (await offload_blobs({"v": value}, store, threshold=1))["v"] is value
+
+
+class TestBlobOffloadingRepository:
+    @pytest.mark.asyncio
+    async def test_dedup_across_experiments(self, store):
+        inner = FakePluginDataRepository()
+        repo = BlobOffloadingRepository(inner, store, threshold=1024)
+        await repo.save_analysis_result(1, "p", {"series": BIG})
+        await repo.save_analysis_result(2, "p", {"series": BIG, "status": "ok"})
+        assert inner.results[(1, "p")].result["series"][BLOB_KEY] == (
+            inner.results[(2, "p")].result["series"][BLOB_KEY]
+        )
+        assert len([p for p in store.root.rglob("*") if p.is_file()]) == 1
+
+    @pytest.mark.asyncio
+    async def test_reads_return_lazy_refs(self, store):
+        repo = BlobOffloadingRepository(FakePluginDataRepository(), store, threshold=1024)
+        await repo.save_analysis_result(1, "p", {"series": BIG})
+        result = await repo.get_analysis_result(1, "p")
+        assert await result.result["series"].load() == BIG
+        [listed] = await repo.get_analysis_results(1)
+        assert isinstance(listed.result["series"], BlobRef)
+        many = await repo.get_many_analysis_results([1, 2], "p")
+        assert list(many) == [1]
+        assert await repo.get_analysis_result(2, "p") is None
+
+    @pytest.mark.asyncio
+    async def test_passthrough(self, store):
+        inner = FakePluginDataRepository()
+        repo = BlobOffloadingRepository(inner, store)
+        await repo.save_experiment_data(1, "p", {"a": 1})
+        assert inner.design[1].data == {"a": 1}
+
+
+class BlobPlugin(AnalysisPlugin):
+    @property
+    def metadata(self) -> PluginMetadata:
+        return PluginMetadata(
+            name="blob-test",
+            version="1.0.0",
+            description="test",
+            analysis_type="test",
+            routes_prefix="/test",
+        )
+
+    def get_routers(self):
+        return []
+
+    async def initialize(self, context=None):
+        self._context = context
+
+    async def shutdown(self):
+        pass
+
+
+class TestPluginBlobStore:
+    def test_standalone_uses_local_store(self, tmp_path, monkeypatch):
+        monkeypatch.setenv("HOME", str(tmp_path))
+        store = BlobPlugin().get_blob_store()
+        assert isinstance(store, LocalBlobStore)
+        assert store.root == tmp_path / ".mld" / "plugins" / "blob-test" / "blobs"
+
+    def test_standalone_db_storage_dir_is_used(self, tmp_path):
+        plugin = BlobPlugin()
+        plugin._setup_standalone_db(storage_dir=tmp_path / "custom")
+        try:
+            assert plugin.get_blob_store().root == tmp_path / "custom" / "blobs"
+        finally:
+            plugin._teardown_standalone_db()
+
+    @pytest.mark.asyncio
+    async def test_platform_store_preferred(self, store):
+        class Context:
+            def get_blob_store(self):
+                return store
+
+        plugin = BlobPlugin()
+        await plugin.initialize(Context())
+        assert plugin.get_blob_store() is store
@@ -0,0 +1,57 @@
+from mld_sdk._cache import TTLCache
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class TestTTLCache:
+    def test_get_and_set(self):
+        cache = TTLCache(maxsize=2)
+        cache.set("a", 1)
+        assert cache.get("a") == 1
+        assert cache.get("b", "default") == "default"
+        assert cache.stats() == {"hits": 1, "misses": 1, "size": 1}
+
+    def test_lru_eviction(self):
+        cache = TTLCache(maxsize=2)
+        cache.set("a", 1)
+        cache.set("b", 2)
+        cache.get("a")
+        cache.set("c", 3)
+        assert "a" in cache
+        assert "b" not in cache
+        assert "c" in cache
+
+    def test_ttl_expiry(self):
+        clock = FakeClock()
+        cache = TTLCache(maxsize=10, ttl=5, clock=clock)
+        cache.set("a", 1)
+        cache.set("b", 2, ttl=None)
+        clock.now = 6
+        assert cache.get("a") is None
+        assert cache.get("b") == 2
+
+    def test_per_entry_ttl(self):
+        clock = FakeClock()
+        cache = TTLCache(maxsize=10, clock=clock)
+        cache.set("a", 1, ttl=1)
+        clock.now = 2
+        assert "a" not in cache
+
+    def test_zero_maxsize_disables(self):
+        cache = TTLCache(maxsize=0)
+        cache.set("a", 1)
+        assert len(cache) == 0
+
+    def test_discard_where(self):
+        cache = TTLCache()
+        cache.set(("ns", "a"), 1)
+        cache.set(("ns", "b"), 2)
+        cache.set(("other", "a"), 3)
+        assert cache.discard_where(lambda key: key[0] == "ns") == 2
+        assert len(cache) == 1
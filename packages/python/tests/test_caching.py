@@ -0,0 +1,267 @@
+import pytest
+
+from mld_sdk.caching import (
+    CachedExperimentRepository,
+    CachedPluginRoleRepository,
+    CachedUserRepository,
+    RepositoryCache,
+)
+from mld_sdk.models import PluginMetadata
+from mld_sdk.plugin import AnalysisPlugin
+from tests.fakes import (
+    BatchExperimentRepository,
+    FakeExperimentRepository,
+    FakePluginRoleRepository,
+    FakeUserRepository,
+    make_experiment,
+    make_user,
+)
+
+
+class FakeContext:
+    def __init__(self, experiments=None, users=None, roles=None):
+        self.experiment_repo = experiments
+        self.user_repo = users
+        self.role_repo = roles
+
+    def get_experiment_repository(self):
+        return self.experiment_repo
+
+    def get_user_repository(self):
+        return self.user_repo
+
+    def get_plugin_role_repository(self):
+        return self.role_repo
+
+
+class TestCachedExperimentRepository:
+    @pytest.mark.asyncio
+    async def test_get_by_id_hits_cache(self):
+        inner = FakeExperimentRepository([make_experiment(1)])
+        repo = CachedExperimentRepository(inner)
+        await repo.get_by_id(1)
+        await repo.get_by_id(1)
+        assert inner.calls == [("get_by_id", 1)]
+        assert repo.stats() == {"hits": 1, "misses": 1, "size": 1}
+
+    @pytest.mark.asyncio
+    async def test_missing_entities_are_not_cached(self):
+        inner = FakeExperimentRepository([])
+        repo = CachedExperimentRepository(inner)
+        assert await repo.get_by_id(1) is None
+        inner.experiments[1] = make_experiment(1)
+        assert (await repo.get_by_id(1)).id == 1
+
+    @pytest.mark.asyncio
+    async def test_ttl_expiry(self):
+        inner = FakeExperimentRepository([make_experiment(1)])
+        repo = CachedExperimentRepository(inner, ttl=0)
+        await repo.get_by_id(1)
+        await repo.get_by_id(1)
+        assert inner.calls == [("get_by_id", 1), ("get_by_id", 1)]
+
+    @pytest.mark.asyncio
+    async def test_bounded_size(self):
+        inner = FakeExperimentRepository([make_experiment(i) for i in range(5)])
+        repo = CachedExperimentRepository(inner, maxsize=2)
+        for i in range(5):
+            await repo.get_by_id(i)
+        assert repo.stats()["size"] == 2
+
+    @pytest.mark.asyncio
+    async def test_get_many_fetches_only_misses(self):
+        inner = BatchExperimentRepository([make_experiment(i) for i in range(4)])
+        repo = CachedExperimentRepository(inner)
+        await repo.get_by_id(0)
+        result = await repo.get_many([0, 1, 2])
+        assert sorted(result) == [0, 1, 2]
+        assert inner.calls == [("get_by_id", 0), ("get_many", [1, 2])]
+
+    @pytest.mark.asyncio
+    async def test_writes_invalidate(self):
+        inner = FakeExperimentRepository([make_experiment(1)])
+        repo = CachedExperimentRepository(inner)
+        await repo.get_by_id(1)
+        await repo.update(1, status="running")
+        assert (await repo.get_by_id(1)).status == "running"
+        await repo.delete(1)
+        assert await repo.get_by_id(1) is None
+
+    @pytest.mark.asyncio
+    async def test_read_racing_an_invalidate_is_not_cached(self):
+        inner = BatchExperimentRepository([make_experiment(i) for i in range(2)])
+        repo = CachedExperimentRepository(inner)
+        original_get_by_id, original_get_many = inner.get_by_id, inner.get_many
+
+        async def slow_get_by_id(experiment_id):
+            experiment = await original_get_by_id(experiment_id)
+            repo.invalidate(experiment_id)  # concurrent update lands here
+            return experiment
+
+        async def slow_get_many(experiment_ids):
+            experiments = await original_get_many(experiment_ids)
+            repo.invalidate(experiment_ids[0])
+            return experiments
+
+        inner.get_by_id, inner.get_many = slow_get_by_id, slow_get_many
+        assert (await repo.get_by_id(0)).id == 0
+        assert sorted(await repo.get_many([0, 1])) == [0, 1]
+        assert repo.stats()["size"] == 0
+
+    @pytest.mark.asyncio
+    async def test_passthrough(self):
+        inner = FakeExperimentRepository([make_experiment(1)])
+        repo = CachedExperimentRepository(inner)
+        experiments, total = await repo.list_all()
+        assert total == 1
+
+
+class TestRepositoryCache:
+    @pytest.mark.asyncio
+    async def test_wraps_context_repositories(self):
+        context = FakeContext(
+            FakeExperimentRepository([make_experiment(1)]),
+            FakeUserRepository([make_user(7)]),
+        )
+        cache = RepositoryCache(context, experiment_ttl=10, user_ttl=60)
+        assert isinstance(cache.users, CachedUserRepository)
+        await cache.experiments.get_by_id(1)
+        await cache.users.get_by_id(7)
+        await cache.users.get_by_id(7)
+        assert cache.stats() == {
+            "experiments": {"hits": 0, "misses": 1, "size": 1},
+            "users": {"hits": 1, "misses": 1, "size": 1},
+        }
+        cache.invalidate_user(7)
+        cache.invalidate_experiment(1)
+        assert cache.stats()["users"]["size"] == 0
+
+    def test_missing_repositories(self):
+        cache = RepositoryCache(FakeContext())
+        assert cache.experiments is None
+        cache.invalidate_experiment(1)  # no-op
+        assert cache.stats() == {}
+
+
+class TestPluginRepositoryCache:
+    def _plugin(self, context):
+        class CachingPlugin(AnalysisPlugin):
+            @property
+            def metadata(self) -> PluginMetadata:
+                return PluginMetadata(
+                    name="cache-test",
+                    version="1.0.0",
+                    description="test",
+                    analysis_type="test",
+                    routes_prefix="/test",
+                )
+
+            def get_routers(self):
+                return []
+
+            async def initialize(self, context=None):
+                self._context = context
+                self._setup_repository_cache(experiment_ttl=60)
+
+            async def shutdown(self):
+                pass
+
+        return CachingPlugin()
+
+    @pytest.mark.asyncio
+    async def test_standalone_has_no_cache(self):
+        plugin = self._plugin(None)
+        await plugin.initialize(None)
+        assert plugin.repository_cache is None
+
+    @pytest.mark.asyncio
+    async def test_hooks_invalidate(self):
+        inner = FakeExperimentRepository([make_experiment(1)])
+        plugin = self._plugin(None)
+        await plugin.initialize(FakeContext(inner))
+        repo = plugin.repository_cache.experiments
+        await repo.get_by_id(1)
+        await plugin.on_after_experiment_save(1, {})
+        await repo.get_by_id(1)
+        await plugin.on_experiment_status_change(1, "draft", "done")
+        await repo.get_by_id(1)
+        assert inner.calls == [("get_by_id", 1)] * 3
+
+
+class TestCachedPluginRoleRepository:
+    @pytest.mark.asyncio
+    async def test_get_role_cached_including_absent(self):
+        inner = FakePluginRoleRepository()
+        inner.roles[("p", 1)] = "admin"
+        repo = CachedPluginRoleRepository(inner)
+        assert await repo.get_role("p", 1) == "admin"
+        assert await repo.get_role("p", 1) == "admin"
+        assert await repo.get_role("p", 2) is None
+        assert await repo.get_role("p", 2) is None
+        assert [c for c, _ in inner.calls] == ["get_role", "get_role"]
+        assert repo.stats() == {"hits": 2, "misses": 2, "size": 2}
+
+    @pytest.mark.asyncio
+    async def test_writes_update_cache(self):
+        inner = FakePluginRoleRepository()
+        repo = CachedPluginRoleRepository(inner)
+        assert await repo.get_role("p", 1) is None
+        await repo.set_role("p", 1, "editor")
+        assert await repo.get_role("p", 1) == "editor"
+        await repo.remove_role("p", 1)
+        assert await repo.get_role("p", 1) is None
+        assert inner.calls.count(("get_role", ("p", 1))) == 2
+
+    @pytest.mark.asyncio
+    async def test_prefetch_serves_every_user(self):
+        inner = FakePluginRoleRepository()
+        inner.roles[("p", 1)] = "admin"
+        inner.roles[("p", 2)] = "viewer"
+        repo = CachedPluginRoleRepository(inner)
+        assert await repo.prefetch("p") == 2
+        assert await repo.get_role("p", 2) == "viewer"
+        assert await repo.get_role("p", 99) is None
+        assert await repo.has_role("p", 1, "admin", "editor")
+        assert not await repo.has_role("p", 2, "admin")
+        assert [c for c, _ in inner.calls] == ["list_plugin_roles"]
+
+    @pytest.mark.asyncio
+    async def test_set_role_drops_snapshot(self):
+        inner = FakePluginRoleRepository()
+        repo = CachedPluginRoleRepository(inner)
+        await repo.prefetch("p")
+        await repo.set_role("p", 1, "admin")
+        assert await repo.get_role("p", 1) == "admin"
+        assert await repo.get_role("p", 2) is None
+        assert ("get_role", ("p", 2)) in inner.calls
+
+    @pytest.mark.asyncio
+    async def test_read_racing_a_write_is_not_cached(self):
+        inner = FakePluginRoleRepository()
+        repo = CachedPluginRoleRepository(inner)
+        original = inner.get_role
+
+        async def slow_get_role(plugin_id, user_id):
+            role = await original(plugin_id, user_id)
+            repo.invalidate(plugin_id, user_id)  # concurrent write lands here
+            return role
+
+        inner.get_role = slow_get_role
+        await repo.get_role("p", 1)
+        assert repo.stats()["size"] == 0
+
+    @pytest.mark.asyncio
+    async def test_ttl_expiry(self):
+        inner = FakePluginRoleRepository()
+        repo = CachedPluginRoleRepository(inner, ttl=0)
+        await repo.prefetch("p")
+        await repo.get_role("p", 1)
+        assert ("get_role", ("p", 1)) in inner.calls
+
+    @pytest.mark.asyncio
+    async def test_repository_cache_wraps_roles(self):
+        context = FakeContext(roles=FakePluginRoleRepository())
+        cache = RepositoryCache(context, role_ttl=5)
+        assert isinstance(cache.roles, CachedPluginRoleRepository)
+        await cache.roles.get_role("p", 1)
+        assert cache.stats() == {"roles": {"hits": 0, "misses": 1, "size": 1}}
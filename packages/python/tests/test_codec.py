@@ -0,0 +1,273 @@
+import array
+import json
+import math
+from datetime import timedelta
+
+import pytest
+
+from mld_sdk.blobs import BlobOffloadingRepository, LocalBlobStore
+from mld_sdk.codec import (
+    CODEC_ID,
+    CodecRepository,
+    available_compressions,
+    codec_schema_version,
+    decode,
+    decode_payload,
+    encode,
+    encode_payload,
+    is_encoded,
+    negotiate_codec,
+    split_schema_version,
+)
+from mld_sdk.exceptions import (
+    ConfigurationException,
+    ConflictException,
+    NotFoundException,
+    ValidationException,
+)
+from mld_sdk.patching import patch_analysis_result, patch_experiment_data
+from mld_sdk.projection import get_analysis_result
+from tests.fakes import NOW, FakePluginDataRepository
+
+DOCUMENT = {
+    "status": "done",
+    "count": 3,
+    "big": 2**70,
+    "negative": -(2**63),
+    "flags": [True, False, None],
+    "mz": [100.0 + i / 7 for i in range(200)],
+    "short": [1.5, 2.5],
+    "mixed": [1, 2.0, "three", {"four": 4}],
+    "nested": {"unicode": "µg/mL ✓", "empty": {}, "list": []},
+    "raw": b"\x00\x01",
+    1: "int key",
+}
+
+
+class TestCodec:
+    @pytest.mark.parametrize("compression", available_compressions())
+    def test_round_trip(self, compression):
+        assert decode(encode(DOCUMENT, compression)) == DOCUMENT
+
+    def test_float_arrays_are_compact(self):
+        values = [math.pi * i for i in range(1000)]
+        encoded = encode({"values": values})
+        assert len(encoded) < 8 * 1000 + 64
+        assert len(encoded) < len(json.dumps(values)) / 2
+        assert decode(encoded)["values"] == values
+
+    def test_special_floats(self):
+        values = [math.inf, -math.inf, 0.0, -0.0, 1e-300, 1.0, 2.0, 3.0]
+        assert decode(encode(values)) == values
+        assert math.isnan(decode(encode([math.nan] * 8))[0])
+
+    def test_tuples_decode_as_lists(self):
+        assert decode(encode((1, 2))) == [1, 2]
+
+    def test_typed_arrays(self):
+        floats = array.array("f", [1.0, 2.0, 3.0])
+        decoded = decode(encode({"a": floats}))["a"]
+        assert list(decoded) == [1.0, 2.0, 3.0]
+
+    def test_numpy_arrays(self):
+        np = pytest.importorskip("numpy")
+        matrix = np.arange(12, dtype="f4").reshape(3, 4)
+        decoded = decode(encode({"m": matrix, "s": np.float64(1.5), "i": np.int32(7)}))
+        np.testing.assert_array_equal(decoded["m"], matrix)
+        assert decoded["s"] == 1.5 and decoded["i"] == 7
+
+    def test_compression_shrinks_repetitive_payloads(self):
+        document = {"rows": [{"well": "A1", "value": 1}] * 500}
+        assert len(encode(document, "zlib")) < len(encode(document)) / 10
+
+    def test_unsupported_type(self):
+        with pytest.raises(ValidationException):
+            encode({"s": {1, 2}})
+
+    def test_unknown_compression(self):
+        with pytest.raises(ValidationException):
+            encode({}, "brotli")
+
+    def test_missing_compression_library(self):
+        missing = next((c for c in ("zstd", "lz4") if c not in available_compressions()), None)
+        if missing is None:
+            pytest.skip("all compression libraries installed")
+        with pytest.raises(ConfigurationException):
+            encode({}, missing)
+
+    @pytest.mark.parametrize(
+        "blob", [b"", b"JSON\x01\x00N", b"MLDB\x09\x00N", b"MLDB\x01\x00s\x05ab", b"MLDB\x01\x00NN"]
+    )
+    def test_invalid_payloads(self, blob):
+        with pytest.raises(ValidationException):
+            decode(blob)
+
+
+class TestNegotiation:
+    def test_negotiate(self):
+        assert negotiate_codec(["json", CODEC_ID]) == CODEC_ID
+        assert negotiate_codec(["json"]) == "json"
+        assert negotiate_codec(["mldb/2"]) == "json"
+
+    def test_envelopes(self):
+        envelope = encode_payload({"a": 1}, compression="zlib")
+        assert is_encoded(envelope)
+        assert envelope["$codec"] == CODEC_ID
+        assert decode_payload(envelope) == {"a": 1}
+        assert encode_payload({"a": 1}, "json") == {"a": 1}
+        assert decode_payload({"a": 1}) == {"a": 1}
+
+    def test_schema_versions(self):
+        assert codec_schema_version("2.1", CODEC_ID) == "2.1+mldb.1"
+        assert split_schema_version("2.1+mldb.1") == ("2.1", CODEC_ID)
+        assert codec_schema_version("2.1", "json") == "2.1"
+        assert split_schema_version("2.1") == ("2.1", "json")
+        assert split_schema_version("2.0+lab.3") == ("2.0+lab.3", "json")
+        assert codec_schema_version("2.0+lab.3", CODEC_ID) == "2.0+lab.3+mldb.1"
+        assert split_schema_version("2.0+lab.3+mldb.1") == ("2.0+lab.3", CODEC_ID)
+
+
+class FakeContext:
+    def __init__(self, codecs):
+        self.repo = FakePluginDataRepository()
+        self.codecs = codecs
+
+    def get_plugin_data_repository(self):
+        return self.repo
+
+    def get_supported_codecs(self):
+        return self.codecs
+
+
+class NativePatchRepository(FakePluginDataRepository):
+    """Counts native patch calls, which would merge into the opaque envelope."""
+
+    native_patches = 0
+
+    async def patch_analysis_result(self, *args, **kwargs):
+        self.native_patches += 1
+
+    async def patch_experiment_data(self, *args, **kwargs):
+        self.native_patches += 1
+
+
+class TestCodecRepository:
+    @pytest.mark.asyncio
+    async def test_analysis_results_round_trip(self):
+        inner = FakePluginDataRepository()
+        repo = CodecRepository(inner, CODEC_ID, compression="zlib")
+        saved = await repo.save_analysis_result(1, "p", DOCUMENT)
+        assert saved.result == DOCUMENT
+        assert is_encoded(inner.results[(1, "p")].result)
+        assert (await repo.get_analysis_result(1, "p")).result == DOCUMENT
+        assert [r.result for r in await repo.get_analysis_results(1)] == [DOCUMENT]
+        assert (await repo.get_many_analysis_results([1], "p"))[1].result == DOCUMENT
+
+    @pytest.mark.asyncio
+    async def test_experiment_data_schema_version(self):
+        inner = FakePluginDataRepository()
+        repo = CodecRepository(inner, CODEC_ID)
+        saved = await repo.save_experiment_data(1, "p", {"plate": 96}, schema_version="2.0")
+        assert inner.design[1].schema_version == "2.0+mldb.1"
+        assert saved.schema_version == "2.0"
+        data = await repo.get_experiment_data(1)
+        assert data.data == {"plate": 96} and data.schema_version == "2.0"
+
+    @pytest.mark.asyncio
+    async def test_plain_json_rows_read_unchanged(self):
+        inner = FakePluginDataRepository()
+        await inner.save_analysis_result(1, "p", {"legacy": True})
+        repo = CodecRepository(inner, CODEC_ID)
+        assert (await repo.get_analysis_result(1, "p")).result == {"legacy": True}
+
+    @pytest.mark.asyncio
+    async def test_fields_are_projected_after_decoding(self):
+        inner = FakePluginDataRepository()
+        repo = CodecRepository(inner, CODEC_ID)
+        await repo.save_analysis_result(1, "p", DOCUMENT)
+        await inner.save_analysis_result(2, "p", {"status": "legacy", "count": 1})
+        await repo.save_experiment_data(1, "p", {"plate": 96, "rows": 8}, schema_version="2.0")
+        fields = ["status", "nested.unicode"]
+        expected = {"status": "done", "nested": {"unicode": "µg/mL ✓"}}
+        assert (await repo.get_analysis_result(1, "p", fields=fields)).result == expected
+        assert [r.result for r in await repo.get_analysis_results(1, fields=fields)] == [expected]
+        many = await repo.get_many_analysis_results([1, 2], "p", fields=["status"])
+        assert {eid: r.result for eid, r in many.items()} == {
+            1: {"status": "done"},
+            2: {"status": "legacy"},
+        }
+        data = await repo.get_experiment_data(1, fields=["rows"])
+        assert data.data == {"rows": 8} and data.schema_version == "2.0"
+
+    @pytest.mark.asyncio
+    async def test_blob_offloading_forwards_fields(self, tmp_path):
+        codec_repo = CodecRepository(FakePluginDataRepository(), CODEC_ID)
+        repo = BlobOffloadingRepository(codec_repo, LocalBlobStore(tmp_path))
+        await repo.save_analysis_result(1, "p", DOCUMENT)
+        result = await get_analysis_result(repo, 1, "p", fields=["count"])
+        assert result.result == {"count": 3}
+        assert (await repo.get_analysis_results(1, fields=["count"]))[0].result == {"count": 3}
+
+    @pytest.mark.asyncio
+    async def test_patch_analysis_result_decodes_and_re_encodes(self):
+        inner = NativePatchRepository()
+        repo = CodecRepository(inner, CODEC_ID)
+        await repo.save_analysis_result(1, "p", {"status": "running", "mz": [1.5, 2.5]})
+        patched = await repo.patch_analysis_result(1, "p", {"status": "done"}, if_updated_at=NOW)
+        assert patched.result == {"status": "done", "mz": [1.5, 2.5]}
+        assert is_encoded(inner.results[(1, "p")].result)
+        assert (await repo.get_analysis_result(1, "p")).result["status"] == "done"
+        patched = await patch_analysis_result(
+            repo, 1, "p", [{"op": "remove", "path": "/mz"}], patch_format="json-patch"
+        )
+        assert patched.result == {"status": "done"}
+        assert inner.native_patches == 0
+
+    @pytest.mark.asyncio
+    async def test_patch_experiment_data_keeps_schema_version(self):
+        inner = NativePatchRepository()
+        repo = CodecRepository(inner, CODEC_ID)
+        await repo.save_experiment_data(1, "p", {"plate": 96}, schema_version="2.0")
+        patched = await patch_experiment_data(repo, 1, "p", {"rows": 8})
+        assert patched.data == {"plate": 96, "rows": 8}
+        assert patched.schema_version == "2.0"
+        assert inner.design[1].schema_version == "2.0+mldb.1"
+        assert inner.native_patches == 0
+
+    @pytest.mark.asyncio
+    async def test_patch_preconditions(self):
+        repo = CodecRepository(FakePluginDataRepository(), CODEC_ID)
+        with pytest.raises(NotFoundException):
+            await repo.patch_analysis_result(1, "p", {"a": 1})
+        with pytest.raises(NotFoundException):
+            await repo.patch_experiment_data(1, "p", {"a": 1})
+        await repo.save_analysis_result(1, "p", {"a": 1})
+        stale = NOW - timedelta(seconds=1)
+        with pytest.raises(ConflictException):
+            await repo.patch_analysis_result(1, "p", {"a": 2}, if_updated_at=stale)
+        assert (await repo.get_analysis_result(1, "p")).result == {"a": 1}
+
+    @pytest.mark.asyncio
+    async def test_for_context_falls_back_to_json(self):
+        context = FakeContext(["json"])
+        repo = CodecRepository.for_context(context)
+        assert repo.codec == "json"
+        await repo.save_analysis_result(1, "p", {"a": 1.0})
+        assert context.repo.results[(1, "p")].result == {"a": 1.0}
+
+    def test_for_context_negotiates_binary(self):
+        assert CodecRepository.for_context(FakeContext(["json", CODEC_ID])).codec == CODEC_ID
+
+    @pytest.mark.asyncio
+    async def test_defaults_to_json(self):
+        inner = FakePluginDataRepository()
+        repo = CodecRepository(inner)
+        await repo.save_experiment_data(1, "p", {"plate": 96}, schema_version="2.0+lab.3")
+        assert inner.design[1].data == {"plate": 96}
+        assert inner.design[1].schema_version == "2.0+lab.3"
+        data = await repo.get_experiment_data(1, fields=["plate"])
+        assert data.schema_version == "2.0+lab.3"
+
+    def test_unknown_codec(self):
+        with pytest.raises(ValidationException):
+            CodecRepository(FakePluginDataRepository(), codec="cbor")
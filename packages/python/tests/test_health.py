@@ -0,0 +1,119 @@
+import asyncio
+
+import pytest
+
+from mld_sdk.exceptions import NotFoundException
+from mld_sdk.health import HealthAggregator, _percentile
+from mld_sdk.host import PluginHost
+from mld_sdk.plugin import HealthStatus, PluginHealth
+
+from tests.test_host import DelayPlugin
+
+
+class HealthPlugin(DelayPlugin):
+    def __init__(self, name, delay=0.0, status=HealthStatus.HEALTHY, raises=False):
+        super().__init__(name)
+        self.health_delay = delay
+        self.status = status
+        self.raises = raises
+        self.checks = 0
+
+    async def check_health(self):
+        self.checks += 1
+        await asyncio.sleep(self.health_delay)
+        if self.raises:
+            raise RuntimeError("db down")
+        return PluginHealth(status=self.status)
+
+
+class TestHealthAggregator:
+    @pytest.mark.asyncio
+    async def test_refresh_concurrently_with_deadline(self):
+        plugins = [HealthPlugin(f"p{i}", delay=0.05) for i in range(10)]
+        plugins.append(HealthPlugin("stuck", delay=5.0))
+        plugins.append(HealthPlugin("broken", raises=True))
+        aggregator = HealthAggregator(plugins, timeout=0.2)
+        started = asyncio.get_running_loop().time()
+        results = await aggregator.refresh()
+        assert asyncio.get_running_loop().time() - started < 1.0
+        assert results["p0"].status == HealthStatus.HEALTHY
+        assert results["stuck"].status == HealthStatus.DEGRADED
+        assert "exceeded" in results["stuck"].message
+        assert results["broken"].status == HealthStatus.UNKNOWN
+        assert aggregator.overall() == HealthStatus.UNKNOWN
+        assert aggregator.stats("stuck").timeouts == 1
+
+    @pytest.mark.asyncio
+    async def test_cached_reads_do_not_call_plugins(self):
+        plugin = HealthPlugin("a")
+        aggregator = HealthAggregator([plugin], timeout_status=HealthStatus.UNKNOWN)
+        assert aggregator.get("a").status == HealthStatus.UNKNOWN
+        assert aggregator.overall() == HealthStatus.UNKNOWN
+        await aggregator.refresh()
+        for _ in range(5):
+            assert aggregator.get("a").status == HealthStatus.HEALTHY
+            aggregator.to_dict()
+        assert plugin.checks == 1
+
+    @pytest.mark.asyncio
+    async def test_background_refresh_and_stale(self):
+        plugin = HealthPlugin("a")
+        aggregator = HealthAggregator([plugin], interval=0.02, stale_after=0.05)
+        await aggregator.start()
+        assert plugin.checks == 1 and aggregator.running
+        await asyncio.sleep(0.1)
+        assert plugin.checks >= 3
+        plugin.status = HealthStatus.UNHEALTHY
+        await asyncio.sleep(0.05)
+        assert aggregator.overall() == HealthStatus.UNHEALTHY
+        await aggregator.stop()
+        assert not aggregator.running
+        await asyncio.sleep(0.1)
+        stale = aggregator.get("a")
+        assert stale.status == HealthStatus.UNKNOWN
+        assert "ago" in stale.message
+
+    @pytest.mark.asyncio
+    async def test_history_ring_buffer_and_stats(self):
+        plugin = HealthPlugin("a", delay=0.01)
+        aggregator = HealthAggregator([plugin], history_size=3)
+        for _ in range(5):
+            await aggregator.refresh()
+        history = aggregator.history("a")
+        assert len(history) == 3
+        stats = aggregator.stats("a")
+        assert stats.samples == 3 and stats.unhealthy == 0 and stats.timeouts == 0
+        assert 0 < stats.min_seconds <= stats.p50_seconds <= stats.p95_seconds <= stats.max_seconds
+        assert stats.last_seconds == history[-1].latency_seconds
+        with pytest.raises(NotFoundException):
+            aggregator.stats("missing")
+
+        report = aggregator.to_dict()
+        assert report["status"] == "healthy"
+        assert report["plugins"]["a"]["latency"]["samples"] == 3
+
+    def test_percentile_nearest_rank(self):
+        assert _percentile([float(i) for i in range(1, 11)], 0.50) == 5.0
+        twenty = [float(i) for i in range(1, 21)]
+        assert _percentile(twenty, 0.50) == 10.0
+        assert _percentile(twenty, 0.95) == 19.0
+        assert _percentile([3.0], 0.95) == 3.0
+        assert _percentile(twenty, 0.0) == 1.0 and _percentile(twenty, 1.0) == 20.0
+
+    @pytest.mark.asyncio
+    async def test_concurrent_refreshes_share_checks(self):
+        plugin = HealthPlugin("a", delay=0.05)
+        aggregator = HealthAggregator([plugin])
+        await asyncio.gather(aggregator.refresh(), aggregator.refresh())
+        assert plugin.checks == 1
+
+    @pytest.mark.asyncio
+    async def test_for_host(self):
+        host = PluginHost()
+        host.add(HealthPlugin("a", status=HealthStatus.DEGRADED))
+        aggregator = HealthAggregator.for_host(host)
+        assert await aggregator.refresh() == {}
+        assert aggregator.overall() == HealthStatus.HEALTHY
+        await host.start()
+        await aggregator.refresh()
+        assert aggregator.overall() == HealthStatus.DEGRADED
@@ -0,0 +1,134 @@
+import asyncio
+
+import pytest
+
+from mld_sdk.hooks import HookDispatcher
+from mld_sdk.host import PluginHost
+from mld_sdk.plugin import LifecycleHookResult
+
+from tests.test_host import DelayPlugin
+
+
+class HookPlugin(DelayPlugin):
+    def __init__(self, name, before_delay=0.0, verdict=True, after_delay=0.0, raises=False):
+        super().__init__(name)
+        self.before_delay = before_delay
+        self.verdict = verdict
+        self.after_delay = after_delay
+        self.raises = raises
+        self.calls = []
+        self.cancelled = False
+
+    async def on_before_experiment_save(self, experiment_id, data):
+        try:
+            await asyncio.sleep(self.before_delay)
+        except asyncio.CancelledError:
+            self.cancelled = True
+            raise
+        if self.raises:
+            raise RuntimeError("hook broke")
+        self.calls.append(("before", experiment_id))
+        return LifecycleHookResult(success=self.verdict, message=f"{self._name} says no")
+
+    async def on_after_experiment_save(self, experiment_id, data):
+        await asyncio.sleep(self.after_delay)
+        if self.raises:
+            raise RuntimeError("hook broke")
+        self.calls.append(("after", experiment_id))
+
+    async def on_experiment_status_change(self, experiment_id, old_status, new_status):
+        self.calls.append(("status", experiment_id, old_status, new_status))
+
+
+class TestBeforeHooks:
+    @pytest.mark.asyncio
+    async def test_runs_concurrently(self):
+        plugins = [HookPlugin(f"p{i}", before_delay=0.05) for i in range(10)]
+        dispatcher = HookDispatcher(plugins)
+        started = asyncio.get_running_loop().time()
+        result = await dispatcher.before_experiment_save(1, {})
+        assert asyncio.get_running_loop().time() - started < 0.3
+        assert result.success and result.message is None
+        assert {o.status for o in result.outcomes} == {"ok"}
+        assert all(p.calls == [("before", 1)] for p in plugins)
+
+    @pytest.mark.asyncio
+    async def test_short_circuits_on_failure(self):
+        slow = HookPlugin("slow", before_delay=5.0)
+        dispatcher = HookDispatcher([HookPlugin("veto", verdict=False), slow])
+        result = await dispatcher.before_experiment_save(1, {})
+        assert not result.success
+        assert result.failed.plugin_name == "veto"
+        assert result.message == "veto: veto says no"
+        assert slow.cancelled
+        assert {o.plugin_name: o.status for o in result.outcomes} == {
+            "veto": "failed",
+            "slow": "cancelled",
+        }
+
+    @pytest.mark.asyncio
+    async def test_exceptions_and_timeouts(self):
+        result = await HookDispatcher([HookPlugin("x", raises=True)]).before_experiment_save(1, {})
+        assert result.failed.status == "error"
+        assert "hook broke" in result.message
+
+        slow = [HookPlugin("slow", before_delay=1.0)]
+        result = await HookDispatcher(slow, timeout=0.01).before_experiment_save(1, {})
+        assert result.failed.status == "timeout"
+        result = await HookDispatcher(
+            slow, timeout=0.01, fail_on_timeout=False
+        ).before_experiment_save(1, {})
+        assert result.success
+        assert result.outcomes[0].status == "timeout"
+
+    @pytest.mark.asyncio
+    async def test_skips_default_hooks(self):
+        plain = DelayPlugin("plain")
+        result = await HookDispatcher([plain]).before_experiment_save(1, {})
+        assert result.success and result.outcomes == []
+
+
+class TestBackgroundHooks:
+    @pytest.mark.asyncio
+    async def test_after_save_is_queued(self):
+        plugins = [HookPlugin("a", after_delay=0.05), HookPlugin("b", raises=True)]
+        dispatcher = HookDispatcher(plugins)
+        assert dispatcher.after_experiment_save(7, {"x": 1}) == 2
+        assert plugins[0].calls == []
+        await dispatcher.drain()
+        assert plugins[0].calls == [("after", 7)]
+        stats = dispatcher.stats()
+        assert stats["queued"] == 2 and stats["processed"] == 2 and stats["failed"] == 1
+        assert dispatcher.recent_failures[0].plugin_name == "b"
+        await dispatcher.stop()
+
+    @pytest.mark.asyncio
+    async def test_status_change_and_foreground(self):
+        plugin = HookPlugin("a")
+        dispatcher = HookDispatcher([plugin])
+        dispatcher.experiment_status_change(3, "draft", "ongoing")
+        await dispatcher.drain()
+        outcomes = await dispatcher.after_experiment_save(3, {}, background=False)
+        assert [o.status for o in outcomes] == ["ok"]
+        assert plugin.calls == [("status", 3, "draft", "ongoing"), ("after", 3)]
+        await dispatcher.stop()
+
+    @pytest.mark.asyncio
+    async def test_full_queue_drops_and_stop_discards(self):
+        plugin = HookPlugin("slow", after_delay=1.0)
+        dispatcher = HookDispatcher([plugin], workers=1, max_queue=2)
+        queued = sum(dispatcher.after_experiment_save(i, {}) for i in range(5))
+        await asyncio.sleep(0)
+        assert queued == 2
+        assert dispatcher.stats()["dropped"] == 3
+        assert await dispatcher.stop(timeout=0.01) >= 1
+        assert dispatcher.stats()["pending"] == 0
+
+    @pytest.mark.asyncio
+    async def test_for_host_uses_ready_plugins(self):
+        host = PluginHost()
+        host.add(HookPlugin("a", verdict=False))
+        dispatcher = HookDispatcher.for_host(host)
+        assert (await dispatcher.before_experiment_save(1, {})).success
+        await host.start()
+        assert not (await dispatcher.before_experiment_save(1, {})).success
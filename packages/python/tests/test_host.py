@@ -0,0 +1,173 @@
+import asyncio
+from importlib.metadata import EntryPoint
+
+import pytest
+from fastapi import APIRouter, FastAPI
+
+from mld_sdk import host as host_module
+from mld_sdk.exceptions import ConflictException, PluginLifecycleException
+from mld_sdk.host import PluginHost
+from mld_sdk.models import PluginMetadata
+from mld_sdk.plugin import AnalysisPlugin
+
+
+class DelayPlugin(AnalysisPlugin):
+    def __init__(self, name="delay", delay=0.0, deps=(), fail=False, log=None):
+        self._name = name
+        self.delay = delay
+        self.deps = list(deps)
+        self.fail = fail
+        self.log = log if log is not None else []
+        self.router = APIRouter()
+        self.router.add_api_route("/ping", lambda: {"ok": True})
+
+    @property
+    def metadata(self) -> PluginMetadata:
+        return PluginMetadata(
+            name=self._name,
+            version="1.0.0",
+            description="test",
+            analysis_type="test",
+            routes_prefix=f"/{self._name}",
+        )
+
+    def get_routers(self):
+        return [(self.router, "")]
+
+    def get_plugin_dependencies(self):
+        return self.deps
+
+    async def initialize(self, context=None):
+        self._context = context
+        self.log.append(("start", self._name))
+        await asyncio.sleep(self.delay)
+        if self.fail:
+            raise RuntimeError("boom")
+        self.log.append(("ready", self._name))
+
+    async def shutdown(self):
+        self.log.append(("shutdown", self._name))
+
+
+def statuses(report):
+    return {s.name: s.status for s in report}
+
+
+class TestPluginHost:
+    @pytest.mark.asyncio
+    async def test_initializes_concurrently(self):
+        host = PluginHost()
+        for i in range(10):
+            host.add(DelayPlugin(f"p{i}", delay=0.05))
+        loop = asyncio.get_running_loop()
+        started = loop.time()
+        report = await host.start()
+        assert loop.time() - started < 0.3
+        assert set(statuses(report).values()) == {"ready"}
+        assert all(s.initialize_seconds >= 0.04 for s in report)
+        assert len(host.plugins) == 10
+
+    @pytest.mark.asyncio
+    async def test_dependencies_are_respected(self):
+        log = []
+        host = PluginHost()
+        host.add(DelayPlugin("app", deps=["core"], log=log))
+        host.add(DelayPlugin("core", delay=0.02, log=log))
+        report = await host.start()
+        assert log.index(("ready", "core")) < log.index(("start", "app"))
+        app = next(s for s in report if s.name == "app")
+        assert app.wait_seconds >= 0.015
+        assert [s.name for s in report] == ["core", "app"]
+
+    @pytest.mark.asyncio
+    async def test_depends_on_overrides_declared(self):
+        log = []
+        host = PluginHost()
+        host.add(DelayPlugin("a", log=log), depends_on=["b"])
+        host.add(DelayPlugin("b", delay=0.01, log=log))
+        await host.start()
+        assert log.index(("ready", "b")) < log.index(("start", "a"))
+
+    @pytest.mark.asyncio
+    async def test_failures_skip_dependents(self):
+        host = PluginHost()
+        host.add(DelayPlugin("core", fail=True))
+        host.add(DelayPlugin("app", deps=["core"]))
+        host.add(DelayPlugin("other"))
+        host.add(DelayPlugin("orphan", deps=["missing"]))
+        report = await host.start()
+        assert statuses(report) == {
+            "core": "failed",
+            "app": "skipped",
+            "other": "ready",
+            "orphan": "skipped",
+        }
+        core = next(s for s in report if s.name == "core")
+        assert "boom" in core.error
+        assert list(host.plugins) == ["other"]
+
+    @pytest.mark.asyncio
+    async def test_timeout(self):
+        host = PluginHost(timeout=0.01)
+        host.add(DelayPlugin("slow", delay=1.0))
+        host.add(DelayPlugin("patient", delay=0.02), timeout=1.0)
+        report = await host.start()
+        assert statuses(report) == {"slow": "timeout", "patient": "ready"}
+
+    @pytest.mark.asyncio
+    async def test_cycles_fail(self):
+        host = PluginHost()
+        host.add(DelayPlugin("a", deps=["b"]))
+        host.add(DelayPlugin("b", deps=["a"]))
+        host.add(DelayPlugin("c", deps=["a"]))
+        report = await host.start()
+        assert statuses(report) == {"a": "failed", "b": "failed", "c": "skipped"}
+
+    @pytest.mark.asyncio
+    async def test_raise_on_failure(self):
+        host = PluginHost()
+        host.add(DelayPlugin("bad", fail=True))
+        with pytest.raises(PluginLifecycleException) as exc:
+            await host.start(raise_on_failure=True)
+        assert exc.value.details["plugins"]["bad"].startswith("initialize() failed")
+
+    @pytest.mark.asyncio
+    async def test_mounts_routers(self):
+        app = FastAPI()
+        host = PluginHost(app=app)
+        host.add(DelayPlugin("peaks"))
+        await host.start()
+        assert "/peaks/ping" in app.openapi()["paths"]
+
+    @pytest.mark.asyncio
+    async def test_shutdown_reverse_order(self):
+        log = []
+        host = PluginHost()
+        host.add(DelayPlugin("app", deps=["core"], log=log))
+        host.add(DelayPlugin("core", log=log))
+        await host.start()
+        assert await host.shutdown() == {}
+        shutdowns = [name for event, name in log if event == "shutdown"]
+        assert shutdowns == ["app", "core"]
+        assert host.plugins == {}
+
+    def test_duplicate_names(self):
+        host = PluginHost()
+        host.add(DelayPlugin("x"))
+        with pytest.raises(ConflictException):
+            host.add(DelayPlugin("x"))
+
+    @pytest.mark.asyncio
+    async def test_discover(self, monkeypatch):
+        eps = [
+            EntryPoint("good", "tests.test_host:DelayPlugin", "mld.plugins"),
+            EntryPoint("broken", "tests.does_not_exist:Plugin", "mld.plugins"),
+        ]
+        monkeypatch.setattr(host_module, "entry_points", lambda group: eps)
+        host = PluginHost()
+        assert host.discover() == ["delay"]
+        report = await host.start()
+        assert statuses(report) == {"broken": "failed", "delay": "ready"}
+        broken = next(s for s in report if s.name == "broken")
+        assert broken.error.startswith("import failed")
+        assert report[0].to_dict()["total_seconds"] >= 0
@@ -0,0 +1,83 @@
+import ast
+import json
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+import mld_sdk
+
+# Generous enough for slow CI machines; the eager package took ~700ms.
+IMPORT_BUDGET_SECONDS = 0.15
+HEAVY_MODULES = ("sqlmodel", "sqlalchemy", "numpy", "fastapi", "orjson")
+
+
+def run_python(code):
+    src = str(Path(mld_sdk.__file__).parent.parent)
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", code],
+        capture_output=True,
+        text=True,
+        check=True,
+        env={**os.environ, "PYTHONPATH": src},
+    )
+    return result.stdout, result.stderr
+
+
+def cumulative_import_seconds(importtime_log, module):
+    for line in importtime_log.splitlines():
+        parts = [part.strip() for part in line.removeprefix("import time:").split("|")]
+        if len(parts) == 3 and parts[2] == module:
+            return int(parts[1]) / 1e6
+    raise AssertionError(f"{module} not in import time log")
+
+
+class TestLazyImport:
+    def test_import_is_cheap(self):
+        stdout, stderr = run_python(
+            "import sys, json, mld_sdk; "
+            f"print(json.dumps([m for m in {HEAVY_MODULES!r} if m in sys.modules]))"
+        )
+        assert json.loads(stdout) == []
+        assert cumulative_import_seconds(stderr, "mld_sdk") < IMPORT_BUDGET_SECONDS
+
+    def test_plugin_api_does_not_load_local_database(self):
+        stdout, _ = run_python(
+            "import sys; from mld_sdk import AnalysisPlugin, PluginMetadata, PlatformContext; "
+            "print('mld_sdk.local_database' in sys.modules, 'sqlalchemy' in sys.modules)"
+        )
+        assert stdout.split() == ["False", "False"]
+
+    def test_all_public_names_resolve(self):
+        for name in mld_sdk.__all__:
+            assert getattr(mld_sdk, name) is not None, name
+        assert set(mld_sdk.__all__) == set(mld_sdk._LAZY_IMPORTS)
+        assert set(mld_sdk.__all__) <= set(dir(mld_sdk))
+        from mld_sdk.local_database import LocalDatabase
+
+        assert mld_sdk.LocalDatabase is LocalDatabase
+        assert isinstance(mld_sdk.__version__, str)
+
+    def test_type_checking_imports_match(self):
+        tree = ast.parse(Path(mld_sdk.__file__).read_text())
+        block = next(
+            node
+            for node in tree.body
+            if isinstance(node, ast.If) and getattr(node.test, "id", None) == "TYPE_CHECKING"
+        )
+        declared = {
+            alias.name: node.module
+            for node in block.body
+            if isinstance(node, ast.ImportFrom)
+            for alias in node.names
+        }
+        assert declared == mld_sdk._LAZY_IMPORTS
+
+    def test_submodules_and_unknown_names(self):
+        assert mld_sdk.local_database.LocalDatabase is mld_sdk.LocalDatabase
+        with pytest.raises(AttributeError):
+            mld_sdk.does_not_exist
+        with pytest.raises(ImportError):
+            exec("from mld_sdk import does_not_exist")
@@ -38,6 +38,10 @@ class TestLocalDatabaseConfig:
         assert config.storage_dir is None
         assert config.db_filename == "data.db"
         assert config.echo_sql is False
+        assert config.pool_size == 5
+        assert config.max_overflow == 10
+        assert config.pool_pre_ping is False
+        assert config.warm_up is False
 
     def test_custom_values(self, tmp_path: Path):
         config = LocalDatabaseConfig(
@@ -113,6 +117,110 @@ class TestLocalDatabaseLifecycle:
         ldb.close()  # should not raise
 
 
+# --- SQLite performance profile ---
+
+
+def _read_pragma(ldb: LocalDatabase, name: str):
+    from sqlalchemy import text
+
+    with ldb.engine.connect() as conn:
+        return conn.execute(text(f"PRAGMA {name}")).scalar()
+
+
+class TestSqliteProfile:
+    def test_default_profile_is_balanced(self):
+        pragmas = LocalDatabaseConfig().sqlite_pragmas()
+        assert pragmas["journal_mode"] == "WAL"
+        assert pragmas["synchronous"] == "NORMAL"
+        assert pragmas["temp_store"] == "MEMORY"
+
+    def test_no_profile(self):
+        assert LocalDatabaseConfig(profile=None).sqlite_pragmas() == {}
+
+    def test_field_overrides_profile(self):
+        config = LocalDatabaseConfig(profile="throughput", synchronous="normal")
+        pragmas = config.sqlite_pragmas()
+        assert pragmas["synchronous"] == "NORMAL"
+        assert pragmas["mmap_size"] == 1024 * 1024 * 1024
+
+    def test_unknown_profile_raises(self):
+        with pytest.raises(ConfigurationException, match="Unknown SQLite profile"):
+            LocalDatabaseConfig(profile="fast").sqlite_pragmas()
+
+    def test_invalid_pragma_value_raises(self):
+        with pytest.raises(ConfigurationException, match="journal_mode"):
+            LocalDatabaseConfig(journal_mode="WAL; DROP TABLE x").sqlite_pragmas()
+        with pytest.raises(ConfigurationException, match="integer"):
+            LocalDatabaseConfig(cache_size="big").sqlite_pragmas()
+
+    def test_pragmas_applied_to_sync_connections(self, tmp_storage: Path):
+        config = LocalDatabaseConfig(
+            storage_dir=tmp_storage, profile="durable", busy_timeout=1234
+        )
+        ldb = LocalDatabase("test-plugin", config)
+        ldb.initialize()
+        assert _read_pragma(ldb, "journal_mode") == "wal"
+        assert _read_pragma(ldb, "synchronous") == 2  # FULL
+        assert _read_pragma(ldb, "busy_timeout") == 1234
+        ldb.close()
+
+    @pytest.mark.asyncio
+    async def test_pragmas_applied_to_async_connections(self, db: LocalDatabase):
+        from sqlalchemy import text
+
+        async with db.get_async_session() as session:
+            result = await session.execute(text("PRAGMA temp_store"))
+            assert result.scalar() == 2  # MEMORY
+
+
+# --- Engine and session factory ---
+
+
+class TestEngineSetup:
+    def test_pool_settings_applied(self, tmp_storage: Path):
+        config = LocalDatabaseConfig(
+            storage_dir=tmp_storage, pool_size=3, max_overflow=2
+        )
+        ldb = LocalDatabase("test-plugin", config)
+        ldb.initialize()
+        assert ldb.engine.pool.size() == 3
+        assert ldb._async_engine.pool.size() == 3
+        ldb.close()
+
+    def test_warm_up_opens_sync_connections(self, tmp_storage: Path):
+        config = LocalDatabaseConfig(storage_dir=tmp_storage, pool_size=2, warm_up=True)
+        ldb = LocalDatabase("test-plugin", config)
+        ldb.initialize()
+        assert ldb.engine.pool.checkedin() == 2
+        ldb.close()
+
+    @pytest.mark.asyncio
+    async def test_async_session_factory_is_reused(self, db: LocalDatabase):
+        factory = db._async_session_factory
+        async with db.get_async_session():
+            pass
+        async with db.get_async_session():
+            pass
+        assert db._async_session_factory is factory
+
+    @pytest.mark.asyncio
+    async def test_async_warm_up(self, tmp_storage: Path):
+        config = LocalDatabaseConfig(storage_dir=tmp_storage, pool_size=2)
+        ldb = LocalDatabase("test-plugin", config)
+        ldb.initialize()
+        await ldb.warm_up()
+        assert ldb._async_engine.pool.checkedin() == 2
+        await ldb._async_engine.dispose()
+        ldb.close()
+
+    @pytest.mark.asyncio
+    async def test_async_session_before_init_raises(self, tmp_storage: Path):
+        ldb = LocalDatabase("test-plugin", LocalDatabaseConfig(storage_dir=tmp_storage))
+        with pytest.raises(ConfigurationException, match="not initialized"):
+            async with ldb.get_async_session():
+                pass
+
+
 # --- Custom models ---
 
 
@@ -127,6 +235,16 @@ class CustomReading(SQLModel, table=True):
     channel: str
 
 
+class KeyedReading(SQLModel, table=True):
+    """Test model with a natural key for upserts."""
+
+    __tablename__ = "keyed_reading"
+
+    experiment_id: str = SQLField(primary_key=True)
+    channel: str = SQLField(primary_key=True)
+    intensity: float
+
+
 class TestCustomModels:
     def test_create_custom_table(self, tmp_storage: Path):
         config = LocalDatabaseConfig(storage_dir=tmp_storage)
@@ -315,6 +433,21 @@ class TestPluginIntegration:
 
         await plugin.shutdown()
 
+    @pytest.mark.asyncio
+    async def test_get_local_database_config_is_used(self, tmp_path: Path):
+        TestPlugin = self._make_plugin_class()
+
+        class ConfiguredPlugin(TestPlugin):
+            def get_local_database_config(self):
+                return LocalDatabaseConfig(
+                    storage_dir=tmp_path / "configured", db_filename="custom.db"
+                )
+
+        plugin = ConfiguredPlugin()
+        await plugin.initialize()
+        assert plugin.local_db.db_path == tmp_path / "configured" / "custom.db"
+        await plugin.shutdown()
+
     @pytest.mark.asyncio
     async def test_setup_without_args_uses_default_path(self):
         """_setup_local_database() with no args uses ~/.mld/plugins/<name>/data.db."""
@@ -328,3 +461,643 @@ class TestPluginIntegration:
         assert plugin.local_db.db_path == expected
 
         await plugin.shutdown()
+
+
+# --- Serialized writes ---
+
+
+class TestSerializedWrites:
+    @pytest.fixture
+    def writer_db(self, tmp_storage: Path) -> LocalDatabase:
+        config = LocalDatabaseConfig(
+            storage_dir=tmp_storage, serialize_writes=True, write_batch_size=8
+        )
+        ldb = LocalDatabase("test-plugin", config)
+        ldb.initialize(models=[CustomReading])
+        yield ldb
+        ldb.close()
+
+    @staticmethod
+    def _insert(exp_id: str):
+        async def work(session):
+            session.add(CustomReading(experiment_id=exp_id, intensity=1.0, channel="A"))
+            await session.flush()
+            return exp_id
+
+        return work
+
+    @staticmethod
+    def _count(ldb: LocalDatabase) -> int:
+        from sqlmodel import select
+
+        with ldb.get_session() as session:
+            return len(session.exec(select(CustomReading)).all())
+
+    @pytest.mark.asyncio
+    async def test_run_write_without_serialization(self, tmp_storage: Path):
+        ldb = LocalDatabase("test-plugin", LocalDatabaseConfig(storage_dir=tmp_storage))
+        ldb.initialize(models=[CustomReading])
+        assert await ldb.run_write(self._insert("exp-1")) == "exp-1"
+        assert self._count(ldb) == 1
+        ldb.close()
+
+    @pytest.mark.asyncio
+    async def test_concurrent_writes_are_committed(self, writer_db: LocalDatabase):
+        import asyncio
+
+        results = await asyncio.gather(
+            *(writer_db.run_write(self._insert(f"exp-{i}")) for i in range(50))
+        )
+        assert results == [f"exp-{i}" for i in range(50)]
+        assert self._count(writer_db) == 50
+
+    @pytest.mark.asyncio
+    async def test_failing_unit_is_isolated(self, writer_db: LocalDatabase):
+        import asyncio
+
+        async def failing(session):
+            raise ValueError("boom")
+
+        outcomes = await asyncio.gather(
+            writer_db.run_write(self._insert("a")),
+            writer_db.run_write(failing),
+            writer_db.run_write(self._insert("b")),
+            return_exceptions=True,
+        )
+        assert outcomes[0] == "a"
+        assert isinstance(outcomes[1], ValueError)
+        assert outcomes[2] == "b"
+        assert self._count(writer_db) == 2
+
+    @pytest.mark.asyncio
+    async def test_run_write_before_init_raises(self, tmp_storage: Path):
+        ldb = LocalDatabase("test-plugin", LocalDatabaseConfig(storage_dir=tmp_storage))
+        with pytest.raises(ConfigurationException, match="not initialized"):
+            await ldb.run_write(self._insert("x"))
+
+
+# --- Bulk writes ---
+
+
+class TestBulkWrites:
+    @pytest.fixture
+    def bulk_db(self, tmp_storage: Path) -> LocalDatabase:
+        ldb = LocalDatabase("test-plugin", LocalDatabaseConfig(storage_dir=tmp_storage))
+        ldb.initialize(models=[CustomReading, KeyedReading])
+        yield ldb
+        ldb.close()
+
+    @staticmethod
+    def _rows(n: int):
+        return (
+            {"experiment_id": f"exp-{i % 3}", "intensity": float(i), "channel": "A"}
+            for i in range(n)
+        )
+
+    @staticmethod
+    def _keyed(ldb: LocalDatabase) -> dict:
+        from sqlmodel import select
+
+        with ldb.get_session() as session:
+            rows = session.exec(select(KeyedReading)).all()
+            return {(r.experiment_id, r.channel): r.intensity for r in rows}
+
+    def test_bulk_insert_chunks(self, bulk_db: LocalDatabase):
+        from sqlmodel import func, select
+
+        assert bulk_db.bulk_insert(CustomReading, self._rows(2500), chunk_size=1000) == 2500
+        with bulk_db.get_session() as session:
+            assert session.exec(select(func.count()).select_from(CustomReading)).one() == 2500
+
+    def test_bulk_insert_empty(self, bulk_db: LocalDatabase):
+        assert bulk_db.bulk_insert(CustomReading, []) == 0
+
+    def test_bulk_insert_rejects_non_table(self, bulk_db: LocalDatabase):
+        from mld_sdk.exceptions import ValidationException
+
+        with pytest.raises(ValidationException, match="not a table model"):
+            bulk_db.bulk_insert(dict, [{"a": 1}])
+
+    def test_bulk_upsert_updates_existing(self, bulk_db: LocalDatabase):
+        bulk_db.bulk_insert(
+            KeyedReading, [{"experiment_id": "e1", "channel": "A", "intensity": 1.0}]
+        )
+        count = bulk_db.bulk_upsert(
+            KeyedReading,
+            [
+                {"experiment_id": "e1", "channel": "A", "intensity": 2.0},
+                {"experiment_id": "e1", "channel": "B", "intensity": 3.0},
+            ],
+            conflict_cols=["experiment_id", "channel"],
+        )
+        assert count == 2
+        assert self._keyed(bulk_db) == {("e1", "A"): 2.0, ("e1", "B"): 3.0}
+
+    def test_bulk_upsert_do_nothing(self, bulk_db: LocalDatabase):
+        bulk_db.bulk_insert(
+            KeyedReading, [{"experiment_id": "e1", "channel": "A", "intensity": 1.0}]
+        )
+        bulk_db.bulk_upsert(
+            KeyedReading,
+            [{"experiment_id": "e1", "channel": "A", "intensity": 9.0}],
+            conflict_cols=["experiment_id", "channel"],
+            update_cols=[],
+        )
+        assert self._keyed(bulk_db) == {("e1", "A"): 1.0}
+
+    @pytest.mark.asyncio
+    async def test_bulk_async(self, bulk_db: LocalDatabase):
+        assert await bulk_db.bulk_insert_async(CustomReading, self._rows(10)) == 10
+        await bulk_db.bulk_upsert_async(
+            KeyedReading,
+            [{"experiment_id": "e2", "channel": "A", "intensity": 5.0}] * 2,
+            conflict_cols=["experiment_id", "channel"],
+        )
+        assert self._keyed(bulk_db) == {("e2", "A"): 5.0}
+        assert await bulk_db.bulk_insert_async(CustomReading, []) == 0
+
+    @pytest.mark.asyncio
+    async def test_bulk_async_streams_chunks(self, bulk_db: LocalDatabase):
+        from sqlalchemy import func
+        from sqlmodel import select
+
+        pulled = 0
+
+        def rows():
+            nonlocal pulled
+            for row in self._rows(25):
+                pulled += 1
+                yield row
+
+        seen = []
+        run_write = bulk_db.run_write
+
+        async def record(work):
+            seen.append(pulled)
+            return await run_write(work)
+
+        bulk_db.run_write = record
+        assert await bulk_db.bulk_insert_async(CustomReading, rows(), chunk_size=10) == 25
+        assert seen == [10, 20, 25]  # each chunk is written before the next is read
+        with bulk_db.get_session() as session:
+            assert session.exec(select(func.count()).select_from(CustomReading)).one() == 25
+
+
+# --- Streaming reads ---
+
+
+class TestStreaming:
+    @pytest.fixture
+    def stream_db(self, tmp_storage: Path) -> LocalDatabase:
+        ldb = LocalDatabase("test-plugin", LocalDatabaseConfig(storage_dir=tmp_storage))
+        ldb.initialize(models=[CustomReading])
+        ldb.bulk_insert(
+            CustomReading,
+            (
+                {"experiment_id": "exp-1", "intensity": float(i), "channel": "A"}
+                for i in range(25)
+            ),
+        )
+        yield ldb
+        ldb.close()
+
+    def test_stream_yields_models(self, stream_db: LocalDatabase):
+        from sqlmodel import select
+
+        rows = list(stream_db.stream(select(CustomReading), batch_size=10))
+        assert len(rows) == 25
+        assert isinstance(rows[0], CustomReading)
+
+    def test_stream_batches(self, stream_db: LocalDatabase):
+        from sqlmodel import select
+
+        sizes = [
+            len(batch)
+            for batch in stream_db.stream(
+                select(CustomReading.intensity, CustomReading.channel),
+                batch_size=10,
+                batches=True,
+            )
+        ]
+        assert sizes == [10, 10, 5]
+
+    @pytest.mark.asyncio
+    async def test_stream_async(self, stream_db: LocalDatabase):
+        from sqlmodel import select
+
+        intensities = [
+            reading.intensity
+            async for reading in stream_db.stream_async(
+                select(CustomReading).order_by(CustomReading.id), batch_size=7
+            )
+        ]
+        assert intensities == [float(i) for i in range(25)]
+
+    @pytest.mark.asyncio
+    async def test_stream_async_batches(self, stream_db: LocalDatabase):
+        from sqlmodel import select
+
+        sizes = [
+            len(batch)
+            async for batch in stream_db.stream_async(
+                select(CustomReading), batch_size=10, batches=True
+            )
+        ]
+        assert sizes == [10, 10, 5]
+
+
+# --- Key-value API ---
+
+
+class TestKeyValueStore:
+    def test_set_and_get(self, db: LocalDatabase):
+        db.set("threshold", 0.05, namespace="settings")
+        db.set("columns", ["name", "intensity", "rt"])
+        assert db.get("threshold", namespace="settings") == 0.05
+        assert db.get("columns") == ["name", "intensity", "rt"]
+        assert db.get("threshold") is None
+        assert db.get("missing", default=42) == 42
+
+    def test_overwrite(self, db: LocalDatabase):
+        db.set("k", {"a": 1})
+        db.set("k", {"a": 2})
+        assert db.get("k") == {"a": 2}
+
+    def test_get_returns_independent_copies(self, db: LocalDatabase):
+        db.set("k", [1, 2])
+        db.get("k").append(3)
+        assert db.get("k") == [1, 2]
+
+    def test_get_many_and_set_many(self, db: LocalDatabase):
+        db.set_many({"a": 1, "b": 2, "c": 3}, namespace="ns")
+        assert db.get_many(["a", "c", "zzz"], namespace="ns") == {"a": 1, "c": 3}
+
+    def test_list_keys_and_get_all(self, db: LocalDatabase):
+        db.set_many({"b": 2, "a": 1}, namespace="ns")
+        db.set("other", True)
+        assert db.list_keys("ns") == ["a", "b"]
+        assert db.get_all("ns") == {"a": 1, "b": 2}
+
+    def test_delete(self, db: LocalDatabase):
+        db.set("k", 1)
+        assert db.delete("k") is True
+        assert db.delete("k") is False
+        assert db.get("k") is None
+
+    def test_clear(self, db: LocalDatabase):
+        db.set_many({"a": 1, "b": 2}, namespace="one")
+        db.set("c", 3, namespace="two")
+        assert db.clear("one") == 2
+        assert db.get("a", namespace="one") is None
+        assert db.get("c", namespace="two") == 3
+        assert db.clear() == 1
+
+    def test_non_serializable_value_raises(self, db: LocalDatabase):
+        from mld_sdk.exceptions import ValidationException
+
+        with pytest.raises(ValidationException, match="not JSON-serializable"):
+            db.set("k", object())
+
+    def test_encoding_is_strict_json(self, db: LocalDatabase):
+        from datetime import datetime
+
+        from mld_sdk.exceptions import ValidationException
+
+        for value in (float("nan"), {"x": float("inf")}, datetime(2026, 1, 1), {1, 2}):
+            with pytest.raises(ValidationException):
+                db.set("k", value)
+        db.set("k", {1: "a", "b": None})
+        assert db.get("k") == {"1": "a", "b": None}
+
+    def test_hot_reads_are_served_from_cache(self, db: LocalDatabase):
+        db.set("k", "v")
+        db.get("k")
+        db.get("k")
+        db.get("absent")
+        db.get("absent")
+        stats = db.kv_cache_stats
+        assert stats["hits"] == 3
+        assert stats["misses"] == 1
+
+    def test_read_racing_a_write_is_not_cached(self, db: LocalDatabase):
+        db.set("k", 1)
+        db._kv_cache.clear()
+        fill = db._kv_cache_read
+
+        def write_then_fill(writes, entries):
+            db.set("k", 2)  # commits and caches after the read fetched 1
+            fill(writes, entries)
+
+        db._kv_cache_read = write_then_fill
+        assert db.get("k") == 1
+        del db._kv_cache_read
+        assert db.get("k") == 2
+
+    def test_overlapping_writes_drop_the_cache_entry(self, db: LocalDatabase):
+        cache_written = db._kv_cache_written
+
+        def overlap_then_cache(writes, entries):
+            del db._kv_cache_written
+            db.set("k", 2)  # a second writer commits and caches first
+            cache_written(writes, entries)
+
+        db._kv_cache_written = overlap_then_cache
+        db.set("k", 1)
+        assert db.get("k") == 2
+
+    def test_values_persist_across_instances(self, tmp_storage: Path):
+        config = LocalDatabaseConfig(storage_dir=tmp_storage)
+        first = LocalDatabase("test-plugin", config)
+        first.initialize()
+        first.set("k", {"persisted": True})
+        first.close()
+
+        second = LocalDatabase("test-plugin", config)
+        second.initialize()
+        assert second.get("k") == {"persisted": True}
+        second.close()
+
+    def test_kv_table_not_in_sqlmodel_metadata(self):
+        assert "mld_kv_store" not in SQLModel.metadata.tables
+
+
+# --- Experiment sharding ---
+
+
+class TestSharding:
+    @staticmethod
+    def _make(tmp_storage: Path, **kwargs) -> LocalDatabase:
+        ldb = LocalDatabase(
+            "test-plugin", LocalDatabaseConfig(storage_dir=tmp_storage, **kwargs)
+        )
+        ldb.initialize(models=[CustomReading])
+        return ldb
+
+    @staticmethod
+    def _count(ldb: LocalDatabase) -> int:
+        from sqlmodel import select
+
+        with ldb.get_session() as session:
+            return len(session.exec(select(CustomReading)).all())
+
+    def test_disabled_by_default(self, db: LocalDatabase):
+        with pytest.raises(ConfigurationException, match="Sharding is disabled"):
+            db.shard(1)
+
+    def test_invalid_mode_raises(self, tmp_storage: Path):
+        with pytest.raises(ConfigurationException, match="Unknown shard_by"):
+            self._make(tmp_storage, shard_by="tenant")
+
+    def test_per_experiment_files(self, tmp_storage: Path):
+        ldb = self._make(tmp_storage, shard_by="experiment")
+        ldb.shard(1).bulk_insert(
+            CustomReading, [{"experiment_id": "1", "intensity": 1.0, "channel": "A"}]
+        )
+        ldb.shard(2).bulk_insert(
+            CustomReading, [{"experiment_id": "2", "intensity": 2.0, "channel": "A"}] * 2
+        )
+        assert ldb.shard_path(1) == tmp_storage / "shards" / "exp-1.db"
+        assert ldb.shard_path(1).exists()
+        assert self._count(ldb.shard(1)) == 1
+        assert self._count(ldb.shard(2)) == 2
+        assert self._count(ldb) == 0
+        ldb.close()
+
+    def test_unsafe_ids_are_hashed(self, tmp_storage: Path):
+        ldb = self._make(tmp_storage, shard_by="experiment")
+        path = ldb.shard_path("../../etc/passwd")
+        assert path.parent == tmp_storage / "shards"
+        assert ".." not in path.name
+        ldb.close()
+
+    def test_hash_buckets(self, tmp_storage: Path):
+        ldb = self._make(tmp_storage, shard_by="hash", shard_count=4)
+        names = {ldb.shard_path(i).name for i in range(100)}
+        assert len(names) == 4
+        assert ldb.shard_path(7) == ldb.shard_path("7")
+        ldb.close()
+
+    def test_lru_closes_old_shards(self, tmp_storage: Path):
+        ldb = self._make(tmp_storage, shard_by="experiment", max_open_shards=2)
+        first = ldb.shard(1)
+        ldb.shard(2)
+        ldb.shard(3)
+        assert first.is_initialized is False
+        assert len(ldb._shards) == 2
+        assert ldb.shard(1) is first
+        assert first.is_initialized
+        ldb.close()
+
+    def test_evicted_handle_reopens_on_use(self, tmp_storage: Path):
+        ldb = self._make(tmp_storage, shard_by="experiment", max_open_shards=2)
+        a = ldb.shard(1)
+        a.set("k", "v")
+        ldb.shard(2)
+        ldb.shard(3)
+        assert a.is_initialized is False
+        assert self._count(a) == 0
+        assert a.get("k") == "v"
+        assert len(ldb._shards) == 2
+        assert "exp-1" in ldb._shards
+        ldb.close()
+        with pytest.raises(ConfigurationException, match="not initialized"):
+            a.get("k")
+
+    def test_shards_in_use_are_not_evicted(self, tmp_storage: Path):
+        from sqlmodel import select
+
+        ldb = self._make(tmp_storage, shard_by="experiment", max_open_shards=1)
+        a = ldb.shard(1)
+        with a.get_session() as session:
+            session.exec(select(CustomReading)).all()  # holds a connection
+            ldb.shard(2)
+            assert a.is_initialized
+            assert len(ldb._shards) == 2
+            session.exec(select(CustomReading)).all()
+        ldb.shard(3)
+        assert a.is_initialized is False
+        assert len(ldb._shards) == 1
+        ldb.close()
+
+    def test_drop_shard_unlinks_file(self, tmp_storage: Path):
+        ldb = self._make(tmp_storage, shard_by="experiment")
+        ldb.shard(5).set("k", "v")
+        path = ldb.shard_path(5)
+        assert ldb.drop_shard(5) is True
+        assert not path.exists()
+        assert ldb.drop_shard(5) is False
+        ldb.close()
+
+    def test_drop_shard_requires_experiment_mode(self, tmp_storage: Path):
+        ldb = self._make(tmp_storage, shard_by="hash")
+        with pytest.raises(ConfigurationException, match="drop_shard"):
+            ldb.drop_shard(1)
+        ldb.close()
+
+    def test_close_closes_shards(self, tmp_storage: Path):
+        ldb = self._make(tmp_storage, shard_by="experiment")
+        shard = ldb.shard(1)
+        ldb.close()
+        assert shard.is_initialized is False
+        with pytest.raises(ConfigurationException):
+            shard.get("k")
+
+
+# --- Online maintenance ---
+
+
+class TestMaintenance:
+    def test_force_runs_every_step(self, tmp_storage: Path):
+        ldb = LocalDatabase("test-plugin", LocalDatabaseConfig(storage_dir=tmp_storage))
+        ldb.initialize(models=[CustomReading])
+        ldb.bulk_insert(
+            CustomReading,
+            [{"experiment_id": "e", "intensity": 1.0, "channel": "x" * 500}] * 2000,
+        )
+        with ldb.engine.begin() as conn:
+            conn.exec_driver_sql("DELETE FROM custom_reading")
+
+        with ldb.engine.connect() as conn:
+            free_before = conn.exec_driver_sql("PRAGMA freelist_count").scalar()
+        assert free_before > 100
+
+        report = ldb.run_maintenance(force=True)
+        assert report["checkpointed"] is True
+        assert report["optimized"] is True
+        assert report["vacuumed_pages"] == free_before
+        with ldb.engine.connect() as conn:
+            assert conn.exec_driver_sql("PRAGMA freelist_count").scalar() == 0
+        assert ldb.db_path.with_name("data.db-wal").stat().st_size == 0
+        ldb.close()
+
+    def test_thresholds_respected(self, db: LocalDatabase):
+        first = db.run_maintenance()
+        assert first["optimized"] is True  # first run is always due
+        assert first["checkpointed"] is False
+        second = db.run_maintenance()
+        assert second["optimized"] is False
+        assert db.maintenance_status()["runs"] == 2
+
+    def test_backs_off_when_busy(self, tmp_storage: Path):
+        config = LocalDatabaseConfig(storage_dir=tmp_storage, maintenance_busy_connections=0)
+        ldb = LocalDatabase("test-plugin", config)
+        ldb.initialize()
+        with ldb.engine.connect():
+            assert ldb.run_maintenance() == {"skipped": "busy"}
+        assert ldb.maintenance_status()["skipped_busy"] == 1
+        ldb.close()
+
+    def test_includes_open_shards(self, tmp_storage: Path):
+        config = LocalDatabaseConfig(storage_dir=tmp_storage, shard_by="experiment")
+        ldb = LocalDatabase("test-plugin", config)
+        ldb.initialize()
+        ldb.shard(1)
+        report = ldb.run_maintenance(force=True)
+        assert set(report["shards"]) == {"exp-1"}
+        ldb.close()
+
+    def test_start_requires_interval(self, db: LocalDatabase):
+        with pytest.raises(ConfigurationException, match="maintenance_interval"):
+            db.start_maintenance()
+
+    @pytest.mark.asyncio
+    async def test_background_task(self, tmp_storage: Path):
+        import asyncio
+
+        config = LocalDatabaseConfig(storage_dir=tmp_storage, maintenance_interval=0.01)
+        ldb = LocalDatabase("test-plugin", config)
+        ldb.initialize()
+        assert ldb.maintenance_status()["scheduled"] is True
+        for _ in range(100):
+            if ldb.maintenance_status()["runs"]:
+                break
+            await asyncio.sleep(0.01)
+        assert ldb.maintenance_status()["runs"] >= 1
+        ldb.close()
+        assert ldb.maintenance_status()["scheduled"] is False
+
+    @pytest.mark.asyncio
+    async def test_plugin_health_reports_maintenance(self, tmp_path: Path):
+        class HealthPlugin(AnalysisPlugin):
+            @property
+            def metadata(self) -> PluginMetadata:
+                return PluginMetadata(
+                    name="health-test",
+                    version="1.0.0",
+                    description="test",
+                    analysis_type="test",
+                    routes_prefix="/test",
+                )
+
+            def get_routers(self):
+                return []
+
+            async def initialize(self, context=None):
+                self._setup_standalone_db(storage_dir=tmp_path)
+
+            async def shutdown(self):
+                self._teardown_standalone_db()
+
+        plugin = HealthPlugin()
+        await plugin.initialize()
+        health = await plugin.check_health()
+        assert health.details["local_database"]["runs"] == 0
+        await plugin.shutdown()
+
+
+# --- Read-only replica connections ---
+
+
+class TestReadSessions:
+    def test_read_session_sees_committed_data(self, db: LocalDatabase):
+        from sqlalchemy import text
+
+        db.set("k", "v")
+        with db.get_read_session() as session:
+            value = session.execute(text("SELECT value FROM mld_kv_store")).scalar()
+        assert value == '"v"'
+
+    def test_read_session_rejects_writes(self, db: LocalDatabase):
+        from sqlalchemy import text
+        from sqlalchemy.exc import OperationalError
+
+        with db.get_read_session() as session:
+            with pytest.raises(OperationalError, match="readonly|query_only"):
+                session.execute(text("DELETE FROM mld_kv_store"))
+
+    def test_read_pool_size(self, tmp_storage: Path):
+        config = LocalDatabaseConfig(storage_dir=tmp_storage, read_pool_size=7)
+        ldb = LocalDatabase("test-plugin", config)
+        ldb.initialize()
+        assert ldb._read_engine.pool.size() == 7
+        assert ldb.engine.pool.size() == 5
+        ldb.close()
+
+    def test_path_with_special_characters(self, tmp_path: Path):
+        config = LocalDatabaseConfig(storage_dir=tmp_path / "my plugin #1")
+        ldb = LocalDatabase("test-plugin", config)
+        ldb.initialize()
+        ldb.set("k", 1)
+        with ldb.get_read_session() as session:
+            from sqlalchemy import text
+
+            assert session.execute(text("SELECT count(*) FROM mld_kv_store")).scalar() == 1
+        ldb.close()
+
+    @pytest.mark.asyncio
+    async def test_async_read_session(self, db: LocalDatabase):
+        from sqlalchemy import text
+        from sqlalchemy.exc import OperationalError
+
+        db.set("k", "v")
+        async with db.get_async_read_session() as session:
+            result = await session.execute(text("SELECT count(*) FROM mld_kv_store"))
+            assert result.scalar() == 1
+            with pytest.raises(OperationalError):
+                await session.execute(text("DELETE FROM mld_kv_store"))
+
+    def test_read_session_before_init_raises(self, tmp_storage: Path):
+        ldb = LocalDatabase("test-plugin", LocalDatabaseConfig(storage_dir=tmp_storage))
+        with pytest.raises(ConfigurationException, match="not initialized"):
+            with ldb.get_read_session():
+                pass
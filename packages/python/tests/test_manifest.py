@@ -0,0 +1,224 @@
+import asyncio
+import json
+import sys
+from importlib.metadata import EntryPoint
+
+import pytest
+from fastapi import FastAPI
+
+from mld_sdk import host as host_module
+from mld_sdk.exceptions import PluginLifecycleException, ValidationException
+from mld_sdk.host import LazyPluginMiddleware, PluginHost
+from mld_sdk.manifest import (
+    MANIFEST_FILENAME,
+    find_plugin_manifest,
+    metadata_from_manifest,
+    plugin_manifest,
+    write_plugin_manifest,
+)
+from mld_sdk.models import PluginType
+
+from tests.test_host import DelayPlugin, statuses
+
+
+def make_package(root, name="lazypkg", manifest=None):
+    package = root / name
+    package.mkdir()
+    (package / "__init__.py").write_text("")
+    (package / "plugin.py").write_text(
+        "from tests.test_host import DelayPlugin\n"
+        "class Plugin(DelayPlugin):\n"
+        "    def __init__(self):\n"
+        f"        super().__init__(name={name!r})\n"
+    )
+    if manifest is not None:
+        (package / MANIFEST_FILENAME).write_text(
+            manifest if isinstance(manifest, str) else json.dumps(manifest)
+        )
+    return package
+
+
+class TestManifest:
+    def test_round_trip(self, tmp_path):
+        plugin = DelayPlugin("peaks", deps=["base"])
+        path = write_plugin_manifest(plugin, tmp_path)
+        assert path.name == MANIFEST_FILENAME
+        manifest = json.loads(path.read_text())
+        assert manifest == plugin_manifest(plugin)
+        assert manifest["dependencies"] == ["base"]
+        assert metadata_from_manifest(manifest) == plugin.metadata
+
+    def test_defaults_and_validation(self):
+        metadata = metadata_from_manifest(
+            {
+                "name": "x",
+                "version": "1",
+                "description": "d",
+                "analysis_type": "t",
+                "routes_prefix": "/x",
+                "unknown": 1,
+            }
+        )
+        assert metadata.plugin_type == PluginType.ANALYSIS
+        with pytest.raises(ValidationException) as exc:
+            metadata_from_manifest({"name": "x"})
+        assert exc.value.field == "version"
+        with pytest.raises(ValidationException):
+            metadata_from_manifest(
+                {**plugin_manifest(DelayPlugin("x")), "plugin_type": "nonsense"}
+            )
+
+    def test_find_in_package_without_import(self, tmp_path, monkeypatch):
+        make_package(tmp_path, manifest=plugin_manifest(DelayPlugin("lazypkg")))
+        monkeypatch.syspath_prepend(str(tmp_path))
+        ep = EntryPoint("lazy", "lazypkg.plugin:Plugin", "mld.plugins")
+        manifest = find_plugin_manifest(ep)
+        assert manifest["name"] == "lazypkg"
+        assert "lazypkg" not in sys.modules
+
+    def test_missing_and_invalid(self, tmp_path, monkeypatch):
+        make_package(tmp_path, "plainpkg")
+        make_package(tmp_path, "badpkg", manifest="{not json")
+        monkeypatch.syspath_prepend(str(tmp_path))
+        assert find_plugin_manifest(EntryPoint("p", "plainpkg.plugin:Plugin", "g")) is None
+        assert find_plugin_manifest(EntryPoint("m", "nosuchpkg.plugin:Plugin", "g")) is None
+        with pytest.raises(ValidationException):
+            find_plugin_manifest(EntryPoint("b", "badpkg.plugin:Plugin", "g"))
+
+
+@pytest.fixture
+def lazy_packages(tmp_path, monkeypatch):
+    """Entry points for an on-disk package with a manifest and one without."""
+    make_package(tmp_path, "lazypkg", manifest=plugin_manifest(DelayPlugin("lazypkg")))
+    make_package(tmp_path, "eagerpkg")
+    monkeypatch.syspath_prepend(str(tmp_path))
+    eps = [
+        EntryPoint("lazy", "lazypkg.plugin:Plugin", "mld.plugins"),
+        EntryPoint("eager", "eagerpkg.plugin:Plugin", "mld.plugins"),
+    ]
+    monkeypatch.setattr(host_module, "entry_points", lambda group: eps)
+    yield
+    for name in [m for m in sys.modules if m.split(".")[0] in ("lazypkg", "eagerpkg")]:
+        del sys.modules[name]
+
+
+async def call(app, path):
+    """Send a GET through an ASGI app; return (status, body)."""
+    messages = []
+
+    async def receive():
+        return {"type": "http.request", "body": b"", "more_body": False}
+
+    async def send(message):
+        messages.append(message)
+
+    scope = {
+        "type": "http",
+        "method": "GET",
+        "path": path,
+        "raw_path": path.encode(),
+        "root_path": "",
+        "scheme": "http",
+        "query_string": b"",
+        "headers": [],
+        "server": ("test", 80),
+        "client": ("test", 1),
+        "http_version": "1.1",
+    }
+    await app(scope, receive, send)
+    body = b"".join(m.get("body", b"") for m in messages if m["type"] == "http.response.body")
+    return messages[0]["status"], json.loads(body)
+
+
+class TestLazyDiscovery:
+    @pytest.mark.asyncio
+    async def test_discover_defers_import(self, lazy_packages):
+        host = PluginHost()
+        assert host.discover(lazy=True) == ["lazypkg", "eagerpkg"]
+        assert "lazypkg" not in sys.modules
+        assert "eagerpkg.plugin" in sys.modules
+        report = await host.start(raise_on_failure=True)
+        assert statuses(report) == {"lazypkg": "deferred", "eagerpkg": "ready"}
+        assert "lazypkg" not in sys.modules
+        assert host.deferred_prefixes() == {"/lazypkg": "lazypkg"}
+
+        plugin = await host.ensure_loaded("lazypkg")
+        assert plugin.metadata.name == "lazypkg"
+        assert set(host.plugins) == {"lazypkg", "eagerpkg"}
+        assert host.deferred_prefixes() == {}
+
+    @pytest.mark.asyncio
+    async def test_invalid_manifest_is_reported(self, tmp_path, monkeypatch):
+        manifest = plugin_manifest(DelayPlugin("badpkg"))
+        del manifest["version"]
+        make_package(tmp_path, "badpkg", manifest=manifest)
+        make_package(tmp_path, "goodpkg", manifest=plugin_manifest(DelayPlugin("goodpkg")))
+        monkeypatch.syspath_prepend(str(tmp_path))
+        eps = [
+            EntryPoint("bad", "badpkg.plugin:Plugin", "mld.plugins"),
+            EntryPoint("good", "goodpkg.plugin:Plugin", "mld.plugins"),
+        ]
+        monkeypatch.setattr(host_module, "entry_points", lambda group: eps)
+        host = PluginHost()
+        assert host.discover(lazy=True) == ["goodpkg"]
+        report = await host.start()
+        assert statuses(report) == {"bad": "failed", "goodpkg": "deferred"}
+        bad = next(s for s in report if s.name == "bad")
+        assert bad.error.startswith("invalid manifest")
+        assert "badpkg" not in sys.modules
+
+    @pytest.mark.asyncio
+    async def test_warm_up_and_dependencies(self, lazy_packages):
+        host = PluginHost(warm_up=["lazypkg"])
+        host.discover(lazy=True)
+        await host.start()
+        assert set(host.plugins) == {"lazypkg", "eagerpkg"}
+
+        host = PluginHost()
+        host.discover(lazy=True)
+        host.add(DelayPlugin("needs-lazy", deps=["lazypkg"]))
+        report = await host.start()
+        assert statuses(report)["lazypkg"] == "ready"
+        assert statuses(report)["needs-lazy"] == "ready"
+
+    @pytest.mark.asyncio
+    async def test_concurrent_loads_initialize_once(self, lazy_packages):
+        host = PluginHost()
+        host.discover(lazy=True)
+        plugins = await asyncio.gather(*(host.ensure_loaded("lazypkg") for _ in range(5)))
+        assert all(p is plugins[0] for p in plugins)
+        assert plugins[0].log.count(("start", "lazypkg")) == 1
+
+    @pytest.mark.asyncio
+    async def test_name_mismatch_fails(self):
+        host = PluginHost()
+        manifest = plugin_manifest(DelayPlugin("expected"))
+        host.add_deferred(metadata_from_manifest(manifest), lambda: DelayPlugin)
+        with pytest.raises(PluginLifecycleException):
+            await host.ensure_loaded("expected")
+        assert "does not match" in host.report()[0].error
+
+    @pytest.mark.asyncio
+    async def test_middleware_loads_on_first_request(self, lazy_packages):
+        app = FastAPI()
+        host = PluginHost(app=app)
+        host.discover(lazy=True)
+        await host.start()
+        app.add_middleware(LazyPluginMiddleware, host=host)
+
+        assert await call(app, "/lazypkg/ping") == (200, {"ok": True})
+        assert "lazypkg" in host.plugins
+        assert await call(app, "/eagerpkg/ping") == (200, {"ok": True})
+
+    @pytest.mark.asyncio
+    async def test_middleware_unavailable(self):
+        app = FastAPI()
+        host = PluginHost(app=app)
+        host.add_deferred(
+            metadata_from_manifest(plugin_manifest(DelayPlugin("broken"))),
+            lambda: lambda: DelayPlugin("broken", fail=True),
+        )
+        app.add_middleware(LazyPluginMiddleware, host=host)
+        status, body = await call(app, "/broken/ping")
+        assert status == 503
+        assert "broken" in body["detail"]
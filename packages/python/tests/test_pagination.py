@@ -0,0 +1,83 @@
+import pytest
+
+from mld_sdk.pagination import iter_experiments
+from mld_sdk.repositories import Experiment
+from tests.fakes import make_experiment
+
+
+class OffsetOnlyRepository:
+    """Older platform: list_all only."""
+
+    def __init__(self, experiments: list[Experiment]):
+        self.experiments = experiments
+        self.calls: list[tuple[int, int]] = []
+
+    async def list_all(self, skip=0, limit=100, status=None, **filters):
+        self.calls.append((skip, limit))
+        matching = [e for e in self.experiments if status is None or e.status == status]
+        return matching[skip : skip + limit], len(matching)
+
+
+class CappedRepository(OffsetOnlyRepository):
+    """Platform that returns at most 100 rows per page whatever the limit."""
+
+    async def list_all(self, skip=0, limit=100, status=None, **filters):
+        page, total = await super().list_all(skip, limit, status, **filters)
+        return page[:100], total
+
+
+class KeysetRepository(OffsetOnlyRepository):
+    """Newer platform: native keyset iteration."""
+
+    def __init__(self, experiments: list[Experiment]):
+        super().__init__(experiments)
+        self.iter_kwargs: dict = {}
+
+    async def iter_all(self, *, batch_size=100, order_by="id", **filters):
+        self.iter_kwargs = {"batch_size": batch_size, "order_by": order_by, **filters}
+        for experiment in self.experiments:
+            yield experiment
+
+
+class TestIterExperiments:
+    @pytest.mark.asyncio
+    async def test_offset_fallback_pages_until_total(self):
+        repo = OffsetOnlyRepository([make_experiment(i) for i in range(25)])
+        ids = [e.id async for e in iter_experiments(repo, batch_size=10)]
+        assert ids == list(range(25))
+        assert repo.calls == [(0, 10), (10, 10), (20, 10)]
+
+    @pytest.mark.asyncio
+    async def test_offset_fallback_exact_multiple(self):
+        repo = OffsetOnlyRepository([make_experiment(i) for i in range(20)])
+        ids = [e.id async for e in iter_experiments(repo, batch_size=10)]
+        assert len(ids) == 20
+        assert repo.calls == [(0, 10), (10, 10)]
+
+    @pytest.mark.asyncio
+    async def test_offset_fallback_with_capped_limit(self):
+        repo = CappedRepository([make_experiment(i) for i in range(350)])
+        ids = [e.id async for e in iter_experiments(repo, batch_size=500)]
+        assert ids == list(range(350))
+        assert repo.calls == [(0, 500), (100, 500), (200, 500), (300, 500)]
+
+    @pytest.mark.asyncio
+    async def test_offset_fallback_passes_filters(self):
+        experiments = [make_experiment(i, "done" if i % 2 else "draft") for i in range(6)]
+        repo = OffsetOnlyRepository(experiments)
+        ids = [e.id async for e in iter_experiments(repo, status="done")]
+        assert ids == [1, 3, 5]
+
+    @pytest.mark.asyncio
+    async def test_uses_native_keyset_iteration(self):
+        repo = KeysetRepository([make_experiment(i) for i in range(5)])
+        ids = [
+            e.id
+            async for e in iter_experiments(
+                repo, batch_size=2, order_by="updated_at", project="p"
+            )
+        ]
+        assert ids == list(range(5))
+        assert repo.calls == []
+        assert repo.iter_kwargs["order_by"] == "updated_at"
+        assert repo.iter_kwargs["project"] == "p"
@@ -0,0 +1,210 @@
+import copy
+from datetime import timedelta
+
+import pytest
+
+from mld_sdk.exceptions import ConflictException, NotFoundException, ValidationException
+from mld_sdk.patching import (
+    apply_json_patch,
+    apply_merge_patch,
+    apply_patch,
+    diff_json_patch,
+    diff_merge_patch,
+    patch_analysis_result,
+    patch_experiment_data,
+)
+from tests.fakes import NOW, FakePluginDataRepository
+
+OLD = {
+    "status": "running",
+    "summary": {"peaks": 3, "quality": {"snr": 10.5, "flags": ["low"]}},
+    "series": [1, 2, 3],
+    "obsolete": True,
+}
+NEW = {
+    "status": "done",
+    "summary": {"peaks": 3, "quality": {"snr": 11.0, "flags": ["low"]}},
+    "series": [1, 5],
+    "added": {"x": 1},
+}
+
+
+class TestMergePatch:
+    def test_diff_is_minimal(self):
+        assert diff_merge_patch(OLD, NEW) == {
+            "status": "done",
+            "summary": {"quality": {"snr": 11.0}},
+            "series": [1, 5],
+            "added": {"x": 1},
+            "obsolete": None,
+        }
+
+    def test_round_trip_without_mutation(self):
+        old = copy.deepcopy(OLD)
+        assert apply_merge_patch(old, diff_merge_patch(old, NEW)) == NEW
+        assert old == OLD
+
+    def test_identical_documents(self):
+        assert diff_merge_patch(OLD, copy.deepcopy(OLD)) == {}
+
+    def test_unchanged_subtrees_are_shared(self):
+        patched = apply_merge_patch(OLD, {"status": "done"})
+        assert patched["summary"] is OLD["summary"]
+
+    def test_type_change_is_detected(self):
+        assert diff_merge_patch({"n": 1}, {"n": 1.0}) == {"n": 1.0}
+
+    def test_null_values_are_rejected(self):
+        with pytest.raises(ValidationException):
+            diff_merge_patch({"a": 1}, {"a": None})
+
+    @pytest.mark.parametrize(
+        "old,new",
+        [
+            ({"a": 1}, {"a": {"x": None}}),
+            ({}, {"a": {"x": None}}),
+            ({}, {"a": {"b": {"x": None}}}),
+            ({"a": [1]}, {"a": {"x": 1, "y": None}}),
+        ],
+    )
+    def test_nested_null_values_are_rejected(self, old, new):
+        with pytest.raises(ValidationException) as exc_info:
+            diff_merge_patch(old, new)
+        assert exc_info.value.field.startswith("a.")
+
+    @pytest.mark.parametrize(
+        "old,new",
+        [
+            (OLD, NEW),
+            ({"a": 1}, {"a": {"x": 1}}),
+            ({"a": {"x": None}}, {"a": {"x": None, "y": 2}}),
+            ({"a": {"x": None}}, {}),
+            ({}, {"a": [None, {"x": None}]}),
+            ({"a": {"b": 1}}, {"a": 2}),
+        ],
+    )
+    def test_diff_round_trips(self, old, new):
+        assert apply_merge_patch(old, diff_merge_patch(old, new)) == new
+
+
+class TestJsonPatch:
+    def test_diff_is_minimal(self):
+        ops = diff_json_patch(OLD, NEW)
+        assert {"op": "replace", "path": "/summary/quality/snr", "value": 11.0} in ops
+        assert {"op": "remove", "path": "/series/2"} in ops
+        assert {"op": "replace", "path": "/series/1", "value": 5} in ops
+        assert {"op": "remove", "path": "/obsolete"} in ops
+        assert len(ops) == 6
+
+    def test_round_trip_without_mutation(self):
+        old = copy.deepcopy(OLD)
+        assert apply_json_patch(old, diff_json_patch(old, NEW)) == NEW
+        assert old == OLD
+
+    def test_null_values_supported(self):
+        new = {"a": None}
+        assert apply_json_patch({"a": 1}, diff_json_patch({"a": 1}, new)) == new
+
+    def test_pointer_escaping(self):
+        old, new = {"a/b": {"c~d": 1}}, {"a/b": {"c~d": 2}}
+        ops = diff_json_patch(old, new)
+        assert ops == [{"op": "replace", "path": "/a~1b/c~0d", "value": 2}]
+        assert apply_json_patch(old, ops) == new
+
+    def test_move_copy_test(self):
+        doc = {"a": {"b": 1}, "list": [1, 2]}
+        result = apply_json_patch(
+            doc,
+            [
+                {"op": "test", "path": "/a/b", "value": 1},
+                {"op": "copy", "from": "/a", "path": "/c"},
+                {"op": "move", "from": "/a/b", "path": "/list/-"},
+                {"op": "add", "path": "/list/0", "value": 0},
+            ],
+        )
+        assert result == {"a": {}, "c": {"b": 1}, "list": [0, 1, 2, 1]}
+        assert doc == {"a": {"b": 1}, "list": [1, 2]}
+
+    def test_failed_test_raises_conflict(self):
+        with pytest.raises(ConflictException):
+            apply_json_patch({"a": 1}, [{"op": "test", "path": "/a", "value": 2}])
+
+    @pytest.mark.parametrize(
+        "op",
+        [
+            {"op": "remove", "path": "/missing"},
+            {"op": "replace", "path": "/list/5", "value": 1},
+            {"op": "add", "path": "/list/01", "value": 1},
+            {"op": "add", "path": "a", "value": 1},
+            {"op": "frobnicate", "path": "/a"},
+            {"op": "add", "path": "/a"},
+            {"op": "move", "from": "/list", "path": "/list/0"},
+        ],
+    )
+    def test_invalid_operations(self, op):
+        with pytest.raises(ValidationException):
+            apply_json_patch({"list": [1]}, [op])
+
+    def test_apply_patch_dispatch(self):
+        assert apply_patch({"a": 1}, {"a": 2}) == {"a": 2}
+        assert apply_patch({"a": 1}, [{"op": "remove", "path": "/a"}], "json-patch") == {}
+        with pytest.raises(ValidationException):
+            apply_patch({}, {"a": 1}, "json-patch")
+        with pytest.raises(ValidationException):
+            apply_patch({}, {}, "xml-patch")  # type: ignore[arg-type]
+
+
+class NativePatchRepository(FakePluginDataRepository):
+    async def patch_analysis_result(self, experiment_id, plugin_id, patch, **kwargs):
+        self.calls.append(("patch_analysis_result", (experiment_id, patch, kwargs)))
+        return "native"
+
+
+class TestRepositoryHelpers:
+    @pytest.mark.asyncio
+    async def test_native_method_is_used(self):
+        repo = NativePatchRepository()
+        result = await patch_analysis_result(repo, 1, "p", {"a": 1}, if_updated_at=NOW)
+        assert result == "native"
+        assert repo.calls == [
+            (
+                "patch_analysis_result",
+                (1, {"a": 1}, {"patch_format": "merge-patch", "if_updated_at": NOW}),
+            )
+        ]
+
+    @pytest.mark.asyncio
+    async def test_fallback_analysis_result(self):
+        repo = FakePluginDataRepository()
+        await repo.save_analysis_result(1, "p", dict(OLD))
+        saved = await patch_analysis_result(
+            repo, 1, "p", diff_json_patch(OLD, NEW), patch_format="json-patch",
+            if_updated_at=NOW,
+        )
+        assert saved.result == NEW
+
+    @pytest.mark.asyncio
+    async def test_fallback_precondition(self):
+        repo = FakePluginDataRepository()
+        await repo.save_analysis_result(1, "p", {"a": 1})
+        with pytest.raises(ConflictException) as exc:
+            await patch_analysis_result(
+                repo, 1, "p", {"a": 2}, if_updated_at=NOW - timedelta(seconds=1)
+            )
+        assert exc.value.details["conflict_field"] == "updated_at"
+        assert repo.results[(1, "p")].result == {"a": 1}
+
+    @pytest.mark.asyncio
+    async def test_fallback_missing(self):
+        with pytest.raises(NotFoundException):
+            await patch_analysis_result(FakePluginDataRepository(), 1, "p", {"a": 1})
+        with pytest.raises(NotFoundException):
+            await patch_experiment_data(FakePluginDataRepository(), 1, "p", {"a": 1})
+
+    @pytest.mark.asyncio
+    async def test_fallback_experiment_data_keeps_schema_version(self):
+        repo = FakePluginDataRepository()
+        await repo.save_experiment_data(1, "p", {"plate": {"rows": 8}}, schema_version="2.0")
+        saved = await patch_experiment_data(repo, 1, "p", {"plate": {"cols": 12}})
+        assert saved.data == {"plate": {"rows": 8, "cols": 12}}
+        assert saved.schema_version == "2.0"
@@ -0,0 +1,91 @@
+import pytest
+
+from mld_sdk.exceptions import ValidationException
+from mld_sdk.projection import (
+    get_analysis_result,
+    get_analysis_results,
+    get_experiment_data,
+    project_fields,
+)
+from tests.fakes import FakePluginDataRepository
+
+RESULT = {
+    "status": "done",
+    "summary": {"peaks": 3, "snr": 11.0},
+    "peaks": [{"mz": 100.1, "intensity": 5}, {"mz": 200.2, "intensity": 7}, 3],
+    "spectra": list(range(1000)),
+}
+
+
+class TestProjectFields:
+    def test_top_level_and_nested(self):
+        assert project_fields(RESULT, ["status", "summary.peaks"]) == {
+            "status": "done",
+            "summary": {"peaks": 3},
+        }
+
+    def test_paths_apply_to_list_elements(self):
+        assert project_fields(RESULT, ["peaks.mz"]) == {
+            "peaks": [{"mz": 100.1}, {"mz": 200.2}]
+        }
+
+    def test_missing_paths_are_omitted(self):
+        assert project_fields(RESULT, ["missing", "status.nested", "summary.x"]) == {
+            "summary": {}
+        }
+
+    def test_broader_path_wins(self):
+        expected = {"summary": RESULT["summary"]}
+        assert project_fields(RESULT, ["summary.peaks", "summary"]) == expected
+        assert project_fields(RESULT, ["summary", "summary.peaks"]) == expected
+
+    def test_values_are_shared(self):
+        assert project_fields(RESULT, ["spectra"])["spectra"] is RESULT["spectra"]
+
+    def test_none_returns_document(self):
+        assert project_fields(RESULT, None) is RESULT
+
+    @pytest.mark.parametrize("fields", ["status", ["a..b"], [""]])
+    def test_invalid_fields(self, fields):
+        with pytest.raises(ValidationException):
+            project_fields(RESULT, fields)
+
+
+class NativeFieldsRepository(FakePluginDataRepository):
+    async def get_analysis_results(self, experiment_id, fields=None):
+        self.calls.append(("get_analysis_results", fields))
+        return []
+
+
+class TestRepositoryHelpers:
+    @pytest.mark.asyncio
+    async def test_fallback_projects_locally(self):
+        repo = FakePluginDataRepository()
+        await repo.save_analysis_result(1, "a", RESULT)
+        await repo.save_analysis_result(1, "b", {"status": "running"})
+        results = await get_analysis_results(repo, 1, fields=["status"])
+        assert [r.result for r in results] == [{"status": "done"}, {"status": "running"}]
+        assert repo.results[(1, "a")].result is RESULT
+
+        single = await get_analysis_result(repo, 1, "a", fields=["summary.snr"])
+        assert single.result == {"summary": {"snr": 11.0}}
+        assert await get_analysis_result(repo, 2, "a", fields=["status"]) is None
+
+    @pytest.mark.asyncio
+    async def test_native_fields_are_passed_through(self):
+        repo = NativeFieldsRepository()
+        await get_analysis_results(repo, 1, fields=["status"])
+        await get_analysis_results(repo, 1)
+        assert repo.calls == [
+            ("get_analysis_results", ["status"]),
+            ("get_analysis_results", None),
+        ]
+
+    @pytest.mark.asyncio
+    async def test_experiment_data(self):
+        repo = FakePluginDataRepository()
+        await repo.save_experiment_data(1, "p", {"plate": {"rows": 8, "cols": 12}, "wells": []})
+        data = await get_experiment_data(repo, 1, fields=["plate.rows"])
+        assert data.data == {"plate": {"rows": 8}}
+        assert (await get_experiment_data(repo, 1)).data["plate"]["cols"] == 12
+        assert await get_experiment_data(repo, 2, fields=["plate"]) is None
@@ -0,0 +1,95 @@
+from mld_sdk.repositories import (
+    AnalysisResultBatchRepository,
+    ExperimentBatchRepository,
+    ExperimentKeysetRepository,
+    ExperimentRepository,
+    PluginDataPatchRepository,
+    PluginDataRepository,
+    UserBatchRepository,
+    UserRepository,
+)
+
+
+class BaselineExperimentRepository:
+    """A platform repository implementing only the original protocol methods."""
+
+    async def get_by_id(self, experiment_id): ...
+
+    async def list_all(self, skip=0, limit=100, **filters): ...
+
+    async def create(self, name, experiment_type, **fields): ...
+
+    async def update(self, experiment_id, **fields): ...
+
+    async def delete(self, experiment_id): ...
+
+    async def has_design_data(self, experiment_id): ...
+
+
+class BaselinePluginDataRepository:
+    async def save_experiment_data(self, experiment_id, plugin_id, data, schema_version="1.0"): ...
+
+    async def get_experiment_data(self, experiment_id): ...
+
+    async def delete_experiment_data(self, experiment_id): ...
+
+    async def save_analysis_result(self, experiment_id, plugin_id, result): ...
+
+    async def get_analysis_result(self, experiment_id, plugin_id): ...
+
+    async def get_analysis_results(self, experiment_id): ...
+
+    async def delete_analysis_result(self, experiment_id, plugin_id): ...
+
+
+class BaselineUserRepository:
+    async def get_by_id(self, user_id): ...
+
+    async def get_by_username(self, username): ...
+
+    async def list_all(self, skip=0, limit=100): ...
+
+
+class CapableExperimentRepository(BaselineExperimentRepository):
+    async def get_many(self, experiment_ids): ...
+
+    def iter_all(self, **filters): ...
+
+
+class CapablePluginDataRepository(BaselinePluginDataRepository):
+    async def get_many_analysis_results(self, experiment_ids, plugin_id, fields=None): ...
+
+    async def patch_experiment_data(self, experiment_id, plugin_id, patch, **options): ...
+
+    async def patch_analysis_result(self, experiment_id, plugin_id, patch, **options): ...
+
+
+class CapableUserRepository(BaselineUserRepository):
+    async def get_many(self, user_ids): ...
+
+
+class TestProtocols:
+    def test_baseline_implementations_satisfy_base_protocols(self):
+        assert isinstance(BaselineExperimentRepository(), ExperimentRepository)
+        assert isinstance(BaselinePluginDataRepository(), PluginDataRepository)
+        assert isinstance(BaselineUserRepository(), UserRepository)
+
+    def test_baseline_implementations_lack_capabilities(self):
+        assert not isinstance(BaselineExperimentRepository(), ExperimentBatchRepository)
+        assert not isinstance(BaselineExperimentRepository(), ExperimentKeysetRepository)
+        assert not isinstance(BaselinePluginDataRepository(), AnalysisResultBatchRepository)
+        assert not isinstance(BaselinePluginDataRepository(), PluginDataPatchRepository)
+        assert not isinstance(BaselineUserRepository(), UserBatchRepository)
+
+    def test_capabilities_are_detected(self):
+        experiments = CapableExperimentRepository()
+        data = CapablePluginDataRepository()
+        users = CapableUserRepository()
+        assert isinstance(experiments, ExperimentRepository)
+        assert isinstance(experiments, ExperimentBatchRepository)
+        assert isinstance(experiments, ExperimentKeysetRepository)
+        assert isinstance(data, PluginDataRepository)
+        assert isinstance(data, AnalysisResultBatchRepository)
+        assert isinstance(data, PluginDataPatchRepository)
+        assert isinstance(users, UserRepository)
+        assert isinstance(users, UserBatchRepository)
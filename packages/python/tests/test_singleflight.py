@@ -0,0 +1,121 @@
+import asyncio
+
+import pytest
+
+from mld_sdk.singleflight import SingleFlight, single_flight
+
+
+class CountingRepository:
+    def __init__(self):
+        self.calls = []
+        self.release = asyncio.Event()
+
+    @single_flight
+    async def get_experiment_data(self, experiment_id, plugin_id=None):
+        self.calls.append((experiment_id, plugin_id))
+        await self.release.wait()
+        return {"experiment_id": experiment_id}
+
+
+class TestSingleFlight:
+    @pytest.mark.asyncio
+    async def test_concurrent_identical_calls_coalesce(self):
+        repo = CountingRepository()
+        tasks = [asyncio.ensure_future(repo.get_experiment_data(1)) for _ in range(20)]
+        await asyncio.sleep(0)
+        repo.release.set()
+        results = await asyncio.gather(*tasks)
+        assert repo.calls == [(1, None)]
+        assert all(r is results[0] for r in results)
+
+    @pytest.mark.asyncio
+    async def test_different_arguments_run_separately(self):
+        repo = CountingRepository()
+        repo.release.set()
+        await asyncio.gather(
+            repo.get_experiment_data(1),
+            repo.get_experiment_data(2),
+            repo.get_experiment_data(1, plugin_id="p"),
+        )
+        assert set(repo.calls) == {(1, None), (1, "p"), (2, None)}
+
+    @pytest.mark.asyncio
+    async def test_instances_are_separate_keys(self):
+        a, b = CountingRepository(), CountingRepository()
+        a.release.set()
+        b.release.set()
+        await asyncio.gather(a.get_experiment_data(1), b.get_experiment_data(1))
+        assert a.calls == b.calls == [(1, None)]
+
+    @pytest.mark.asyncio
+    async def test_results_are_not_cached(self):
+        repo = CountingRepository()
+        repo.release.set()
+        await repo.get_experiment_data(1)
+        await repo.get_experiment_data(1)
+        assert len(repo.calls) == 2
+        assert len(CountingRepository.get_experiment_data.single_flight) == 0
+
+    @pytest.mark.asyncio
+    async def test_exception_shared_then_forgotten(self):
+        calls = []
+
+        @single_flight
+        async def fail(x):
+            calls.append(x)
+            await asyncio.sleep(0)
+            raise ValueError("boom")
+
+        results = await asyncio.gather(fail(1), fail(1), return_exceptions=True)
+        assert all(isinstance(r, ValueError) for r in results)
+        assert calls == [1]
+        with pytest.raises(ValueError):
+            await fail(1)
+        assert calls == [1, 1]
+
+    @pytest.mark.asyncio
+    async def test_cancelled_caller_does_not_cancel_others(self):
+        repo = CountingRepository()
+        first = asyncio.ensure_future(repo.get_experiment_data(1))
+        second = asyncio.ensure_future(repo.get_experiment_data(1))
+        await asyncio.sleep(0)
+        first.cancel()
+        repo.release.set()
+        assert await second == {"experiment_id": 1}
+        assert first.cancelled()
+
+    @pytest.mark.asyncio
+    async def test_unhashable_arguments_bypass(self):
+        calls = []
+
+        @single_flight
+        async def fetch(ids):
+            calls.append(ids)
+            return len(ids)
+
+        assert await asyncio.gather(fetch([1]), fetch([1])) == [1, 1]
+        assert len(calls) == 2
+
+    @pytest.mark.asyncio
+    async def test_custom_key(self):
+        calls = []
+
+        @single_flight(key=lambda ids: frozenset(ids))
+        async def fetch(ids):
+            calls.append(ids)
+            await asyncio.sleep(0)
+            return sorted(ids)
+
+        await asyncio.gather(fetch([1, 2]), fetch([2, 1]))
+        assert len(calls) == 1
+
+    @pytest.mark.asyncio
+    async def test_group_do(self):
+        group = SingleFlight()
+
+        async def compute():
+            await asyncio.sleep(0)
+            return 42
+
+        assert await asyncio.gather(group.do("k", compute), group.do("k", compute)) == [42, 42]
+        assert len(group) == 0